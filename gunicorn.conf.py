@@ -1,12 +1,25 @@
 # Gunicorn configuration file for AggieRMP API
 
+from uvicorn.workers import UvicornWorker
+
+
+class UvloopWorker(UvicornWorker):
+    """Uvicorn worker pinned to the uvloop event loop and httptools parser.
+
+    The stock worker uses "auto", which silently falls back to asyncio and
+    h11 if either package is missing; pinning makes that a startup error.
+    """
+
+    CONFIG_KWARGS = {"loop": "uvloop", "http": "httptools"}
+
+
 # Server socket
 bind = "0.0.0.0:8000"
 backlog = 2048
 
 # Worker processes
 workers = 4  # Adjust based on CPU cores (2 * cores + 1)
-worker_class = "uvicorn.workers.UvicornWorker"
+worker_class = UvloopWorker
 worker_connections = 1000
 max_requests = 1000
 max_requests_jitter = 50
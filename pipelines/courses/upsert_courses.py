@@ -55,7 +55,12 @@ get_courses_from_department = course_catalog_scraping.get_courses_from_departmen
 
 from dotenv import load_dotenv
 
-from aggiermp.database.base import create_db_engine, get_session
+from aggiermp.database.base import (
+    create_db_engine,
+    get_session,
+    migrate_database,
+    refresh_course_aggregates_view,
+)
 from pipelines.courses.schemas import CourseSchema, DepartmentSchema
 
 load_dotenv()
@@ -586,6 +591,7 @@ def main() -> None:
     # Create tables if they don't exist (proper upsert - don't drop existing data)
     print("\n1. Creating/verifying tables (if they don't exist)...")
     create_new_tables()
+    migrate_database()
 
     # Get all departments
     print("\n2. Scraping all departments...")
@@ -635,6 +641,14 @@ def main() -> None:
     print("\n7. PHASE 3: Bulk upserting all courses...")
     total_courses = bulk_upsert_courses(all_courses, batch_size=1000)
 
+    # Refresh pre-aggregated course stats used by the API
+    print("\n8. Refreshing course stats view...")
+    session = get_session()
+    try:
+        refresh_course_aggregates_view(session)
+    finally:
+        session.close()
+
     # Final summary
     end_time = time.time()
     duration = end_time - start_time
@@ -20,7 +20,13 @@ from dotenv import load_dotenv
 from sqlalchemy import text
 from sqlalchemy.dialects.postgresql import insert
 
-from aggiermp.database.base import GpaDataDB, get_session
+from aggiermp.database.base import (
+    GpaDataDB,
+    get_session,
+    migrate_database,
+    refresh_course_aggregates_view,
+    refresh_department_stats_views,
+)
 from pipelines.gpa.anex_scraping import (
     MAX_CONCURRENT_REQUESTS,
     extract_class_records,
@@ -232,6 +238,9 @@ async def main_async() -> None:
     print(f"[INFO] Bulk insert size: {BULK_INSERT_SIZE} records")
     print("=" * 60)
 
+    # Bring the schema and stats views up to date before writing
+    migrate_database()
+
     # Step 1: Get newest semester from anex.us
     print("\n[STEP 1] Fetching newest semester from anex.us...")
     import aiohttp
@@ -343,6 +352,15 @@ async def main_async() -> None:
     if total_inserted > 0:
         print(f"\n[OK] SUCCESS! {total_inserted} GPA records added to database!")
 
+        # Refresh pre-aggregated department and course stats used by the API
+        print("[INFO] Refreshing department and course stats views...")
+        session = get_session()
+        try:
+            refresh_department_stats_views(session)
+            refresh_course_aggregates_view(session)
+        finally:
+            session.close()
+
 
 def main() -> None:
     """Main function wrapper"""
@@ -72,7 +72,7 @@ class CourseNormalizer:
             # Get all courses with their canonical codes
             query = text("""
                 SELECT 
-                    subject_id || course_number as canonical_code,
+                    course_code as canonical_code,
                     cross_listings
                 FROM courses
                 WHERE cross_listings IS NOT NULL 
@@ -104,7 +104,7 @@ class CourseNormalizer:
 
             # Also map all courses to themselves (in case they're not in cross-listings)
             all_courses_query = text("""
-                SELECT DISTINCT subject_id || course_number as canonical_code
+                SELECT DISTINCT course_code as canonical_code
                 FROM courses
             """)
             all_courses = session.execute(all_courses_query)
@@ -10,6 +10,7 @@ This script:
 Optimized for processing thousands of professors efficiently.
 """
 
+import asyncio
 import json
 import os
 import sys
@@ -22,12 +23,22 @@ project_root = Path(__file__).parent.parent.parent
 if str(project_root) not in sys.path:
     sys.path.insert(0, str(project_root))
 
-from aggiermp.database.base import ProfessorDB, ReviewDB, get_session, upsert_reviews
+from aggiermp.database.base import (
+    ProfessorDB,
+    ReviewDB,
+    get_session,
+    migrate_database,
+    refresh_course_aggregates_view,
+    refresh_department_stats_views,
+    refresh_professor_profile_view,
+    upsert_reviews,
+)
 from pipelines.professors.scrapers import RMPReviewCollector
 from pipelines.professors.hierarchical_summarization import (
     HierarchicalSummarizationPipeline,
 )
 from pipelines.professors.upsert import upsert_professor_summary
+from aggiermp.core.cache import close_redis, invalidate_professor_cache
 
 # Checkpoint file for resume functionality
 CHECKPOINT_FILE = Path(__file__).parent / ".review_summary_checkpoint.json"
@@ -93,6 +104,14 @@ def batch_upsert_reviews(session: Any, reviews_batch: List[Any]) -> None:
     upsert_reviews(session, reviews_batch)
 
 
+async def invalidate_api_cache(professor_ids: Set[str]) -> int:
+    """Drop cached API responses for professors whose data changed"""
+    try:
+        return await invalidate_professor_cache(professor_ids)
+    finally:
+        await close_redis()
+
+
 def upsert_reviews_and_summaries(
     professor_ids: List[str] | None = None,
     session: Any = None,
@@ -119,6 +138,9 @@ def upsert_reviews_and_summaries(
     Returns:
         Dictionary with results
     """
+    # Bring the schema and stats views up to date before writing
+    migrate_database()
+
     close_session = False
     if session is None:
         session = get_session()
@@ -157,6 +179,7 @@ def upsert_reviews_and_summaries(
             "professors_skipped": 0,
             "errors": [],
         }
+        updated_professors: Set[str] = set()
 
         # Pre-fetch existing review IDs for all professors (batch database query)
         print("Loading existing review IDs...")
@@ -208,6 +231,7 @@ def upsert_reviews_and_summaries(
                 batch_upsert_reviews(session, all_new_reviews)
                 session.commit()  # Commit reviews batch
                 results["reviews_added"] += len(all_new_reviews)
+                updated_professors.update(new_reviews_dict)
 
                 # Update existing review IDs for next batch
                 for review in all_new_reviews:
@@ -313,6 +337,7 @@ def upsert_reviews_and_summaries(
                     success = upsert_professor_summary(professor_summary, session)
 
                     if success:
+                        updated_professors.add(professor_id)
                         results["summaries_generated"] += 1
                         results["professors_processed"] += 1
                         processed_professors.add(professor_id)
@@ -351,6 +376,18 @@ def upsert_reviews_and_summaries(
             print("Processing complete. Clearing checkpoint.")
             clear_checkpoint()
 
+        # Refresh pre-aggregated professor stats used by the API
+        if results["reviews_added"] or results["summaries_generated"]:
+            print("Refreshing mv_professor_profile...")
+            refresh_professor_profile_view(session)
+            print("Refreshing department and course stats views...")
+            refresh_department_stats_views(session)
+            refresh_course_aggregates_view(session)
+
+        if updated_professors:
+            deleted = asyncio.run(invalidate_api_cache(updated_professors))
+            print(f"Invalidated {deleted} cached API responses")
+
         # Print summary
         print(
             f"\nComplete: {results['professors_processed']} processed, "
@@ -41,7 +41,12 @@ from pipelines.sections.upsert import (
     upsert_sections,
     upsert_section_details,
 )
-from aggiermp.database.base import get_session
+from aggiermp.database.base import (
+    get_session,
+    migrate_database,
+    refresh_course_aggregates_view,
+    refresh_department_stats_views,
+)
 
 
 def run_full_pipeline(
@@ -80,6 +85,8 @@ def run_full_pipeline(
         "errors": [],
     }
 
+    # Bring the schema and stats views up to date before writing
+    migrate_database()
     session = get_session()
 
     try:
@@ -210,6 +217,12 @@ def run_full_pipeline(
                     f"  ⏱️  API fetch: {fetch_time:.1f}s | DB upsert: {upsert_time:.1f}s"
                 )
 
+        # Refresh pre-aggregated department and course stats used by the API
+        if results["sections_upserted"]:
+            print("\nRefreshing department and course stats views...")
+            refresh_department_stats_views(session)
+            refresh_course_aggregates_view(session)
+
         # Done
         elapsed = time.time() - start_time
         results["elapsed_seconds"] = elapsed
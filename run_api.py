@@ -13,6 +13,14 @@ import uvicorn
 src_path = Path(__file__).parent / "src"
 sys.path.insert(0, str(src_path))
 
+# uvloop has no Windows build; let uvicorn pick asyncio there
+try:
+    import uvloop  # noqa: F401
+
+    LOOP = "uvloop"
+except ImportError:
+    LOOP = "auto"
+
 
 def main() -> None:
     """Run the FastAPI server"""
@@ -27,6 +35,8 @@ def main() -> None:
         port=8000,
         reload=True,
         log_level="info",
+        loop=LOOP,
+        http="httptools",
     )
 
 
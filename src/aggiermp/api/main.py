@@ -1,38 +1,89 @@
 """
 FastAPI application for AggieSBP API
 Provides endpoints for departments, courses, and course details with aggregated data
+
+Serve with uvicorn on the uvloop event loop and httptools parser (the
+gunicorn.conf.py worker and run_api.py both pin them), e.g.
+``uvicorn aggiermp.api.main:app --loop uvloop --http httptools``.
 """
 
 import asyncio
-import ast
+import base64
 import json
 import logging
+import queue
+import re
+import sys
 import time
-from typing import Any, Dict, List, Optional, Tuple, cast, Iterator
+from collections import defaultdict
+from dataclasses import dataclass
+from logging.handlers import QueueHandler, QueueListener
+from typing import (
+    Any,
+    AsyncIterator,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Literal,
+    Optional,
+    Sequence,
+    Tuple,
+    Union,
+)
 
+import orjson
 from fastapi import Depends, FastAPI, HTTPException, Query, Request
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import FileResponse, HTMLResponse, JSONResponse
+from fastapi.responses import (
+    FileResponse,
+    HTMLResponse,
+    ORJSONResponse,
+    Response,
+    StreamingResponse,
+)
 from pydantic import BaseModel
-from slowapi import Limiter, _rate_limit_exceeded_handler
-from slowapi.errors import RateLimitExceeded
-from slowapi.util import get_remote_address
-from sqlalchemy import text
-from sqlalchemy.orm import Session
-from starlette.middleware.base import BaseHTTPMiddleware
+from sqlalchemy import TextClause, text
+from sqlalchemy.ext.asyncio import AsyncSession
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
 from fastapi.middleware.gzip import GZipMiddleware
 
-from ..database.base import check_database_health, get_session
+if sys.version_info >= (3, 11):
+    from asyncio import timeout as request_timeout
+else:
+    from async_timeout import timeout as request_timeout
+
+from ..database.base import (
+    check_database_health,
+    dispose_async_engine,
+    get_async_session,
+    get_session,
+    migrate_database,
+)
 from ..core.cache import (
     get_redis,
     close_redis,
     cached,
+    local_cached,
     get_cache_stats,
+    get_cached_many,
+    set_cached_many,
     clear_all_cache,
+    TTL_SHORT,
+    TTL_STANDARD,
     TTL_LONG,
     TTL_15MIN,
     TTL_WEEK,
 )
+from ..core.rate_limit import TokenBucketLimiter
+from .queries import (
+    PROFESSOR_EXISTS_SQL,
+    PROFESSOR_PROFILES_SQL,
+    SECTION_CHILDREN_SQL,
+    SECTIONS_BY_COURSE_SQL,
+    build_professor_reviews_query,
+    build_professor_search_query,
+)
 from .routers.discover import router as discover_router
 from .routers.users import router as users_router
 from ..core.config import settings
@@ -92,72 +143,71 @@ init(
 )
 
 # Rate limiter configuration
-limiter = Limiter(key_func=get_remote_address)
+limiter = TokenBucketLimiter()
 
 # Request timeout in seconds
 REQUEST_TIMEOUT_SECONDS = 30
 
+# Upper bound on rows returned by paginated review listings
+MAX_REVIEWS_PAGE_SIZE = 200
 
-class TimeoutMiddleware(BaseHTTPMiddleware):
-    """Middleware to enforce request timeout"""
 
-    def __init__(self, app: Any, timeout: int = REQUEST_TIMEOUT_SECONDS):
-        super().__init__(app)
+class TimeoutMiddleware:
+    """Pure ASGI middleware to enforce request timeout"""
+
+    def __init__(self, app: ASGIApp, timeout: int = REQUEST_TIMEOUT_SECONDS):
+        self.app = app
         self.timeout = timeout
+        self._timeout_body = orjson.dumps(
+            {
+                "error": "Gateway Timeout",
+                "message": f"Request timed out after {timeout} seconds",
+                "detail": "The server took too long to process this request. Please try again or simplify your query.",
+            }
+        )
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        response_started = False
 
-    async def dispatch(self, request: Request, call_next: Any) -> Any:
+        async def send_wrapper(message: Message) -> None:
+            nonlocal response_started
+            if message["type"] == "http.response.start":
+                response_started = True
+            await send(message)
+
+        # A timeout context cancels the request in place instead of wrapping
+        # it in a separate Task the way asyncio.wait_for does
         try:
-            return await asyncio.wait_for(call_next(request), timeout=self.timeout)
+            async with request_timeout(self.timeout):
+                await self.app(scope, receive, send_wrapper)
         except asyncio.TimeoutError:
-            return JSONResponse(
-                status_code=504,
-                content={
-                    "error": "Gateway Timeout",
-                    "message": f"Request timed out after {self.timeout} seconds",
-                    "detail": "The server took too long to process this request. Please try again or simplify your query.",
-                },
+            if response_started:
+                # Headers are already out; let the server drop the connection
+                raise
+            await send(
+                {
+                    "type": "http.response.start",
+                    "status": 504,
+                    "headers": [
+                        (b"content-type", b"application/json"),
+                        (b"content-length", str(len(self._timeout_body)).encode()),
+                    ],
+                }
             )
+            await send({"type": "http.response.body", "body": self._timeout_body})
 
 
-def parse_tag_frequencies(
-    tag_frequencies_str: Any, professor_id: Optional[str] = None
-) -> Dict[str, Any]:
-    """
-    Helper function to parse tag_frequencies from various formats
-    """
-    if not tag_frequencies_str:
-        return {}
-
-    try:
-        if isinstance(tag_frequencies_str, str):
-            # Try to parse as JSON first
-            try:
-                return cast(Dict[str, Any], json.loads(tag_frequencies_str))
-            except json.JSONDecodeError:
-                # If JSON parsing fails, try to fix common issues (single quotes to double quotes)
-                fixed_json = tag_frequencies_str.replace("'", '"')
-                try:
-                    return cast(Dict[str, Any], json.loads(fixed_json))
-                except json.JSONDecodeError:
-                    # If still fails, try using ast.literal_eval for Python dict format
-                    try:
-                        return cast(
-                            Dict[str, Any], ast.literal_eval(tag_frequencies_str)
-                        )
-                    except (ValueError, SyntaxError):
-                        if professor_id:
-                            logger.warning(
-                                f"Failed to parse tag_frequencies for professor {professor_id}: {tag_frequencies_str[:100]}"
-                            )
-                        return {}
-        else:
-            return cast(Dict[str, Any], tag_frequencies_str)
-    except Exception as e:
-        if professor_id:
-            logger.warning(
-                f"Failed to parse tag_frequencies for professor {professor_id}: {str(e)}"
-            )
-        return {}
+# Course codes as used in paths: "CSCE121", "MATH151", "ENGR102H"
+_COURSE_CODE_RE = re.compile(r"^([A-Z]+)(\d+[A-Z]?)$")
+# Course ids without a letter suffix: "CSCE121"
+_COURSE_ID_RE = re.compile(r"^([A-Z]+)(\d+)$")
+_DEPT_PREFIX_RE = re.compile(r"^([A-Z]+)")
+_NON_LOWER_ALPHA_RE = re.compile(r"[^a-z]")
+_NAME_SEPARATOR_RE = re.compile(r"[ ,]+")
 
 
 # Pydantic models for request and response bodies
@@ -248,6 +298,32 @@ class Review(BaseModel):
     tags: List[str]
 
 
+@dataclass(slots=True)
+class ProfessorReview:
+    """Row of the professor reviews listing (slotted to keep per-row cost low)"""
+
+    id: str
+    course_code: Optional[str]
+    course_name: str
+    department_name: Optional[str]
+    review_text: Optional[str]
+    overall_rating: float
+    clarity_rating: Optional[float]
+    difficulty_rating: Optional[float]
+    helpful_rating: Optional[float]
+    would_take_again: Optional[bool]
+    attendance_mandatory: Optional[str]
+    is_online_class: Optional[bool]
+    is_for_credit: Optional[bool]
+    grade: Optional[str]
+    review_date: Optional[str]
+    textbook_use: Optional[int]
+    thumbs_up: int
+    thumbs_down: int
+    tags: List[str]
+    teacher_note: Optional[str]
+
+
 class HealthCheck(BaseModel):
     """Health check response model"""
 
@@ -260,6 +336,48 @@ class HealthCheck(BaseModel):
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+# Loggers whose handlers are moved behind a queue at startup (root and
+# uvicorn's own, which don't propagate)
+QUEUED_LOGGERS = ("", "uvicorn.error", "uvicorn.access")
+_log_listeners: List[Tuple[logging.Logger, QueueListener]] = []
+
+
+def start_log_listeners() -> None:
+    """
+    Write log records from a background thread.
+
+    Each queued logger's handlers are swapped for a QueueHandler, so a
+    logging call on the event loop only enqueues the record and a
+    QueueListener thread does the formatting and stream writes.
+    """
+    if _log_listeners:
+        return
+    for name in QUEUED_LOGGERS:
+        target = logging.getLogger(name)
+        handlers = [h for h in target.handlers if not isinstance(h, QueueHandler)]
+        if not handlers:
+            continue
+        log_queue: "queue.SimpleQueue[logging.LogRecord]" = queue.SimpleQueue()
+        for handler in handlers:
+            target.removeHandler(handler)
+        target.addHandler(QueueHandler(log_queue))
+        listener = QueueListener(log_queue, *handlers, respect_handler_level=True)
+        listener.start()
+        _log_listeners.append((target, listener))
+
+
+def stop_log_listeners() -> None:
+    """Flush queued records and restore the original handlers."""
+    while _log_listeners:
+        target, listener = _log_listeners.pop()
+        listener.stop()
+        for handler in list(target.handlers):
+            if isinstance(handler, QueueHandler):
+                target.removeHandler(handler)
+        for handler in listener.handlers:
+            target.addHandler(handler)
+
+
 app = FastAPI(
     title="AggieSBP API",
     description="**Texas A&M University Course and Professor Rating API**<br>This API provides comprehensive data about Texas A&M University courses, professors, and student ratings.<br><br>**Features:**<br>- **Departments**: Browse and search university departments<br>- **Courses**: Detailed course information with GPA data and ratings<br>- **Professors**: Professor profiles with reviews and ratings<br>- **Reviews**: Student reviews and ratings for courses and professors- **Comparisons**: Compare multiple courses side by side<br><br>**Data Sources:**<br>- Rate My Professor reviews and ratings<br>- Official university GPA data<br>- Course enrollment statistics<br><br>All endpoints support filtering, pagination, and detailed search capabilities.<br>",
@@ -282,12 +400,9 @@ app = FastAPI(
     ],
     docs_url=None,  # Disable default Swagger UI
     redoc_url="/redoc",  # Keep ReDoc available
+    default_response_class=ORJSONResponse,
 )
 
-# Configure rate limiter
-app.state.limiter = limiter
-app.add_exception_handler(RateLimitExceeded, _rate_limit_exceeded_handler)  # type: ignore
-
 # Add timeout middleware (must be added before other middleware)
 app.add_middleware(TimeoutMiddleware, timeout=REQUEST_TIMEOUT_SECONDS)
 
@@ -358,6 +473,76 @@ def _normalize_days_of_week(value: Any) -> list[str]:
     return out
 
 
+async def fetch_section_children(db: AsyncSession, section_ids: List[str]) -> List[Any]:
+    """
+    Fetch instructors and meetings for a batch of sections in one query.
+
+    Postgres groups the child rows into per-section JSON arrays and returns
+    one (section_id, instructors, meetings) row per id, in section_ids order.
+    """
+    result = await db.execute(SECTION_CHILDREN_SQL, {"section_ids": section_ids})
+    return list(result.fetchall())
+
+
+def _normalize_meetings(meetings: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    """Normalize daysOfWeek in meeting objects built by the section queries"""
+    for meeting in meetings:
+        meeting["daysOfWeek"] = _normalize_days_of_week(meeting["daysOfWeek"])
+    return meetings
+
+
+# Response keys for the sections columns, in the order every section query
+# selects them (s.id through s.attributes_text)
+SECTION_KEYS = (
+    "id",
+    "termCode",
+    "crn",
+    "dept",
+    "deptDesc",
+    "courseNumber",
+    "sectionNumber",
+    "courseTitle",
+    "creditHours",
+    "hoursLow",
+    "hoursHigh",
+    "campus",
+    "partOfTerm",
+    "sessionType",
+    "scheduleType",
+    "instructionType",
+    "isOpen",
+    "hasSyllabus",
+    "syllabusUrl",
+    "attributesText",
+)
+
+
+def format_section(
+    row: Any,
+    instructors: List[Dict[str, Any]],
+    meetings: List[Dict[str, Any]],
+) -> Dict[str, Any]:
+    """Shape a sections row and its instructors/meetings for the API"""
+    # zip stops at the last section column, ignoring any trailing ones
+    section = dict(zip(SECTION_KEYS, row))
+    section["instructors"] = instructors
+    section["meetings"] = meetings
+    return section
+
+
+def format_sections(
+    section_rows: Sequence[Any], children_rows: Iterable[Any]
+) -> List[Dict[str, Any]]:
+    """
+    Shape sections rows with their SECTION_CHILDREN_SQL rows, which come back
+    in the same order, so each section pairs with its children positionally.
+    """
+    return [
+        format_section(row, instructors or [], _normalize_meetings(meetings or []))
+        for row, (_, instructors, meetings) in zip(section_rows, children_rows)
+    ]
+
+
 _cors_origins = _build_cors_origins()
 _cors_kwargs = dict(
     allow_origins=_cors_origins,
@@ -378,14 +563,18 @@ else:
 
 app.add_middleware(CORSMiddleware, **_cors_kwargs)
 
-# Add GZip middleware
-app.add_middleware(GZipMiddleware, minimum_size=1000)
+# Add GZip middleware (outermost, so it also covers CORS/error responses).
+# Level 5 gets nearly level 9's ratio on JSON for a fraction of the CPU.
+app.add_middleware(GZipMiddleware, minimum_size=1000, compresslevel=5)
 
 
 # Redis lifecycle events
 @app.on_event("startup")
 async def startup_event() -> None:
-    """Initialize Redis connection on startup."""
+    """Move logging off the event loop, migrate the schema and connect Redis."""
+    start_log_listeners()
+    # The endpoints only use the async engine, which never runs create_all()
+    await asyncio.to_thread(migrate_database)
     redis_client = await get_redis()
     if redis_client:
         logger.info("Redis cache connected")
@@ -398,19 +587,50 @@ async def shutdown_event() -> None:
     """Close Redis connection on shutdown."""
     await close_redis()
     logger.info("Redis cache disconnected")
+    await dispose_async_engine()
+    stop_log_listeners()
 
 
-def get_db_session() -> Iterator[Session]:
-    """Dependency to get database session with performance monitoring"""
-    start_time = time.time()
-    session = get_session()
-    try:
+async def get_async_db_session() -> AsyncIterator[AsyncSession]:
+    """Dependency to get an async database session (awaits queries off the event loop)"""
+    async with get_async_session() as session:
         yield session
-        session_time = time.time() - start_time
-        if session_time > 0.5:  # Log slow session creation
-            logger.warning(f"Slow session creation: {session_time:.3f}s")
-    finally:
-        session.close()
+
+
+# In-process course lookup keyed by course code (e.g. "CSCE121"), used in
+# place of joining courses on the hot professor paths.
+COURSE_LOOKUP_TTL_SECONDS = 3600
+COURSE_LOOKUP_SQL = text("""
+    SELECT 
+        c.course_code as code,
+        c.name,
+        c.subject_long_name
+    FROM courses c
+""")
+_course_lookup: Dict[str, Tuple[Optional[str], Optional[str]]] = {}
+_course_lookup_loaded_at = 0.0
+
+
+async def get_course_lookup(
+    db: AsyncSession,
+) -> Dict[str, Tuple[Optional[str], Optional[str]]]:
+    """Return {course_code: (course_name, department_name)}, reloading after the TTL"""
+    global _course_lookup, _course_lookup_loaded_at
+
+    if (
+        _course_lookup
+        and time.monotonic() - _course_lookup_loaded_at < COURSE_LOOKUP_TTL_SECONDS
+    ):
+        return _course_lookup
+
+    rows = await db.execute(COURSE_LOOKUP_SQL)
+    _course_lookup = {row.code: (row.name, row.subject_long_name) for row in rows}
+    _course_lookup_loaded_at = time.monotonic()
+    logger.info(f"Loaded {len(_course_lookup)} courses into lookup cache")
+    return _course_lookup
+
+
+WELCOME_BODY = orjson.dumps({"message": "Welcome to AggieSBP API"})
 
 
 @app.get(
@@ -428,13 +648,13 @@ def get_db_session() -> Iterator[Session]:
     summary="/",
     description="API root endpoint. Returns welcome message.",
 )
-async def root() -> Dict[str, str]:
+async def root() -> Response:
     """
     Root endpoint - API welcome message
 
     Returns a simple welcome message to confirm the API is running.
     """
-    return {"message": "Welcome to AggieSBP API"}
+    return Response(content=WELCOME_BODY, media_type="application/json")
 
 
 @app.get(
@@ -555,15 +775,8 @@ async def database_status() -> Dict[str, Any]:
         )
 
 
-@app.get("/docs", include_in_schema=False)
-async def scalar_html() -> HTMLResponse:
-    """
-    Interactive API Documentation Portal
-
-    AggieSBP API documentation powered by Scalar. Provides comprehensive documentation
-    for the Texas A&M Rate My Professor API with live testing capabilities.
-    """
-    html_content = """
+# Static page, encoded once rather than on every request
+SCALAR_DOCS_HTML = """
     <!DOCTYPE html>
     <html>
     <head>
@@ -602,8 +815,33 @@ async def scalar_html() -> HTMLResponse:
         <script src="https://cdn.jsdelivr.net/npm/@scalar/api-reference@latest"></script>
     </body>
     </html>
+    """.encode("utf-8")
+
+
+@app.get("/docs", include_in_schema=False)
+async def scalar_html() -> HTMLResponse:
+    """
+    Interactive API Documentation Portal
+
+    AggieSBP API documentation powered by Scalar. Provides comprehensive documentation
+    for the Texas A&M Rate My Professor API with live testing capabilities.
     """
-    return HTMLResponse(content=html_content)
+    return HTMLResponse(content=SCALAR_DOCS_HTML)
+
+
+DATA_STATS_SQL = text("""
+    SELECT 
+        (SELECT COUNT(*) FROM reviews) as reviews_count,
+        c.courses_count,
+        c.last_updated,
+        (SELECT COUNT(*) FROM professors) as professors_count,
+        (SELECT COUNT(*) FROM gpa_data) as gpa_data_count,
+        (SELECT COUNT(*) FROM sections) as sections_count
+    FROM (
+        SELECT COUNT(*) as courses_count, MAX(updated_at) as last_updated
+        FROM courses
+    ) c
+""")
 
 
 @app.get(
@@ -627,49 +865,32 @@ async def scalar_html() -> HTMLResponse:
     },
     summary="/data_stats",
     description="Returns statistics about the data",
+    response_model=None,
 )
 @limiter.limit("30/minute")
+@local_cached(ttl=TTL_SHORT, max_age=60)  # per-worker copy in front of Redis
 @cached(ttl=TTL_WEEK)  # 1 week cache
 async def get_data_stats(
-    request: Request, db: Session = Depends(get_db_session)
+    request: Request, db: AsyncSession = Depends(get_async_db_session)
 ) -> Dict[str, Any]:
     """
     Returns simple database statistics.
     """
     try:
-        # Individual counts for each table and last updated review
-        counts = {}
-
-        # Reviews count & last updated
-        review_row = db.execute(text("SELECT COUNT(*) AS cnt FROM reviews")).fetchone()
-        counts["reviews_count"] = review_row.cnt if review_row else 0
-
-        # Courses count
-        courses_row = db.execute(
-            text("SELECT COUNT(*) AS cnt, MAX(updated_at) AS last_updated FROM courses")
-        ).fetchone()
-        counts["courses_count"] = courses_row.cnt if courses_row else 0
-        counts["last_updated"] = (
-            courses_row.last_updated.strftime("%m/%d/%Y")
-            if courses_row and courses_row.last_updated
-            else None
-        )
-
-        # Professors count
-        professors_row = db.execute(
-            text("SELECT COUNT(*) AS cnt FROM professors")
-        ).fetchone()
-        counts["professors_count"] = professors_row.cnt if professors_row else 0
-
-        # GPA data count
-        gpa_row = db.execute(text("SELECT COUNT(*) AS cnt FROM gpa_data")).fetchone()
-        counts["gpa_data_count"] = gpa_row.cnt if gpa_row else 0
-
-        # Sections count
-        sections_row = db.execute(
-            text("SELECT COUNT(*) AS cnt FROM sections")
-        ).fetchone()
-        counts["sections_count"] = sections_row.cnt if sections_row else 0
+        # All counts in a single round-trip
+        row = (await db.execute(DATA_STATS_SQL)).one()
+
+        updated = row.last_updated
+        counts = {
+            "reviews_count": row.reviews_count,
+            "courses_count": row.courses_count,
+            "last_updated": f"{updated.month:02d}/{updated.day:02d}/{updated.year}"
+            if updated
+            else None,
+            "professors_count": row.professors_count,
+            "gpa_data_count": row.gpa_data_count,
+            "sections_count": row.sections_count,
+        }
 
         return counts
 
@@ -678,6 +899,19 @@ async def get_data_stats(
         raise HTTPException(status_code=500, detail=f"Database error: {str(e)}")
 
 
+TERMS_SQL = text("""
+    SELECT 
+        term_code,
+        term_desc,
+        start_date,
+        end_date,
+        academic_year
+    FROM terms
+    WHERE end_date > NOW()
+    ORDER BY start_date ASC
+""")
+
+
 @app.get(
     "/terms",
     responses={
@@ -700,12 +934,14 @@ async def get_data_stats(
     },
     summary="/terms",
     description="Returns all terms with an end date after the current time, sorted by start date.",
+    response_model=None,
 )
 @limiter.limit("60/minute")
+@local_cached(ttl=TTL_SHORT, max_age=60)  # per-worker copy in front of Redis
 @cached(ttl=TTL_LONG)  # 24h cache - terms rarely change
 async def get_terms(
-    request: Request, db: Session = Depends(get_db_session)
-) -> List[Dict[str, Any]]:
+    request: Request, db: AsyncSession = Depends(get_async_db_session)
+) -> Union[List[Dict[str, Any]], ORJSONResponse]:
     """
     Get active and upcoming terms
 
@@ -713,19 +949,7 @@ async def get_terms(
     This includes currently active terms and future terms.
     """
     try:
-        query = text("""
-            SELECT 
-                term_code,
-                term_desc,
-                start_date,
-                end_date,
-                academic_year
-            FROM terms
-            WHERE end_date > NOW()
-            ORDER BY start_date ASC
-        """)
-
-        result = db.execute(query)
+        result = await db.execute(TERMS_SQL)
         terms = []
 
         for row in result:
@@ -733,19 +957,80 @@ async def get_terms(
                 {
                     "termCode": row.term_code,
                     "termDesc": row.term_desc,
-                    "startDate": row.start_date.isoformat() if row.start_date else None,
-                    "endDate": row.end_date.isoformat() if row.end_date else None,
+                    "startDate": row.start_date,
+                    "endDate": row.end_date,
                     "academicYear": row.academic_year,
                 }
             )
 
-        return terms
+        # orjson writes the datetimes as ISO 8601 strings itself
+        return ORJSONResponse(content=terms)
 
     except Exception as e:
         logger.error(f"Error in get_terms: {str(e)}")
         raise HTTPException(status_code=500, detail=f"Database error: {str(e)}")
 
 
+# Rows per server-side fetch (and per children query) when streaming sections
+SECTIONS_STREAM_CHUNK = 500
+
+
+def stream_sections(
+    sections_query: TextClause, params: Dict[str, Any]
+) -> Iterator[bytes]:
+    """Yield sections as one JSON array, a chunk of rows at a time"""
+    # Runs after the endpoint has returned, so it owns its own session
+    session = get_session()
+    try:
+        result = session.execute(
+            sections_query,
+            params,
+            execution_options={"yield_per": SECTIONS_STREAM_CHUNK},
+        )
+        yield b"["
+        separator = b""
+        for rows in result.partitions():
+            children = session.execute(
+                SECTION_CHILDREN_SQL, {"section_ids": [row.id for row in rows]}
+            )
+            yield separator + b",".join(
+                orjson.dumps(section) for section in format_sections(rows, children)
+            )
+            separator = b","
+        yield b"]"
+    finally:
+        session.close()
+
+
+# LIMIT NULL (limit=-1) returns every row
+SECTIONS_SQL = text("""
+    SELECT 
+        s.id,
+        s.term_code,
+        s.crn,
+        s.dept,
+        s.dept_desc,
+        s.course_number,
+        s.section_number,
+        s.course_title,
+        s.credit_hours,
+        s.hours_low,
+        s.hours_high,
+        s.campus,
+        s.part_of_term,
+        s.session_type,
+        s.schedule_type,
+        s.instruction_type,
+        s.is_open,
+        s.has_syllabus,
+        s.syllabus_url,
+        s.attributes_text
+    FROM sections s
+    ORDER BY s.term_code DESC, s.dept, s.course_number, s.section_number
+    LIMIT :limit OFFSET :skip
+""")
+
+
 @app.get(
     "/sections",
     responses={
@@ -786,6 +1071,7 @@ async def get_terms(
     },
     summary="/sections",
     description="Returns course sections with instructor and meeting data. Supports pagination with skip/limit. Use limit=-1 to get all sections.",
+    response_model=None,
 )
 @limiter.limit("30/minute")
 @cached(ttl=TTL_15MIN)  # 15 min cache
@@ -795,48 +1081,24 @@ async def get_sections(
         500, description="Number of sections to return. Use -1 for all sections."
     ),
     skip: int = Query(0, description="Number of sections to skip"),
-    db: Session = Depends(get_db_session),
-) -> List[Dict[str, Any]]:
+    db: AsyncSession = Depends(get_async_db_session),
+) -> Union[List[Dict[str, Any]], ORJSONResponse, StreamingResponse]:
     """
     Get all course sections with instructors and meetings
 
     Returns sections with joined instructor and meeting data.
     Supports pagination with skip and limit parameters.
-    Use limit=-1 to retrieve all sections (use with caution for large datasets).
+    Use limit=-1 to retrieve all sections; that response is streamed in
+    chunks rather than built in memory, and is not cached.
     """
     try:
-        # Build the query with optional limit
-        limit_clause = "" if limit == -1 else f"LIMIT {limit}"
-        offset_clause = f"OFFSET {skip}" if skip > 0 else ""
-
-        sections_query = text(f"""
-            SELECT 
-                s.id,
-                s.term_code,
-                s.crn,
-                s.dept,
-                s.dept_desc,
-                s.course_number,
-                s.section_number,
-                s.course_title,
-                s.credit_hours,
-                s.hours_low,
-                s.hours_high,
-                s.campus,
-                s.part_of_term,
-                s.session_type,
-                s.schedule_type,
-                s.instruction_type,
-                s.is_open,
-                s.has_syllabus,
-                s.syllabus_url,
-                s.attributes_text
-            FROM sections s
-            ORDER BY s.term_code DESC, s.dept, s.course_number, s.section_number
-            {limit_clause} {offset_clause}
-        """)
+        if limit == -1:
+            return StreamingResponse(
+                stream_sections(SECTIONS_SQL, {"limit": None, "skip": skip}),
+                media_type="application/json",
+            )
 
-        sections_result = db.execute(sections_query)
+        sections_result = await db.execute(SECTIONS_SQL, {"limit": limit, "skip": skip})
         section_rows = sections_result.fetchall()
 
         if not section_rows:
@@ -845,108 +1107,54 @@ async def get_sections(
         # Collect section IDs for batch fetching instructors and meetings
         section_ids = [row.id for row in section_rows]
 
-        # Batch fetch instructors
-        instructors_query = text("""
-            SELECT 
-                section_id,
-                instructor_name,
-                is_primary,
-                has_cv,
-                cv_url
-            FROM section_instructors
-            WHERE section_id = ANY(:section_ids)
-            ORDER BY section_id, is_primary DESC
-        """)
-        instructors_result = db.execute(instructors_query, {"section_ids": section_ids})
-
-        # Build instructor lookup
-        instructors_by_section: Dict[str, List[Dict[str, Any]]] = {}
-        for row in instructors_result:
-            if row.section_id not in instructors_by_section:
-                instructors_by_section[row.section_id] = []
-            instructors_by_section[row.section_id].append(
-                {
-                    "name": row.instructor_name,
-                    "isPrimary": row.is_primary,
-                    "hasCv": row.has_cv,
-                    "cvUrl": row.cv_url,
-                }
-            )
-
-        # Batch fetch meetings
-        meetings_query = text("""
-            SELECT 
-                section_id,
-                meeting_index,
-                days_of_week,
-                begin_time,
-                end_time,
-                start_date,
-                end_date,
-                building_code,
-                room_code,
-                meeting_type
-            FROM section_meetings
-            WHERE section_id = ANY(:section_ids)
-            ORDER BY section_id, meeting_index
-        """)
-        meetings_result = db.execute(meetings_query, {"section_ids": section_ids})
-
-        # Build meeting lookup
-        meetings_by_section: Dict[str, List[Dict[str, Any]]] = {}
-        for row in meetings_result:
-            if row.section_id not in meetings_by_section:
-                meetings_by_section[row.section_id] = []
-            meetings_by_section[row.section_id].append(
-                {
-                    "daysOfWeek": _normalize_days_of_week(row.days_of_week),
-                    "beginTime": row.begin_time,
-                    "endTime": row.end_time,
-                    "startDate": row.start_date,
-                    "endDate": row.end_date,
-                    "building": row.building_code,
-                    "room": row.room_code,
-                    "meetingType": row.meeting_type,
-                }
-            )
+        # Instructors and meetings for every section in one round-trip
+        children = await fetch_section_children(db, section_ids)
 
         # Build response
-        sections = []
-        for row in section_rows:
-            sections.append(
-                {
-                    "id": row.id,
-                    "termCode": row.term_code,
-                    "crn": row.crn,
-                    "dept": row.dept,
-                    "deptDesc": row.dept_desc,
-                    "courseNumber": row.course_number,
-                    "sectionNumber": row.section_number,
-                    "courseTitle": row.course_title,
-                    "creditHours": row.credit_hours,
-                    "hoursLow": row.hours_low,
-                    "hoursHigh": row.hours_high,
-                    "campus": row.campus,
-                    "partOfTerm": row.part_of_term,
-                    "sessionType": row.session_type,
-                    "scheduleType": row.schedule_type,
-                    "instructionType": row.instruction_type,
-                    "isOpen": row.is_open,
-                    "hasSyllabus": row.has_syllabus,
-                    "syllabusUrl": row.syllabus_url,
-                    "attributesText": row.attributes_text,
-                    "instructors": instructors_by_section.get(row.id, []),
-                    "meetings": meetings_by_section.get(row.id, []),
-                }
-            )
+        sections = format_sections(section_rows, children)
 
-        return sections
+        # Plain str/int/bool values only, so skip jsonable_encoder's walk
+        return ORJSONResponse(content=sections)
 
     except Exception as e:
         logger.error(f"Error in get_sections: {str(e)}")
         raise HTTPException(status_code=500, detail=f"Database error: {str(e)}")
 
 
+# LIMIT NULL (limit=-1) returns every row
+SECTIONS_BY_TERM_SQL = text("""
+    SELECT 
+        s.id,
+        s.term_code,
+        s.crn,
+        s.dept,
+        s.dept_desc,
+        s.course_number,
+        s.section_number,
+        s.course_title,
+        s.credit_hours,
+        s.hours_low,
+        s.hours_high,
+        s.campus,
+        s.part_of_term,
+        s.session_type,
+        s.schedule_type,
+        s.instruction_type,
+        s.is_open,
+        s.has_syllabus,
+        s.syllabus_url,
+        s.attributes_text
+    FROM sections s
+    WHERE s.term_code = :term_code
+    ORDER BY s.dept, s.course_number, s.section_number
+    LIMIT :limit OFFSET :skip
+""")
+
+TERM_HAS_SECTIONS_SQL = text("""
+    SELECT 1 FROM sections WHERE term_code = :term_code LIMIT 1
+""")
+
+
 @app.get(
     "/sections/{term_code}",
     responses={
@@ -980,7 +1188,8 @@ async def get_sections(
         },
     },
     summary="/sections/{term_code}",
-    description="Returns all sections for a specific term code (e.g., 202611 for Spring 2026 College Station). Supports pagination.",
+    description="Returns all sections for a specific term code (e.g., 202611 for Spring 2026 College Station). Supports pagination. Use limit=-1 to get all sections.",
+    response_model=None,
 )
 @limiter.limit("30/minute")
 @cached(ttl=TTL_15MIN)  # 15 min cache
@@ -991,49 +1200,39 @@ async def get_sections_by_term(
         500, description="Number of sections to return. Use -1 for all sections."
     ),
     skip: int = Query(0, description="Number of sections to skip"),
-    db: Session = Depends(get_db_session),
-) -> List[Dict[str, Any]]:
+    db: AsyncSession = Depends(get_async_db_session),
+) -> Union[List[Dict[str, Any]], ORJSONResponse, StreamingResponse]:
     """
     Get all sections for a specific term
 
     Returns sections for the specified term code with joined instructor and meeting data.
     Term codes follow the format: YYYYSS where YYYY is year and SS is semester code.
     Example: 202611 = Spring 2026 College Station
+    Use limit=-1 to retrieve the whole term; that response is streamed in
+    chunks rather than built in memory, and is not cached.
     """
     try:
-        # Build the query with optional limit
-        limit_clause = "" if limit == -1 else f"LIMIT {limit}"
-        offset_clause = f"OFFSET {skip}" if skip > 0 else ""
-
-        sections_query = text(f"""
-            SELECT 
-                s.id,
-                s.term_code,
-                s.crn,
-                s.dept,
-                s.dept_desc,
-                s.course_number,
-                s.section_number,
-                s.course_title,
-                s.credit_hours,
-                s.hours_low,
-                s.hours_high,
-                s.campus,
-                s.part_of_term,
-                s.session_type,
-                s.schedule_type,
-                s.instruction_type,
-                s.is_open,
-                s.has_syllabus,
-                s.syllabus_url,
-                s.attributes_text
-            FROM sections s
-            WHERE s.term_code = :term_code
-            ORDER BY s.dept, s.course_number, s.section_number
-            {limit_clause} {offset_clause}
-        """)
+        if limit == -1:
+            # Check up front, since a streamed response can no longer 404
+            term_result = await db.execute(
+                TERM_HAS_SECTIONS_SQL, {"term_code": term_code}
+            )
+            if term_result.scalar() is None:
+                raise HTTPException(
+                    status_code=404, detail=f"No sections found for term {term_code}"
+                )
+            return StreamingResponse(
+                stream_sections(
+                    SECTIONS_BY_TERM_SQL,
+                    {"term_code": term_code, "limit": None, "skip": skip},
+                ),
+                media_type="application/json",
+            )
 
-        sections_result = db.execute(sections_query, {"term_code": term_code})
+        sections_result = await db.execute(
+            SECTIONS_BY_TERM_SQL,
+            {"term_code": term_code, "limit": limit, "skip": skip},
+        )
         section_rows = sections_result.fetchall()
 
         if not section_rows:
@@ -1044,102 +1243,14 @@ async def get_sections_by_term(
         # Collect section IDs for batch fetching instructors and meetings
         section_ids = [row.id for row in section_rows]
 
-        # Batch fetch instructors
-        instructors_query = text("""
-            SELECT 
-                section_id,
-                instructor_name,
-                is_primary,
-                has_cv,
-                cv_url
-            FROM section_instructors
-            WHERE section_id = ANY(:section_ids)
-            ORDER BY section_id, is_primary DESC
-        """)
-        instructors_result = db.execute(instructors_query, {"section_ids": section_ids})
-
-        # Build instructor lookup
-        instructors_by_section: Dict[str, List[Dict[str, Any]]] = {}
-        for row in instructors_result:
-            if row.section_id not in instructors_by_section:
-                instructors_by_section[row.section_id] = []
-            instructors_by_section[row.section_id].append(
-                {
-                    "name": row.instructor_name,
-                    "isPrimary": row.is_primary,
-                    "hasCv": row.has_cv,
-                    "cvUrl": row.cv_url,
-                }
-            )
-
-        # Batch fetch meetings
-        meetings_query = text("""
-            SELECT 
-                section_id,
-                meeting_index,
-                days_of_week,
-                begin_time,
-                end_time,
-                start_date,
-                end_date,
-                building_code,
-                room_code,
-                meeting_type
-            FROM section_meetings
-            WHERE section_id = ANY(:section_ids)
-            ORDER BY section_id, meeting_index
-        """)
-        meetings_result = db.execute(meetings_query, {"section_ids": section_ids})
-
-        # Build meeting lookup
-        meetings_by_section: Dict[str, List[Dict[str, Any]]] = {}
-        for row in meetings_result:
-            if row.section_id not in meetings_by_section:
-                meetings_by_section[row.section_id] = []
-            meetings_by_section[row.section_id].append(
-                {
-                    "daysOfWeek": _normalize_days_of_week(row.days_of_week),
-                    "beginTime": row.begin_time,
-                    "endTime": row.end_time,
-                    "startDate": row.start_date,
-                    "endDate": row.end_date,
-                    "building": row.building_code,
-                    "room": row.room_code,
-                    "meetingType": row.meeting_type,
-                }
-            )
+        # Instructors and meetings for every section in one round-trip
+        children = await fetch_section_children(db, section_ids)
 
         # Build response
-        sections = []
-        for row in section_rows:
-            sections.append(
-                {
-                    "id": row.id,
-                    "termCode": row.term_code,
-                    "crn": row.crn,
-                    "dept": row.dept,
-                    "deptDesc": row.dept_desc,
-                    "courseNumber": row.course_number,
-                    "sectionNumber": row.section_number,
-                    "courseTitle": row.course_title,
-                    "creditHours": row.credit_hours,
-                    "hoursLow": row.hours_low,
-                    "hoursHigh": row.hours_high,
-                    "campus": row.campus,
-                    "partOfTerm": row.part_of_term,
-                    "sessionType": row.session_type,
-                    "scheduleType": row.schedule_type,
-                    "instructionType": row.instruction_type,
-                    "isOpen": row.is_open,
-                    "hasSyllabus": row.has_syllabus,
-                    "syllabusUrl": row.syllabus_url,
-                    "attributesText": row.attributes_text,
-                    "instructors": instructors_by_section.get(row.id, []),
-                    "meetings": meetings_by_section.get(row.id, []),
-                }
-            )
+        sections = format_sections(section_rows, children)
 
-        return sections
+        # Plain str/int/bool values only, so skip jsonable_encoder's walk
+        return ORJSONResponse(content=sections)
 
     except HTTPException:
         raise
@@ -1190,6 +1301,7 @@ async def get_sections_by_term(
     },
     summary="/sections/{term_code}/course/{course_code}",
     description="Returns all sections for a specific course in a specific term. Course code format: CSCE121, MATH151, etc.",
+    response_model=None,
 )
 @limiter.limit("60/minute")
 @cached(ttl=TTL_15MIN)  # 15 min cache
@@ -1197,8 +1309,8 @@ async def get_sections_by_term_and_course(
     request: Request,
     term_code: str,
     course_code: str,
-    db: Session = Depends(get_db_session),
-) -> List[Dict[str, Any]]:
+    db: AsyncSession = Depends(get_async_db_session),
+) -> Union[List[Dict[str, Any]], ORJSONResponse]:
     """
     Get all sections for a specific course in a specific term
 
@@ -1209,10 +1321,8 @@ async def get_sections_by_term_and_course(
     - `course_code`: Course code (e.g., CSCE121, MATH151, ACCT209)
     """
     try:
-        import re
-
         # Parse course_code (e.g., "CSCE121" -> dept="CSCE", course_num="121")
-        match = re.match(r"^([A-Z]+)(\d+[A-Z]?)$", course_code.upper())
+        match = _COURSE_CODE_RE.match(course_code.upper())
         if not match:
             raise HTTPException(
                 status_code=400,
@@ -1222,37 +1332,8 @@ async def get_sections_by_term_and_course(
         dept = match.group(1)
         course_number = match.group(2)
 
-        sections_query = text("""
-            SELECT 
-                s.id,
-                s.term_code,
-                s.crn,
-                s.dept,
-                s.dept_desc,
-                s.course_number,
-                s.section_number,
-                s.course_title,
-                s.credit_hours,
-                s.hours_low,
-                s.hours_high,
-                s.campus,
-                s.part_of_term,
-                s.session_type,
-                s.schedule_type,
-                s.instruction_type,
-                s.is_open,
-                s.has_syllabus,
-                s.syllabus_url,
-                s.attributes_text
-            FROM sections s
-            WHERE s.term_code = :term_code
-              AND s.dept = :dept
-              AND s.course_number = :course_number
-            ORDER BY s.section_number
-        """)
-
-        sections_result = db.execute(
-            sections_query,
+        sections_result = await db.execute(
+            SECTIONS_BY_COURSE_SQL,
             {"term_code": term_code, "dept": dept, "course_number": course_number},
         )
         section_rows = sections_result.fetchall()
@@ -1263,105 +1344,16 @@ async def get_sections_by_term_and_course(
                 detail=f"No sections found for {dept}{course_number} in term {term_code}",
             )
 
-        # Collect section IDs for batch fetching instructors and meetings
-        section_ids = [row.id for row in section_rows]
-
-        # Batch fetch instructors
-        instructors_query = text("""
-            SELECT 
-                section_id,
-                instructor_name,
-                is_primary,
-                has_cv,
-                cv_url
-            FROM section_instructors
-            WHERE section_id = ANY(:section_ids)
-            ORDER BY section_id, is_primary DESC
-        """)
-        instructors_result = db.execute(instructors_query, {"section_ids": section_ids})
-
-        # Build instructor lookup
-        instructors_by_section: Dict[str, List[Dict[str, Any]]] = {}
-        for row in instructors_result:
-            if row.section_id not in instructors_by_section:
-                instructors_by_section[row.section_id] = []
-            instructors_by_section[row.section_id].append(
-                {
-                    "name": row.instructor_name,
-                    "isPrimary": row.is_primary,
-                    "hasCv": row.has_cv,
-                    "cvUrl": row.cv_url,
-                }
-            )
-
-        # Batch fetch meetings
-        meetings_query = text("""
-            SELECT 
-                section_id,
-                meeting_index,
-                days_of_week,
-                begin_time,
-                end_time,
-                start_date,
-                end_date,
-                building_code,
-                room_code,
-                meeting_type
-            FROM section_meetings
-            WHERE section_id = ANY(:section_ids)
-            ORDER BY section_id, meeting_index
-        """)
-        meetings_result = db.execute(meetings_query, {"section_ids": section_ids})
-
-        # Build meeting lookup
-        meetings_by_section: Dict[str, List[Dict[str, Any]]] = {}
-        for row in meetings_result:
-            if row.section_id not in meetings_by_section:
-                meetings_by_section[row.section_id] = []
-            meetings_by_section[row.section_id].append(
-                {
-                    "daysOfWeek": _normalize_days_of_week(row.days_of_week),
-                    "beginTime": row.begin_time,
-                    "endTime": row.end_time,
-                    "startDate": row.start_date,
-                    "endDate": row.end_date,
-                    "building": row.building_code,
-                    "room": row.room_code,
-                    "meetingType": row.meeting_type,
-                }
-            )
-
-        # Build response
-        sections = []
-        for row in section_rows:
-            sections.append(
-                {
-                    "id": row.id,
-                    "termCode": row.term_code,
-                    "crn": row.crn,
-                    "dept": row.dept,
-                    "deptDesc": row.dept_desc,
-                    "courseNumber": row.course_number,
-                    "sectionNumber": row.section_number,
-                    "courseTitle": row.course_title,
-                    "creditHours": row.credit_hours,
-                    "hoursLow": row.hours_low,
-                    "hoursHigh": row.hours_high,
-                    "campus": row.campus,
-                    "partOfTerm": row.part_of_term,
-                    "sessionType": row.session_type,
-                    "scheduleType": row.schedule_type,
-                    "instructionType": row.instruction_type,
-                    "isOpen": row.is_open,
-                    "hasSyllabus": row.has_syllabus,
-                    "syllabusUrl": row.syllabus_url,
-                    "attributesText": row.attributes_text,
-                    "instructors": instructors_by_section.get(row.id, []),
-                    "meetings": meetings_by_section.get(row.id, []),
-                }
+        # Instructors and meetings arrive as JSON arrays on each row
+        sections = [
+            format_section(
+                row, row.instructors or [], _normalize_meetings(row.meetings or [])
             )
+            for row in section_rows
+        ]
 
-        return sections
+        # Plain str/int/bool values only, so skip jsonable_encoder's walk
+        return ORJSONResponse(content=sections)
 
     except HTTPException:
         raise
@@ -1370,6 +1362,25 @@ async def get_sections_by_term_and_course(
         raise HTTPException(status_code=500, detail=f"Database error: {str(e)}")
 
 
+# One row per instructor with their deduplicated, sorted sections; the
+# flags come from their lowest-numbered section
+COURSE_PROFESSORS_BY_TERM_SQL = text("""
+    SELECT
+        si.instructor_name,
+        (ARRAY_AGG(si.is_primary ORDER BY s.section_number))[1] as is_primary,
+        (ARRAY_AGG(si.has_cv ORDER BY s.section_number))[1] as has_cv,
+        (ARRAY_AGG(si.cv_url ORDER BY s.section_number))[1] as cv_url,
+        ARRAY_AGG(DISTINCT s.section_number ORDER BY s.section_number) as sections
+    FROM section_instructors si
+    JOIN sections s ON si.section_id = s.id
+    WHERE s.term_code = :term_code
+      AND s.dept = :dept
+      AND s.course_number = :course_number
+    GROUP BY si.instructor_name
+    ORDER BY si.instructor_name
+""")
+
+
 @app.get(
     "/sections/{term_code}/course/{course_code}/professors",
     responses={
@@ -1409,7 +1420,7 @@ async def get_course_professors_by_term(
     request: Request,
     term_code: str,
     course_code: str,
-    db: Session = Depends(get_db_session),
+    db: AsyncSession = Depends(get_async_db_session),
 ) -> List[Dict[str, Any]]:
     """
     Get all professors teaching a specific course in a specific term
@@ -1421,10 +1432,8 @@ async def get_course_professors_by_term(
     - `course_code`: Course code (e.g., CSCE121, MATH151, ACCT209)
     """
     try:
-        import re
-
         # Parse course_code (e.g., "CSCE121" -> dept="CSCE", course_num="121")
-        match = re.match(r"^([A-Z]+)(\d+[A-Z]?)$", course_code.upper())
+        match = _COURSE_CODE_RE.match(course_code.upper())
         if not match:
             raise HTTPException(
                 status_code=400,
@@ -1434,24 +1443,8 @@ async def get_course_professors_by_term(
         dept = match.group(1)
         course_number = match.group(2)
 
-        # Get all instructors for this course in this term
-        query = text("""
-            SELECT DISTINCT
-                si.instructor_name,
-                si.is_primary,
-                si.has_cv,
-                si.cv_url,
-                s.section_number
-            FROM section_instructors si
-            JOIN sections s ON si.section_id = s.id
-            WHERE s.term_code = :term_code
-              AND s.dept = :dept
-              AND s.course_number = :course_number
-            ORDER BY si.instructor_name, s.section_number
-        """)
-
-        result = db.execute(
-            query,
+        result = await db.execute(
+            COURSE_PROFESSORS_BY_TERM_SQL,
             {"term_code": term_code, "dept": dept, "course_number": course_number},
         )
         rows = result.fetchall()
@@ -1462,25 +1455,16 @@ async def get_course_professors_by_term(
                 detail=f"No professors found for {dept}{course_number} in term {term_code}",
             )
 
-        # Aggregate by professor name
-        professors_dict = {}
-        for row in rows:
-            name = row.instructor_name
-            if name not in professors_dict:
-                professors_dict[name] = {
-                    "name": name,
-                    "sections": [],
-                    "isPrimary": row.is_primary,
-                    "hasCv": row.has_cv,
-                    "cvUrl": row.cv_url,
-                }
-            if row.section_number not in professors_dict[name]["sections"]:
-                professors_dict[name]["sections"].append(row.section_number)
-
-        # Convert to list and sort by name
-        professors = sorted(professors_dict.values(), key=lambda x: x["name"])
-
-        return professors
+        return [
+            {
+                "name": row.instructor_name,
+                "sections": row.sections,
+                "isPrimary": row.is_primary,
+                "hasCv": row.has_cv,
+                "cvUrl": row.cv_url,
+            }
+            for row in rows
+        ]
 
     except HTTPException:
         raise
@@ -1541,7 +1525,7 @@ async def get_course_professors_details(
     request: Request,
     term_code: str,
     course_code: str,
-    db: Session = Depends(get_db_session),
+    db: AsyncSession = Depends(get_async_db_session),
 ) -> Dict[str, Any]:
     """
     Get comprehensive professor data for a course in a term.
@@ -1552,7 +1536,6 @@ async def get_course_professors_details(
     - overallSummary: aggregated summary across all courses
     - otherCourseSummaries: summaries for other courses they teach
     """
-    import re
     from difflib import SequenceMatcher
     from aggiermp.database.base import (
         SectionDB,
@@ -1561,11 +1544,11 @@ async def get_course_professors_details(
         ProfessorSummaryNewDB,
         GpaDataDB,
     )
-    from sqlalchemy import func, or_
+    from sqlalchemy import func, or_, select
 
     try:
         # Parse course_code (e.g., "CSCE121" -> dept="CSCE", course_num="121")
-        match = re.match(r"^([A-Z]+)(\d+[A-Z]?)$", course_code.upper())
+        match = _COURSE_CODE_RE.match(course_code.upper())
         if not match:
             raise HTTPException(
                 status_code=400,
@@ -1578,19 +1561,20 @@ async def get_course_professors_details(
 
         # Step 1: Get all instructors teaching this course in this term
         instructor_rows = (
-            db.query(
-                SectionInstructorDB.instructor_name,
-                SectionDB.section_number,
-            )
-            .join(SectionDB, SectionInstructorDB.section_id == SectionDB.id)
-            .filter(
-                SectionInstructorDB.term_code == term_code,
-                SectionDB.dept == dept,
-                SectionDB.course_number == course_num,
+            await db.execute(
+                select(
+                    SectionInstructorDB.instructor_name,
+                    SectionDB.section_number,
+                )
+                .join(SectionDB, SectionInstructorDB.section_id == SectionDB.id)
+                .where(
+                    SectionInstructorDB.term_code == term_code,
+                    SectionDB.dept == dept,
+                    SectionDB.course_number == course_num,
+                )
+                .distinct()
             )
-            .distinct()
-            .all()
-        )
+        ).all()
 
         if not instructor_rows:
             raise HTTPException(
@@ -1599,19 +1583,17 @@ async def get_course_professors_details(
             )
 
         # Build unique instructor names and their sections
-        instructor_sections: Dict[str, List[str]] = {}
+        instructor_sections: Dict[str, List[str]] = defaultdict(list)
         for row in instructor_rows:
-            name = row.instructor_name
-            if name not in instructor_sections:
-                instructor_sections[name] = []
-            if row.section_number not in instructor_sections[name]:
-                instructor_sections[name].append(row.section_number)
+            sections = instructor_sections[row.instructor_name]
+            if row.section_number not in sections:
+                sections.append(row.section_number)
 
         # Step 2: Match instructor names to professor IDs and get summaries
         result_professors = []
 
         def normalize_name_part(value: str) -> str:
-            return re.sub(r"[^a-z]", "", value.lower())
+            return _NON_LOWER_ALPHA_RE.sub("", value.lower())
 
         def parse_name(full_name: str) -> tuple[str, List[str]]:
             raw_parts = [p for p in full_name.strip().split() if p]
@@ -1641,14 +1623,14 @@ async def get_course_professors_details(
                 for token in surname_tokens
                 if token
             ]
-            prof_query = db.query(ProfessorDB)
+            prof_query = select(ProfessorDB)
             if surname_filters:
-                prof_query = prof_query.filter(or_(*surname_filters))
+                prof_query = prof_query.where(or_(*surname_filters))
             if first_name:
-                prof_query = prof_query.filter(
+                prof_query = prof_query.where(
                     ProfessorDB.first_name.ilike(f"{first_name[:1]}%")
                 )
-            candidates = prof_query.limit(200).all()
+            candidates = (await db.execute(prof_query.limit(200))).scalars().all()
 
             professor = None
             best_score = 0.0
@@ -1691,24 +1673,32 @@ async def get_course_professors_details(
             # Fallback to stricter lookup when candidate pool is empty.
             if not professor:
                 fallback_token = surname_tokens[-1]
-                fallback_query = db.query(ProfessorDB).filter(
+                fallback_query = select(ProfessorDB).where(
                     ProfessorDB.last_name.ilike(f"%{fallback_token}%")
                 )
                 if first_name:
-                    fallback_query = fallback_query.filter(
+                    fallback_query = fallback_query.where(
                         ProfessorDB.first_name.ilike(f"{first_name}%")
                     )
-                professor = fallback_query.first()
+                professor = (
+                    (await db.execute(fallback_query.limit(1))).scalars().first()
+                )
 
             # Get overall summary for totalReviews
             overall_summary = None
             if professor:
                 overall_summary = (
-                    db.query(ProfessorSummaryNewDB)
-                    .filter(
-                        ProfessorSummaryNewDB.professor_id == professor.id,
-                        ProfessorSummaryNewDB.course_code.is_(None),
+                    (
+                        await db.execute(
+                            select(ProfessorSummaryNewDB)
+                            .where(
+                                ProfessorSummaryNewDB.professor_id == professor.id,
+                                ProfessorSummaryNewDB.course_code.is_(None),
+                            )
+                            .limit(1)
+                        )
                     )
+                    .scalars()
                     .first()
                 )
 
@@ -1726,11 +1716,15 @@ async def get_course_professors_details(
             if professor:
                 # Get ALL course summaries for this professor
                 all_course_summaries = (
-                    db.query(ProfessorSummaryNewDB)
-                    .filter(
-                        ProfessorSummaryNewDB.professor_id == professor.id,
-                        ProfessorSummaryNewDB.course_code.isnot(None),
+                    (
+                        await db.execute(
+                            select(ProfessorSummaryNewDB).where(
+                                ProfessorSummaryNewDB.professor_id == professor.id,
+                                ProfessorSummaryNewDB.course_code.isnot(None),
+                            )
+                        )
                     )
+                    .scalars()
                     .all()
                 )
 
@@ -1785,24 +1779,24 @@ async def get_course_professors_details(
                     GpaDataDB.professor.ilike(f"%{name}%") for name in gpa_last_names
                 ]
                 gpa_rows = (
-                    db.query(
-                        func.avg(GpaDataDB.gpa).label("avg_gpa"),
-                        func.sum(GpaDataDB.grade_a).label("total_a"),
-                        func.sum(GpaDataDB.grade_b).label("total_b"),
-                        func.sum(GpaDataDB.grade_c).label("total_c"),
-                        func.sum(GpaDataDB.grade_d).label("total_d"),
-                        func.sum(GpaDataDB.grade_f).label("total_f"),
-                        func.sum(GpaDataDB.total_students).label("total_students"),
-                    )
-                    .filter(
-                        GpaDataDB.dept == dept,
-                        GpaDataDB.course_number == course_num,
-                        or_(*gpa_last_name_filters)
-                        if gpa_last_name_filters
-                        else GpaDataDB.professor.isnot(None),
+                    await db.execute(
+                        select(
+                            func.avg(GpaDataDB.gpa).label("avg_gpa"),
+                            func.sum(GpaDataDB.grade_a).label("total_a"),
+                            func.sum(GpaDataDB.grade_b).label("total_b"),
+                            func.sum(GpaDataDB.grade_c).label("total_c"),
+                            func.sum(GpaDataDB.grade_d).label("total_d"),
+                            func.sum(GpaDataDB.grade_f).label("total_f"),
+                            func.sum(GpaDataDB.total_students).label("total_students"),
+                        ).where(
+                            GpaDataDB.dept == dept,
+                            GpaDataDB.course_number == course_num,
+                            or_(*gpa_last_name_filters)
+                            if gpa_last_name_filters
+                            else GpaDataDB.professor.isnot(None),
+                        )
                     )
-                    .first()
-                )
+                ).first()
 
                 if gpa_rows and gpa_rows.total_students and gpa_rows.total_students > 0:
                     prof_data["grades"] = {
@@ -1836,22 +1830,126 @@ async def get_course_professors_details(
         raise HTTPException(status_code=500, detail=f"Database error: {str(e)}")
 
 
-@app.get(
-    "/departments_info",
-    responses={
-        200: {
-            "description": "University overview statistics",
-            "content": {
-                "application/json": {
-                    "example": {
-                        "summary": {
-                            "total_departments": 156,
-                            "total_courses": 8742,
-                            "total_professors": 2341,
-                            "overall_avg_gpa": 3.12,
-                            "overall_avg_rating": 3.8,
-                        },
-                        "top_departments_by_courses": [
+# Single query returning the aggregate stats, top departments and recent
+# semester stats as one typed JSON document; per-department stats come from
+# the mv_dept_gpa_stats / mv_dept_review_ratings materialized views. json (not
+# jsonb) keeps the object keys in the order the API has always returned them.
+DEPARTMENTS_INFO_SQL = text("""
+    WITH dept_data AS (
+        SELECT 
+            d.id as code,
+            d.long_name as name,
+            COALESCE(gs.course_count, 0) as courses,
+            COALESCE(gs.professor_count, 0) as professors,
+            gs.weighted_avg_gpa as avg_gpa,
+            rr.avg_professor_rating as rating
+        FROM departments d
+        LEFT JOIN mv_dept_gpa_stats gs ON d.id = gs.dept
+        LEFT JOIN mv_dept_review_ratings rr ON d.id = rr.dept_code
+    ),
+    aggregates AS (
+        SELECT 
+            COUNT(*) as total_departments,
+            COALESCE(SUM(courses), 0) as total_courses,
+            COALESCE(SUM(professors), 0) as total_professors,
+            ROUND(AVG(avg_gpa)::numeric, 2) as overall_avg_gpa,
+            ROUND(AVG(rating)::numeric, 1) as overall_avg_rating
+        FROM dept_data
+    ),
+    top_depts AS (
+        SELECT code, name, courses, professors, avg_gpa, rating
+        FROM dept_data
+        WHERE courses > 0
+        ORDER BY courses DESC
+        LIMIT 5
+    ),
+    -- Enrollment and coverage for the four most recent GPA semesters
+    semester_stats AS (
+        SELECT 
+            year,
+            semester,
+            COUNT(DISTINCT dept) as departments_with_data,
+            COUNT(DISTINCT dept || course_number) as unique_courses,
+            COUNT(DISTINCT professor) as unique_professors,
+            SUM(total_students) as total_enrollment,
+            ROW_NUMBER() OVER (
+                ORDER BY year DESC, 
+                         CASE semester 
+                             WHEN 'FALL' THEN 1 
+                             WHEN 'SUMMER' THEN 2
+                             WHEN 'SPRING' THEN 3 
+                         END
+            ) as rn
+        FROM gpa_data 
+        WHERE total_students > 0
+        GROUP BY year, semester
+    )
+    SELECT json_build_object(
+        'summary', (
+            SELECT json_build_object(
+                'total_departments', total_departments,
+                'total_courses', total_courses,
+                'total_professors', total_professors,
+                'overall_avg_gpa', COALESCE(overall_avg_gpa, 3.0),
+                'overall_avg_rating', COALESCE(overall_avg_rating, 3.0)
+            )
+            FROM aggregates
+        ),
+        'top_departments', (
+            SELECT COALESCE(
+                json_agg(
+                    json_build_object(
+                        'code', code,
+                        'name', name,
+                        'courses', courses,
+                        'professors', professors,
+                        'avgGpa', COALESCE(avg_gpa, 3.0),
+                        'rating', COALESCE(rating, 3.0)
+                    )
+                    ORDER BY courses DESC
+                ),
+                '[]'::json
+            )
+            FROM top_depts
+        ),
+        'recent_semesters', (
+            SELECT COALESCE(
+                json_agg(
+                    json_build_object(
+                        'year', year,
+                        'semester', semester,
+                        'departments', departments_with_data,
+                        'courses', unique_courses,
+                        'professors', unique_professors,
+                        'enrollment', total_enrollment
+                    )
+                    ORDER BY rn
+                ),
+                '[]'::json
+            )
+            FROM semester_stats
+            WHERE rn <= 4
+        )
+    ) as payload
+""")
+
+
+@app.get(
+    "/departments_info",
+    responses={
+        200: {
+            "description": "University overview statistics",
+            "content": {
+                "application/json": {
+                    "example": {
+                        "summary": {
+                            "total_departments": 156,
+                            "total_courses": 8742,
+                            "total_professors": 2341,
+                            "overall_avg_gpa": 3.12,
+                            "overall_avg_rating": 3.8,
+                        },
+                        "top_departments_by_courses": [
                             {
                                 "code": "ENGR",
                                 "name": "Engineering",
@@ -1870,9 +1968,10 @@ async def get_course_professors_details(
     description="Returns university-wide statistics including department counts, courses, professors, and GPA averages.",
 )
 @limiter.limit("60/minute")
+@local_cached(ttl=TTL_STANDARD)  # per-worker copy in front of Redis
 @cached(ttl=TTL_WEEK)  # 1 week cache
 async def get_departments_info(
-    request: Request, db: Session = Depends(get_db_session)
+    request: Request, db: AsyncSession = Depends(get_async_db_session)
 ) -> Dict[str, Any]:
     """
     Get aggregate statistics about all departments
@@ -1886,181 +1985,17 @@ async def get_departments_info(
     ```
     """
     try:
-        # Single consolidated query using CTEs for both aggregate stats and top departments
-        combined_query = text("""
-            WITH gpa_stats AS (
-                SELECT 
-                    dept,
-                    COUNT(DISTINCT course_number) as course_count,
-                    COUNT(DISTINCT professor) as professor_count,
-                    ROUND(
-                        SUM(gpa::numeric * total_students) / NULLIF(SUM(total_students), 0), 
-                        2
-                    ) as weighted_avg_gpa
-                FROM gpa_data 
-                WHERE year = '2025' AND semester = 'SPRING'
-                  AND gpa IS NOT NULL AND total_students > 0
-                GROUP BY dept
-            ),
-            review_ratings AS (
-                SELECT 
-                    SUBSTRING(course_code FROM '^[A-Z]+') as dept_code,
-                    ROUND(AVG(p.avg_rating::numeric), 1) as avg_professor_rating
-                FROM reviews r
-                JOIN professors p ON r.professor_id = p.id
-                WHERE p.avg_rating IS NOT NULL 
-                  AND r.course_code IS NOT NULL
-                  AND SUBSTRING(r.course_code FROM '^[A-Z]+') IS NOT NULL
-                GROUP BY SUBSTRING(r.course_code FROM '^[A-Z]+')
-            ),
-            dept_data AS (
-                SELECT 
-                    d.id as code,
-                    d.long_name as name,
-                    COALESCE(gs.course_count, 0) as courses,
-                    COALESCE(gs.professor_count, 0) as professors,
-                    COALESCE(gs.weighted_avg_gpa, 3.0) as avg_gpa,
-                    COALESCE(rr.avg_professor_rating, 3.0) as rating
-                FROM departments d
-                LEFT JOIN gpa_stats gs ON d.id = gs.dept
-                LEFT JOIN review_ratings rr ON d.id = rr.dept_code
-            ),
-            aggregates AS (
-                SELECT 
-                    COUNT(*) as total_departments,
-                    COALESCE(SUM(courses), 0) as total_courses,
-                    COALESCE(SUM(professors), 0) as total_professors,
-                    ROUND(AVG(NULLIF(avg_gpa, 3.0))::numeric, 2) as overall_avg_gpa,
-                    ROUND(AVG(NULLIF(rating, 3.0))::numeric, 1) as overall_avg_rating
-                FROM dept_data
-            ),
-            top_depts AS (
-                SELECT code, name, courses, professors, avg_gpa, rating
-                FROM dept_data
-                WHERE courses > 0
-                ORDER BY courses DESC
-                LIMIT 5
-            )
-            SELECT 
-                'aggregate' as row_type,
-                NULL as code, NULL as name, 
-                total_departments::text as courses, 
-                total_courses::text as professors_or_total_courses,
-                total_professors::text as avg_gpa_or_total_professors,
-                overall_avg_gpa::text as rating_or_overall_gpa,
-                overall_avg_rating::text as overall_rating
-            FROM aggregates
-            UNION ALL
-            SELECT 
-                'department' as row_type,
-                code, name, 
-                courses::text, 
-                professors::text,
-                avg_gpa::text,
-                rating::text,
-                NULL
-            FROM top_depts
-        """)
-
-        result = db.execute(combined_query)
-        rows = result.fetchall()
+        # Aggregate, top department and semester stats in one round-trip
+        result = await db.execute(DEPARTMENTS_INFO_SQL)
+        payload = result.scalar()
 
-        if not rows:
-            raise HTTPException(status_code=404, detail="No department data found")
-
-        # Parse aggregate row
-        agg_row = next((r for r in rows if r.row_type == "aggregate"), None)
-        if not agg_row:
+        if not payload:
             raise HTTPException(status_code=404, detail="No department data found")
 
-        total_departments = int(agg_row.courses) if agg_row.courses else 0
-        total_courses = (
-            int(agg_row.professors_or_total_courses)
-            if agg_row.professors_or_total_courses
-            else 0
-        )
-        total_professors = (
-            int(agg_row.avg_gpa_or_total_professors)
-            if agg_row.avg_gpa_or_total_professors
-            else 0
-        )
-        overall_avg_gpa = (
-            float(agg_row.rating_or_overall_gpa)
-            if agg_row.rating_or_overall_gpa
-            else 3.0
-        )
-        overall_avg_rating = (
-            float(agg_row.overall_rating) if agg_row.overall_rating else 3.0
-        )
-
-        # Parse top departments
-        top_departments = []
-        for dept_row in rows:
-            if dept_row.row_type != "department":
-                continue
-            top_departments.append(
-                {
-                    "code": dept_row.code,
-                    "name": dept_row.name,
-                    "courses": int(dept_row.courses) if dept_row.courses else 0,
-                    "professors": int(dept_row.professors_or_total_courses)
-                    if dept_row.professors_or_total_courses
-                    else 0,
-                    "avgGpa": float(dept_row.avg_gpa_or_total_professors)
-                    if dept_row.avg_gpa_or_total_professors
-                    else 3.0,
-                    "rating": float(dept_row.rating_or_overall_gpa)
-                    if dept_row.rating_or_overall_gpa
-                    else None,
-                }
-            )
-
-        # Get semester statistics
-        semester_stats_query = text("""
-            SELECT 
-                year,
-                semester,
-                COUNT(DISTINCT dept) as departments_with_data,
-                COUNT(DISTINCT dept || course_number) as unique_courses,
-                COUNT(DISTINCT professor) as unique_professors,
-                SUM(total_students) as total_enrollment
-            FROM gpa_data 
-            WHERE total_students > 0
-            GROUP BY year, semester
-            ORDER BY year DESC, 
-                     CASE semester 
-                         WHEN 'FALL' THEN 1 
-                         WHEN 'SUMMER' THEN 2
-                         WHEN 'SPRING' THEN 3 
-                     END
-            LIMIT 4
-        """)
-
-        semester_stats_result = db.execute(semester_stats_query)
-        semester_stats = []
-
-        for sem_row in semester_stats_result:
-            semester_stats.append(
-                {
-                    "year": sem_row.year,
-                    "semester": sem_row.semester,
-                    "departments": int(sem_row.departments_with_data),
-                    "courses": int(sem_row.unique_courses),
-                    "professors": int(sem_row.unique_professors),
-                    "enrollment": int(sem_row.total_enrollment),
-                }
-            )
-
         return {
-            "summary": {
-                "total_departments": total_departments,
-                "total_courses": total_courses,
-                "total_professors": total_professors,
-                "overall_avg_gpa": overall_avg_gpa,
-                "overall_avg_rating": overall_avg_rating,
-            },
-            "top_departments_by_courses": top_departments,
-            "recent_semesters": semester_stats,
+            "summary": payload["summary"],
+            "top_departments_by_courses": payload["top_departments"],
+            "recent_semesters": payload["recent_semesters"],
             "data_sources": {
                 "gpa_data": "anex.us",
                 "reviews": "Rate My Professor",
@@ -2074,6 +2009,14 @@ async def get_departments_info(
         raise HTTPException(status_code=500, detail=f"Database error: {str(e)}")
 
 
+# Top courses for every department, in rank order
+DEPT_TOP_COURSES_SQL = text("""
+    SELECT dept, course_code
+    FROM mv_dept_top_courses
+    ORDER BY dept, rn
+""")
+
+
 @app.get(
     "/departments",
     responses={
@@ -2108,7 +2051,7 @@ async def get_departments(
     search: Optional[str] = None,
     limit: int = 30,
     skip: int = 0,
-    db: Session = Depends(get_db_session),
+    db: AsyncSession = Depends(get_async_db_session),
 ) -> List[Dict[str, Any]]:
     """
     Get all departments with aggregated statistics from anex data
@@ -2136,7 +2079,7 @@ async def get_departments(
             where_clause = "WHERE (d.id ILIKE :search OR d.long_name ILIKE :search)"
             params["search"] = f"%{search}%"
 
-        # Query departments with aggregated data from last semester (Fall 2024)
+        # Query departments with pre-aggregated stats from the materialized views
         query_string = f"""
             SELECT 
                 d.id,
@@ -2148,73 +2091,28 @@ async def get_departments(
                 COALESCE(review_ratings.avg_professor_rating, 3.0) as rating,
                 d.title as description
             FROM departments d
-            LEFT JOIN (
-                SELECT 
-                    dept,
-                    COUNT(DISTINCT course_number) as course_count,
-                    COUNT(DISTINCT professor) as professor_count,
-                    ROUND(
-                        SUM(gpa::numeric * total_students) / NULLIF(SUM(total_students), 0), 
-                        2
-                    ) as weighted_avg_gpa
-                FROM gpa_data 
-                WHERE year = '2025' AND semester = 'SPRING'
-                  AND gpa IS NOT NULL AND total_students > 0
-                GROUP BY dept
-            ) last_sem ON d.id = last_sem.dept
-            LEFT JOIN (
-                SELECT 
-                    SUBSTRING(course_code FROM '^[A-Z]+') as dept_code,
-                    ROUND(AVG(p.avg_rating::numeric), 1) as avg_professor_rating
-                FROM reviews r
-                JOIN professors p ON r.professor_id = p.id
-                WHERE p.avg_rating IS NOT NULL 
-                  AND r.course_code IS NOT NULL
-                  AND SUBSTRING(r.course_code FROM '^[A-Z]+') IS NOT NULL
-                GROUP BY SUBSTRING(r.course_code FROM '^[A-Z]+')
-            ) review_ratings ON d.id = review_ratings.dept_code
+            LEFT JOIN mv_dept_gpa_stats last_sem ON d.id = last_sem.dept
+            LEFT JOIN mv_dept_review_ratings review_ratings
+                ON d.id = review_ratings.dept_code
             {where_clause}
-            GROUP BY d.id, d.id, d.long_name, d.title, 
-                     last_sem.course_count, last_sem.professor_count, last_sem.weighted_avg_gpa,
-                     review_ratings.avg_professor_rating
             ORDER BY d.id
             LIMIT :limit OFFSET :skip
         """
 
         formatted_query = text(query_string)
 
-        result = db.execute(formatted_query, params)
+        result = await db.execute(formatted_query, params)
         dept_rows = result.fetchall()
 
         if not dept_rows:
             return []
 
         # Batch fetch top courses for ALL departments in one query
-        # Uses window function to rank courses within each department
-        top_courses_query = text("""
-            WITH ranked_courses AS (
-                SELECT 
-                    dept,
-                    dept || ' ' || course_number as course_code,
-                    COUNT(*) as section_count,
-                    ROW_NUMBER() OVER (PARTITION BY dept ORDER BY COUNT(*) DESC, course_number) as rn
-                FROM sections
-                WHERE term_code = (SELECT MAX(term_code) FROM sections WHERE term_code LIKE '%1')
-                GROUP BY dept, course_number
-            )
-            SELECT dept, course_code
-            FROM ranked_courses
-            WHERE rn <= 3
-            ORDER BY dept, rn
-        """)
-
-        top_courses_result = db.execute(top_courses_query)
+        top_courses_result = await db.execute(DEPT_TOP_COURSES_SQL)
 
         # Build lookup dict: dept -> [course_codes]
-        top_courses_by_dept: Dict[str, List[str]] = {}
+        top_courses_by_dept: Dict[str, List[str]] = defaultdict(list)
         for row in top_courses_result:
-            if row.dept not in top_courses_by_dept:
-                top_courses_by_dept[row.dept] = []
             top_courses_by_dept[row.dept].append(row.course_code)
 
         # Build response
@@ -2279,7 +2177,7 @@ async def get_courses(
     search: Optional[str] = None,
     limit: int = 30,
     skip: int = 0,
-    db: Session = Depends(get_db_session),
+    db: AsyncSession = Depends(get_async_db_session),
 ) -> List[Dict[str, Any]]:
     """
     Get courses with comprehensive data from recent semesters
@@ -2299,77 +2197,16 @@ async def get_courses(
     - `/courses?department=MATH&limit=10` - First 10 Math courses
     """
     try:
-        # Base query with aggregated data from last 4 semesters and last semester
+        # Base query; GPA (last 4 semesters), enrollment (last year), section
+        # counts (current term) and ratings come from mv_course_aggregates
         query_base = """
-            WITH recent_semesters AS (
-                -- Determine the most recent N (4) semester-year combinations available in gpa_data
-                SELECT year, semester
-                FROM gpa_data
-                WHERE gpa IS NOT NULL AND total_students > 0
-                GROUP BY year, semester
-                ORDER BY (year::int) DESC,
-                         CASE semester WHEN 'FALL' THEN 1 WHEN 'SPRING' THEN 2 WHEN 'SUMMER' THEN 3 ELSE 4 END
-                LIMIT 4
-            ),
-            last_4_semesters_gpa AS (
-                SELECT 
-                    gd.dept, 
-                    gd.course_number,
-                    ROUND(
-                        SUM(gd.gpa::numeric * gd.total_students) / NULLIF(SUM(gd.total_students), 0), 
-                        2
-                    ) as weighted_avg_gpa
-                FROM gpa_data gd
-                JOIN recent_semesters rs ON gd.year = rs.year AND gd.semester = rs.semester
-                WHERE gd.gpa IS NOT NULL AND gd.total_students > 0
-                GROUP BY gd.dept, gd.course_number
-            ),
-            current_term AS (
-                -- Get most recent College Station term (term_code ending in 1)
-                SELECT MAX(term_code) as term_code 
-                FROM sections 
-                WHERE term_code LIKE '%1'
-            ),
-            section_data AS (
-                -- Get section counts from sections table (real-time data)
-                SELECT 
-                    s.dept,
-                    s.course_number,
-                    COUNT(*) as section_count
-                FROM sections s
-                JOIN current_term ct ON s.term_code = ct.term_code
-                GROUP BY s.dept, s.course_number
-            ),
-            enrollment_data AS (
-                -- Get enrollment from gpa_data (historical data)
-                SELECT 
-                    dept,
-                    course_number,
-                    SUM(total_students) as total_enrollment
-                FROM gpa_data
-                WHERE year = (SELECT MAX(year) FROM gpa_data WHERE total_students > 0)
-                  AND total_students > 0
-                GROUP BY dept, course_number
-            ),
-            course_reviews AS (
-                SELECT 
-                    SUBSTRING(course_code FROM '^[A-Z]+') as dept_code,
-                    SUBSTRING(course_code FROM '[0-9]+') as course_num,
-                    ROUND(AVG(p.avg_rating::numeric), 1) as avg_professor_rating
-                FROM reviews r
-                JOIN professors p ON r.professor_id = p.id
-                WHERE p.avg_rating IS NOT NULL 
-                  AND r.course_code IS NOT NULL
-                  AND SUBSTRING(r.course_code FROM '^[A-Z]+') IS NOT NULL
-                  AND SUBSTRING(r.course_code FROM '[0-9]+') IS NOT NULL
-                GROUP BY SUBSTRING(r.course_code FROM '^[A-Z]+'), SUBSTRING(r.course_code FROM '[0-9]+')
-            )
             SELECT DISTINCT
-                c.subject_id || c.course_number as id,
+                c.course_code as id,
                 c.code as code,
                 c.name as name,
                 c.subject_id as department_id,
                 c.subject_long_name as department_name,
+                c.course_number,
                 c.subject_id as sort_dept,
                 CASE 
                     WHEN c.course_number ~ '^[0-9]+$' THEN c.course_number::int
@@ -2377,20 +2214,20 @@ async def get_courses(
                 END as sort_course_num,
                 COALESCE(c.credits, 4) as credits,
                 CASE 
-                    WHEN l4s.weighted_avg_gpa IS NOT NULL THEN l4s.weighted_avg_gpa
+                    WHEN m.weighted_avg_gpa IS NOT NULL THEN m.weighted_avg_gpa
                     ELSE -1
                 END as avgGPA,
                 CASE 
-                    WHEN l4s.weighted_avg_gpa IS NULL THEN 'Unknown'
-                    WHEN l4s.weighted_avg_gpa >= 3.7 THEN 'Light'
-                    WHEN l4s.weighted_avg_gpa >= 3.3 THEN 'Moderate'
-                    WHEN l4s.weighted_avg_gpa >= 2.7 THEN 'Challenging'
-                    WHEN l4s.weighted_avg_gpa >= 2.0 THEN 'Intensive'
+                    WHEN m.weighted_avg_gpa IS NULL THEN 'Unknown'
+                    WHEN m.weighted_avg_gpa >= 3.7 THEN 'Light'
+                    WHEN m.weighted_avg_gpa >= 3.3 THEN 'Moderate'
+                    WHEN m.weighted_avg_gpa >= 2.7 THEN 'Challenging'
+                    WHEN m.weighted_avg_gpa >= 2.0 THEN 'Intensive'
                     ELSE 'Rigorous'
                 END as difficulty,
-                COALESCE(ed.total_enrollment, 0) as enrollment,
-                COALESCE(sd.section_count, 0) as sections,
-                COALESCE(cr.avg_professor_rating, 3.0) as rating,
+                COALESCE(m.total_enrollment, 0) as enrollment,
+                COALESCE(m.section_count, 0) as sections,
+                COALESCE(m.avg_professor_rating, 3.0) as rating,
                 c.description,
                 CASE 
                     WHEN c.course_number ~ '^[0-9]+$' AND c.course_number::int < 300 THEN ARRAY['Undergraduate']
@@ -2405,14 +2242,12 @@ async def get_courses(
                     ELSE ARRAY['Other']
                 END as tags
             FROM courses c
-            LEFT JOIN last_4_semesters_gpa l4s ON c.subject_id = l4s.dept AND c.course_number = l4s.course_number
-            LEFT JOIN section_data sd ON c.subject_id = sd.dept AND c.course_number = sd.course_number
-            LEFT JOIN enrollment_data ed ON c.subject_id = ed.dept AND c.course_number = ed.course_number
-            LEFT JOIN course_reviews cr ON c.subject_id = cr.dept_code AND c.course_number = cr.course_num
+            LEFT JOIN mv_course_aggregates m
+                ON c.subject_id = m.dept AND c.course_number = m.course_number
         """
 
         where_conditions = []
-        params = {}
+        params: Dict[str, Any] = {"limit": limit, "skip": skip}
 
         if department:
             where_conditions.append("c.subject_id = :department")
@@ -2430,45 +2265,43 @@ async def get_courses(
             ORDER BY sort_dept, sort_course_num
         """
 
-        limit_clause = f" LIMIT {limit} OFFSET {skip}"
-
-        full_query = query_base + where_clause + order_clause + limit_clause
-
-        result = db.execute(text(full_query), params)
-        rows = result.fetchall()
+        limit_clause = " LIMIT :limit OFFSET :skip"
 
-        # Batch fetch all section attributes in a single query
-        attrs_by_course: Dict[Tuple[str, str], List[str]] = {}
-        if rows:
-            section_attrs_query = text("""
-                SELECT DISTINCT 
-                    sa.dept,
-                    sa.course_number,
-                    sa.attribute_id,
-                    sa.attribute_title
-                FROM section_attributes sa
-                WHERE sa.year = '2025' 
-                  AND sa.semester = 'Fall'
-                ORDER BY sa.dept, sa.course_number, sa.attribute_id
-            """)
+        page_query = query_base + where_clause + order_clause + limit_clause
 
-            section_attrs_result = db.execute(section_attrs_query)
+        # Section attributes are looked up only for the courses on this page;
+        # each attribute is listed by its title, falling back to its id
+        full_query = f"""
+            SELECT 
+                page.*,
+                COALESCE(attrs.section_attributes, ARRAY[]::varchar[]) as section_attributes
+            FROM ({page_query}) page
+            LEFT JOIN LATERAL (
+                SELECT array_agg(
+                    CASE
+                        WHEN NULLIF(btrim(sa.attribute_title), '') IS NOT NULL
+                        THEN sa.attribute_title
+                        ELSE sa.attribute_id
+                    END
+                    ORDER BY sa.attribute_id
+                ) as section_attributes
+                FROM (
+                    SELECT DISTINCT attribute_id, attribute_title
+                    FROM section_attributes
+                    WHERE dept = page.department_id
+                      AND course_number = page.course_number
+                      AND year = '2025'
+                      AND semester = 'Fall'
+                ) sa
+            ) attrs ON true
+            ORDER BY page.sort_dept, page.sort_course_num
+        """
 
-            # Build a lookup dict: (dept, course_number) -> [attributes]
-            for attr in section_attrs_result:
-                key = (attr.dept, attr.course_number)
-                if key not in attrs_by_course:
-                    attrs_by_course[key] = []
-                if attr.attribute_title and attr.attribute_title.strip():
-                    attrs_by_course[key].append(attr.attribute_title)
-                else:
-                    attrs_by_course[key].append(attr.attribute_id)
+        result = await db.execute(text(full_query), params)
+        rows = result.fetchall()
 
         courses = []
         for row in rows:
-            course_key = (row.department_id, row.code.split()[1])
-            section_attributes = attrs_by_course.get(course_key, [])
-
             courses.append(
                 {
                     "id": row.id,
@@ -2487,7 +2320,7 @@ async def get_courses(
                     "description": row.description
                     or f"Course in {row.department_name}",
                     "tags": row.tags,
-                    "sectionAttributes": section_attributes,
+                    "sectionAttributes": row.section_attributes,
                 }
             )
 
@@ -2539,7 +2372,7 @@ async def get_courses(
 @limiter.limit("60/minute")
 @cached(ttl=TTL_WEEK)  # 1 week cache
 async def get_course_details(
-    request: Request, course_id: str, db: Session = Depends(get_db_session)
+    request: Request, course_id: str, db: AsyncSession = Depends(get_async_db_session)
 ) -> Dict[str, Any]:
     """
     Get detailed course information with comprehensive data
@@ -2552,9 +2385,7 @@ async def get_course_details(
     """
     try:
         # Parse course_id (e.g., "CSCE120" -> dept="CSCE", course_num="120")
-        import re
-
-        match = re.match(r"^([A-Z]+)(\d+)$", course_id.upper())
+        match = _COURSE_ID_RE.match(course_id.upper())
         if not match:
             raise HTTPException(
                 status_code=400,
@@ -2563,57 +2394,10 @@ async def get_course_details(
 
         dept, course_num = match.groups()
 
-        # Get course basic info with anex data
+        # Course info with pre-aggregated anex/section data, plus whether RMP
+        # summaries exist, its section attributes and related courses, in one
+        # round-trip
         course_query = text("""
-            WITH recent_semesters AS (
-                SELECT year, semester
-                FROM gpa_data
-                WHERE gpa IS NOT NULL AND total_students > 0
-                GROUP BY year, semester
-                ORDER BY (year::int) DESC,
-                         CASE semester WHEN 'FALL' THEN 1 WHEN 'SPRING' THEN 2 WHEN 'SUMMER' THEN 3 ELSE 4 END
-                LIMIT 4
-            ),
-            last_4_semesters_gpa AS (
-                SELECT 
-                    gd.dept, 
-                    gd.course_number,
-                    ROUND(
-                        SUM(gd.gpa::numeric * gd.total_students) / NULLIF(SUM(gd.total_students), 0), 
-                        2
-                    ) as weighted_avg_gpa
-                FROM gpa_data gd
-                JOIN recent_semesters rs ON gd.year = rs.year AND gd.semester = rs.semester
-                WHERE gd.gpa IS NOT NULL AND gd.total_students > 0
-                GROUP BY gd.dept, gd.course_number
-            ),
-            current_term AS (
-                -- Get most recent College Station term (term_code ending in 1)
-                SELECT MAX(term_code) as term_code 
-                FROM sections 
-                WHERE term_code LIKE '%1'
-            ),
-            section_data AS (
-                -- Get section counts from sections table (real-time data)
-                SELECT 
-                    s.dept,
-                    s.course_number,
-                    COUNT(*) as section_count
-                FROM sections s
-                JOIN current_term ct ON s.term_code = ct.term_code
-                GROUP BY s.dept, s.course_number
-            ),
-            enrollment_data AS (
-                -- Get enrollment from gpa_data (historical data)
-                SELECT 
-                    dept,
-                    course_number,
-                    SUM(total_students) as total_enrollment
-                FROM gpa_data
-                WHERE year = (SELECT MAX(year) FROM gpa_data WHERE total_students > 0)
-                  AND total_students > 0
-                GROUP BY dept, course_number
-            )
             SELECT 
                 c.code as code,
                 c.name as name,
@@ -2630,43 +2414,97 @@ async def get_course_details(
                 c.corequisite_groups,
                 c.cross_listings,
                 CASE 
-                    WHEN l4s.weighted_avg_gpa IS NOT NULL THEN l4s.weighted_avg_gpa
+                    WHEN m.weighted_avg_gpa IS NOT NULL THEN m.weighted_avg_gpa
                     ELSE -1
                 END as avgGPA,
                 CASE 
-                    WHEN l4s.weighted_avg_gpa IS NULL THEN 'Unknown'
-                    WHEN l4s.weighted_avg_gpa >= 3.7 THEN 'Light'
-                    WHEN l4s.weighted_avg_gpa >= 3.3 THEN 'Moderate'
-                    WHEN l4s.weighted_avg_gpa >= 2.7 THEN 'Challenging'
-                    WHEN l4s.weighted_avg_gpa >= 2.0 THEN 'Intensive'
+                    WHEN m.weighted_avg_gpa IS NULL THEN 'Unknown'
+                    WHEN m.weighted_avg_gpa >= 3.7 THEN 'Light'
+                    WHEN m.weighted_avg_gpa >= 3.3 THEN 'Moderate'
+                    WHEN m.weighted_avg_gpa >= 2.7 THEN 'Challenging'
+                    WHEN m.weighted_avg_gpa >= 2.0 THEN 'Intensive'
                     ELSE 'Rigorous'
                 END as difficulty,
-                COALESCE(ed.total_enrollment, 0) as enrollment,
-                COALESCE(sd.section_count, 0) as sections
+                COALESCE(m.total_enrollment, 0) as enrollment,
+                COALESCE(m.section_count, 0) as sections,
+                EXISTS (
+                    SELECT 1 FROM professor_summaries_new
+                    WHERE course_code = :course_code
+                ) as has_summaries,
+                -- Section attributes for Fall 2025 (latest available data);
+                -- attribute_title is already formatted as "name - code"
+                COALESCE(
+                    (
+                        SELECT array_agg(
+                            CASE
+                                WHEN NULLIF(btrim(sa.attribute_title), '') IS NOT NULL
+                                THEN sa.attribute_title
+                                ELSE sa.attribute_id
+                            END
+                            ORDER BY sa.attribute_id
+                        )
+                        FROM (
+                            SELECT DISTINCT attribute_id, attribute_title
+                            FROM section_attributes
+                            WHERE dept = c.subject_id
+                              AND course_number = c.course_number
+                              AND year = '2025'
+                              AND semester = 'Fall'
+                        ) sa
+                    ),
+                    ARRAY[]::varchar[]
+                ) as section_attributes,
+                -- Related courses (same department with similar numbers)
+                (
+                    SELECT json_agg(
+                        json_build_object(
+                            'code', rc.code,
+                            'name', rc.name,
+                            'similarity', rc.similarity
+                        )
+                        ORDER BY rc.similarity DESC, rc.course_number_int
+                    )
+                    FROM (
+                        SELECT 
+                            c2.code,
+                            c2.name,
+                            c2.course_number::int as course_number_int,
+                            CASE 
+                                WHEN ABS(c2.course_number::int - :course_num_int) <= 10 THEN 95
+                                WHEN ABS(c2.course_number::int - :course_num_int) <= 50 THEN 78
+                                ELSE 72
+                            END as similarity
+                        FROM courses c2
+                        WHERE c2.subject_id = :dept 
+                          AND c2.course_number != :course_num
+                          AND ABS(c2.course_number::int - :course_num_int) <= 100
+                        ORDER BY similarity DESC, c2.course_number::int
+                        LIMIT 3
+                    ) rc
+                ) as related_courses
             FROM courses c
-            LEFT JOIN last_4_semesters_gpa l4s ON c.subject_id = l4s.dept AND c.course_number = l4s.course_number
-            LEFT JOIN section_data sd ON c.subject_id = sd.dept AND c.course_number = sd.course_number
-            LEFT JOIN enrollment_data ed ON c.subject_id = ed.dept AND c.course_number = ed.course_number
+            LEFT JOIN mv_course_aggregates m
+                ON c.subject_id = m.dept AND c.course_number = m.course_number
             WHERE c.subject_id = :dept AND c.course_number = :course_num
             LIMIT 1
         """)
 
-        course_result = db.execute(
-            course_query, {"dept": dept, "course_num": course_num}
+        course_result = (
+            await db.execute(
+                course_query,
+                {
+                    "dept": dept,
+                    "course_num": course_num,
+                    "course_num_int": int(course_num),
+                    "course_code": course_id.upper(),
+                },
+            )
         ).fetchone()
 
         if not course_result:
             raise HTTPException(status_code=404, detail="Course not found")
 
-        # First, check if any professors exist in professor_summaries_new for this course
-        check_query = text(
-            "SELECT COUNT(*) FROM professor_summaries_new WHERE course_code = :course_code"
-        )
-        professors_count = (
-            db.execute(check_query, {"course_code": course_id.upper()}).scalar() or 0
-        )
-
-        if professors_count > 0:
+        if course_result.has_summaries:
             # Use full RMP + grade distribution query
             professors_query = text("""
                 WITH latest_semester_per_prof AS (
@@ -2754,7 +2592,7 @@ async def get_course_details(
                 ORDER BY ps.total_reviews DESC
                 LIMIT 10
             """)
-            professors_result = db.execute(
+            professors_result = await db.execute(
                 professors_query,
                 {
                     "course_code": course_id.upper(),
@@ -2836,7 +2674,7 @@ async def get_course_details(
                 ORDER BY pg.total_grades DESC
                 LIMIT 20
             """)
-            professors_result = db.execute(
+            professors_result = await db.execute(
                 professors_query,
                 {"dept": dept, "course_num": course_num},
             )
@@ -2882,61 +2720,6 @@ async def get_course_details(
 
             professors.append(professor_data)
 
-        # Get section attributes for Fall 2025 (latest available data)
-        section_attrs_query = text("""
-            SELECT DISTINCT 
-                sa.attribute_id,
-                sa.attribute_title
-            FROM section_attributes sa
-            WHERE sa.dept = :dept 
-              AND sa.course_number = :course_num
-              AND sa.year = '2025' 
-              AND sa.semester = 'Fall'
-            ORDER BY sa.attribute_id
-        """)
-
-        section_attrs_result = db.execute(
-            section_attrs_query, {"dept": dept, "course_num": course_num}
-        )
-
-        # Use attribute_title when available (already formatted as "name - code"), otherwise use attribute_id
-        section_attributes = []
-        for attr in section_attrs_result:
-            if attr.attribute_title and attr.attribute_title.strip():
-                # Use the formatted title (already contains "name - code" format)
-                section_attributes.append(attr.attribute_title)
-            else:
-                # No title available, just use the code
-                section_attributes.append(attr.attribute_id)
-
-        # Get related courses (courses in same department with similar numbers)
-        related_query = text("""
-            SELECT 
-                c.code as code,
-                c.name as name,
-                CASE 
-                    WHEN ABS(c.course_number::int - :course_num_int) <= 10 THEN 95
-                    WHEN ABS(c.course_number::int - :course_num_int) <= 50 THEN 78
-                    ELSE 72
-                END as similarity
-            FROM courses c
-            WHERE c.subject_id = :dept 
-              AND c.course_number != :course_num
-              AND ABS(c.course_number::int - :course_num_int) <= 100
-            ORDER BY similarity DESC, c.course_number::int
-            LIMIT 3
-        """)
-
-        related_result = db.execute(
-            related_query,
-            {"dept": dept, "course_num": course_num, "course_num_int": int(course_num)},
-        )
-        related_courses = []
-        for rel in related_result:
-            related_courses.append(
-                {"code": rel.code, "name": rel.name, "similarity": int(rel.similarity)}
-            )
-
         course_details = {
             "code": course_result.code,
             "name": course_result.name,
@@ -2972,8 +2755,8 @@ async def get_course_details(
             "crossListings": list(course_result.cross_listings)
             if course_result.cross_listings
             else [],
-            "relatedCourses": related_courses,
-            "sectionAttributes": section_attributes,
+            "relatedCourses": course_result.related_courses or [],
+            "sectionAttributes": course_result.section_attributes,
         }
 
         return course_details
@@ -3089,7 +2872,7 @@ async def get_course_details(
 @limiter.limit("60/minute")
 @cached(ttl=TTL_WEEK)  # 1 week cache
 async def get_course_professors(
-    request: Request, course_id: str, db: Session = Depends(get_db_session)
+    request: Request, course_id: str, db: AsyncSession = Depends(get_async_db_session)
 ) -> List[Dict[str, Any]]:
     """
     Get all professors who teach a specific course
@@ -3102,9 +2885,7 @@ async def get_course_professors(
     """
     try:
         # Parse course_id (e.g., "CSCE120" -> dept="CSCE", course_num="120")
-        import re
-
-        match = re.match(r"^([A-Z]+)(\d+)$", course_id.upper())
+        match = _COURSE_ID_RE.match(course_id.upper())
         if not match:
             raise HTTPException(
                 status_code=400,
@@ -3133,7 +2914,9 @@ async def get_course_professors(
             ORDER BY ps.total_reviews DESC
         """)
 
-        professors_result = db.execute(professors_query, {"course_code": course_code})
+        professors_result = await db.execute(
+            professors_query, {"course_code": course_code}
+        )
         prof_rows = professors_result.fetchall()
 
         if not prof_rows:
@@ -3157,7 +2940,7 @@ async def get_course_professors(
               AND would_take_again IS NOT NULL
             GROUP BY professor_id
         """)
-        wta_result = db.execute(
+        wta_result = await db.execute(
             would_take_again_query, {"professor_ids": professor_ids}
         )
         wta_by_prof = {
@@ -3176,19 +2959,18 @@ async def get_course_professors(
                 ps.total_reviews as reviews_count,
                 COALESCE(p.avg_rating, NULL) as avg_rating
             FROM professor_summaries_new ps
-            LEFT JOIN courses c ON c.subject_id || c.course_number = ps.course_code
+            LEFT JOIN courses c ON c.course_code = ps.course_code
             LEFT JOIN professors p ON ps.professor_id = p.id
             WHERE ps.professor_id = ANY(:professor_ids)
             ORDER BY ps.professor_id, ps.total_reviews DESC
         """)
-        courses_result = db.execute(all_courses_query, {"professor_ids": professor_ids})
+        courses_result = await db.execute(
+            all_courses_query, {"professor_ids": professor_ids}
+        )
 
-        courses_by_prof: Dict[str, List[Dict[str, Any]]] = {}
-        depts_by_prof: Dict[str, set[str]] = {}
+        courses_by_prof: Dict[str, List[Dict[str, Any]]] = defaultdict(list)
+        depts_by_prof: Dict[str, set[str]] = defaultdict(set)
         for row in courses_result:
-            if row.professor_id not in courses_by_prof:
-                courses_by_prof[row.professor_id] = []
-                depts_by_prof[row.professor_id] = set()
             courses_by_prof[row.professor_id].append(
                 {
                     "course_id": row.course_id,
@@ -3198,7 +2980,7 @@ async def get_course_professors(
                 }
             )
             # Extract department from course_id
-            dept_match = re.match(r"^([A-Z]+)", row.course_id or "")
+            dept_match = _DEPT_PREFIX_RE.match(row.course_id or "")
             if dept_match:
                 depts_by_prof[row.professor_id].add(dept_match.group(1))
 
@@ -3221,7 +3003,7 @@ async def get_course_professors(
                     COALESCE(c.name, 'Course') as course_name,
                     ROW_NUMBER() OVER (PARTITION BY r.professor_id ORDER BY r.review_date DESC) as rn
                 FROM reviews r
-                LEFT JOIN courses c ON c.subject_id || c.course_number = r.course_code
+                LEFT JOIN courses c ON c.course_code = r.course_code
                 WHERE r.professor_id = ANY(:professor_ids)
                   AND r.course_code = :course_code
                   AND r.review_text IS NOT NULL
@@ -3230,16 +3012,13 @@ async def get_course_professors(
             SELECT * FROM ranked_reviews WHERE rn <= 3
             ORDER BY professor_id, rn
         """)
-        reviews_result = db.execute(
+        reviews_result = await db.execute(
             recent_reviews_query,
             {"professor_ids": professor_ids, "course_code": course_code},
         )
 
-        reviews_by_prof: Dict[str, List[Dict[str, Any]]] = {}
+        reviews_by_prof: Dict[str, List[Dict[str, Any]]] = defaultdict(list)
         for review in reviews_result:
-            if review.professor_id not in reviews_by_prof:
-                reviews_by_prof[review.professor_id] = []
-
             overall_rating = (
                 round(
                     (
@@ -3250,26 +3029,13 @@ async def get_course_professors(
                     / 3,
                     1,
                 )
-                if any(
-                    [
-                        review.clarity_rating,
-                        review.difficulty_rating,
-                        review.helpful_rating,
-                    ]
-                )
+                if review.clarity_rating
+                or review.difficulty_rating
+                or review.helpful_rating
                 else 0
             )
 
-            tags = []
-            if review.rating_tags:
-                try:
-                    tags = (
-                        json.loads(review.rating_tags)
-                        if isinstance(review.rating_tags, str)
-                        else review.rating_tags
-                    )
-                except Exception:
-                    tags = []
+            tags = review.rating_tags or []
 
             reviews_by_prof[review.professor_id].append(
                 {
@@ -3549,7 +3315,7 @@ async def get_course_professor_reviews(
     professor_id: str,
     limit: int = 50,
     skip: int = 0,
-    db: Session = Depends(get_db_session),
+    db: AsyncSession = Depends(get_async_db_session),
 ) -> Dict[str, Any]:
     """
     Get all reviews for a specific course and professor combination
@@ -3567,9 +3333,7 @@ async def get_course_professor_reviews(
     """
     try:
         # Parse course_id (e.g., "CSCE120" -> dept="CSCE", course_num="120")
-        import re
-
-        match = re.match(r"^([A-Z]+)(\d+)$", course_id.upper())
+        match = _COURSE_ID_RE.match(course_id.upper())
         if not match:
             raise HTTPException(
                 status_code=400,
@@ -3585,8 +3349,8 @@ async def get_course_professor_reviews(
             WHERE id = :professor_id
         """)
 
-        professor_result = db.execute(
-            professor_query, {"professor_id": professor_id}
+        professor_result = (
+            await db.execute(professor_query, {"professor_id": professor_id})
         ).fetchone()
 
         if not professor_result:
@@ -3628,7 +3392,7 @@ async def get_course_professor_reviews(
             "course_code_format3": course_num,  # 120
         }
 
-        reviews_result = db.execute(
+        reviews_result = await db.execute(
             reviews_query,
             {
                 "professor_id": professor_id,
@@ -3651,13 +3415,9 @@ async def get_course_professor_reviews(
                     / 3,
                     1,
                 )
-                if any(
-                    [
-                        review.clarity_rating,
-                        review.difficulty_rating,
-                        review.helpful_rating,
-                    ]
-                )
+                if review.clarity_rating
+                or review.difficulty_rating
+                or review.helpful_rating
                 else 0
             )
 
@@ -3713,8 +3473,10 @@ async def get_course_professor_reviews(
                    OR course_code = :course_code_format3)
         """)
 
-        count_result = db.execute(
-            count_query, {"professor_id": professor_id, **course_formats}
+        count_result = (
+            await db.execute(
+                count_query, {"professor_id": professor_id, **course_formats}
+            )
         ).fetchone()
 
         total_reviews = count_result.total if count_result else 0
@@ -3886,7 +3648,7 @@ async def get_course_professor_reviews(
 async def compare_courses(
     http_request: Request,
     request: CourseCompareRequest,
-    db: Session = Depends(get_db_session),
+    db: AsyncSession = Depends(get_async_db_session),
 ) -> List[Dict[str, Any]]:
     """
     Bulk fetch course details for comparison
@@ -3911,9 +3673,7 @@ async def compare_courses(
 
         for course_id in request.course_ids:
             # Parse course_id (e.g., "CSCE120" -> dept="CSCE", course_num="120")
-            import re
-
-            match = re.match(r"^([A-Z]+)(\d+)$", course_id.upper())
+            match = _COURSE_ID_RE.match(course_id.upper())
             if not match:
                 # Skip invalid course IDs rather than failing the entire request
                 continue
@@ -3937,7 +3697,7 @@ async def compare_courses(
                       AND gpa IS NOT NULL AND total_students > 0
                     GROUP BY dept, course_number
                 ),
-                current_term AS (
+                current_term AS MATERIALIZED (
                     -- Get most recent College Station term (term_code ending in 1)
                     SELECT MAX(term_code) as term_code 
                     FROM sections 
@@ -3991,8 +3751,8 @@ async def compare_courses(
                 LIMIT 1
             """)
 
-            course_result = db.execute(
-                course_query, {"dept": dept, "course_num": course_num}
+            course_result = (
+                await db.execute(course_query, {"dept": dept, "course_num": course_num})
             ).fetchone()
 
             if not course_result:
@@ -4012,7 +3772,7 @@ async def compare_courses(
                 LIMIT 5
             """)
 
-            professors_result = db.execute(
+            professors_result = await db.execute(
                 professors_query, {"course_code": course_id.upper()}
             )
             professors = []
@@ -4039,7 +3799,7 @@ async def compare_courses(
                 ORDER BY sa.attribute_id
             """)
 
-            section_attrs_result = db.execute(
+            section_attrs_result = await db.execute(
                 section_attrs_query, {"dept": dept, "course_num": course_num}
             )
             section_attributes = []
@@ -4059,8 +3819,8 @@ async def compare_courses(
                   AND difficulty_rating IS NOT NULL
             """)
 
-            rating_result = db.execute(
-                rating_query, {"course_code": course_id.upper()}
+            rating_result = (
+                await db.execute(rating_query, {"course_code": course_id.upper()})
             ).fetchone()
             course_rating = (
                 float(rating_result.course_rating)
@@ -4186,7 +3946,7 @@ async def get_professors(
     limit: int = 30,
     skip: int = 0,
     min_rating: Optional[float] = None,
-    db: Session = Depends(get_db_session),
+    db: AsyncSession = Depends(get_async_db_session),
 ) -> List[Dict[str, Any]]:
     """
     List all professors with basic statistics
@@ -4213,14 +3973,16 @@ async def get_professors(
         params: Dict[str, Any] = {"limit": limit, "skip": skip}
 
         if search:
+            # Full-name match subsumes first/last name matches and can use
+            # the idx_prof_fullname_trgm trigram index
             where_conditions.append(
-                "(p.first_name ILIKE :search OR p.last_name ILIKE :search OR (p.first_name || ' ' || p.last_name) ILIKE :search)"
+                "(p.first_name || ' ' || p.last_name) ILIKE :search"
             )
             params["search"] = f"%{search}%"
 
         if department:
             where_conditions.append(
-                "EXISTS (SELECT 1 FROM professor_summaries_new ps WHERE ps.professor_id = p.id AND SUBSTRING(ps.course_code FROM '^[A-Z]+') = :department)"
+                "EXISTS (SELECT 1 FROM professor_summaries_new ps WHERE ps.professor_id = p.id AND ps.dept = :department)"
             )
             params["department"] = department.upper()
 
@@ -4242,7 +4004,7 @@ async def get_professors(
                     COUNT(DISTINCT ps.course_code) as total_courses,
                     SUM(ps.total_reviews) as total_reviews,
                     p.avg_rating as overall_rating,
-                    ARRAY_AGG(DISTINCT SUBSTRING(ps.course_code FROM '^[A-Z]+')) as departments,
+                    ARRAY_AGG(DISTINCT ps.dept) as departments,
                     ARRAY_AGG(DISTINCT ps.course_code) as courses_taught
                 FROM professor_summaries_new ps
                 JOIN professors p ON ps.professor_id = p.id
@@ -4264,7 +4026,7 @@ async def get_professors(
             LIMIT :limit OFFSET :skip
         """)
 
-        result = db.execute(professors_query, params)
+        result = await db.execute(professors_query, params)
         professors = []
 
         for row in result:
@@ -4276,10 +4038,8 @@ async def get_professors(
                     if row.overall_rating
                     else 3.0,
                     "total_reviews": int(row.total_reviews) if row.total_reviews else 0,
-                    "departments": list(row.departments) if row.departments else [],
-                    "courses_taught": list(row.courses_taught)
-                    if row.courses_taught
-                    else [],
+                    "departments": row.departments,
+                    "courses_taught": row.courses_taught,
                 }
             )
 
@@ -4321,15 +4081,13 @@ async def find_professor(
     name: str = Query(..., description="Professor name to search (e.g. 'Smith, John')"),
     limit: int = 5,
     min_score: float = 20.0,
-    db: Session = Depends(get_db_session),
+    db: AsyncSession = Depends(get_async_db_session),
 ) -> Dict[str, Any]:
     """Fuzzy lookup professor by name and return RateMyProf ID if available.
 
     Uses PostgreSQL similarity functions for fuzzy matching when available,
     falls back to token-based scoring for multi-part names.
     """
-    import re
-
     from sqlalchemy.exc import ProgrammingError
 
     # Clean and normalize the input name
@@ -4338,7 +4096,7 @@ async def find_professor(
         raise HTTPException(status_code=400, detail="Name cannot be empty")
 
     # Split into tokens for fallback scoring
-    tokens = [t.strip().lower() for t in re.split(r"[ ,]+", name) if t.strip()]
+    tokens = [t.strip().lower() for t in _NAME_SEPARATOR_RE.split(name) if t.strip()]
 
     try:
         # First, try using PostgreSQL's similarity function (requires pg_trgm extension)
@@ -4360,7 +4118,7 @@ async def find_professor(
             LIMIT :limit
         """)
 
-        result = db.execute(
+        result = await db.execute(
             similarity_query,
             {"search_name": name, "min_score": min_score, "limit": limit},
         )
@@ -4378,8 +4136,9 @@ async def find_professor(
         return {"matches": matches}
 
     except ProgrammingError:
-        # pg_trgm extension not available, fall back to token-based scoring
-        pass
+        # pg_trgm extension not available, fall back to token-based scoring;
+        # the failed statement aborted the transaction, so reset it first
+        await db.rollback()
 
     # Fallback: Token-based fuzzy matching
     if not tokens:
@@ -4425,7 +4184,7 @@ async def find_professor(
 
     params["exact_name"] = name
 
-    result = db.execute(fallback_query, params)
+    result = await db.execute(fallback_query, params)
     matches = [
         {
             "id": row.id,
@@ -4439,6 +4198,67 @@ async def find_professor(
     return {"matches": matches}
 
 
+def build_professor_profile(
+    prof: Any, course_lookup: Dict[str, Tuple[Optional[str], Optional[str]]]
+) -> Dict[str, Any]:
+    """Shape one PROFESSOR_PROFILES_SQL row into a professor profile"""
+    avg_rating = float(prof.avg_rating) if prof.avg_rating else 3.0
+    courses = [
+        {
+            "course_id": course["course_id"],
+            "course_name": course_lookup.get(course["course_id"], (None, None))[0]
+            or "Course Title",
+            "reviews_count": int(course["reviews_count"] or 0),
+            "avg_rating": avg_rating,
+        }
+        for course in prof.courses or []
+    ]
+
+    # Built in the response shape by SQL; only the course name is added here
+    recent_reviews: List[Dict[str, Any]] = prof.recent_reviews or []
+    for review in recent_reviews:
+        review["course_name"] = (
+            course_lookup.get(review["course_code"], (None, None))[0] or "Course"
+        )
+
+    return {
+        "id": prof.id,
+        "name": prof.name,
+        "overall_rating": avg_rating,
+        "total_reviews": int(prof.total_reviews or 0),
+        "would_take_again_percent": float(prof.would_take_again_percent)
+        if prof.would_take_again_percent
+        else 0.0,
+        "courses": courses,
+        "departments": prof.departments,
+        "recent_reviews": recent_reviews,
+        "tag_frequencies": prof.tag_frequencies or {},
+        "overallSummary": {
+            "sentiment": prof.overall_sentiment,
+            "strengths": list(prof.strengths) if prof.strengths else [],
+            "complaints": list(prof.complaints) if prof.complaints else [],
+            "consistency": prof.consistency,
+            "confidence": float(prof.confidence) if prof.confidence else None,
+        }
+        if prof.has_summary
+        else None,
+    }
+
+
+async def fetch_professor_profiles(
+    db: AsyncSession, professor_ids: Sequence[str]
+) -> Dict[str, Dict[str, Any]]:
+    """Build profiles keyed by id; ids with no professor are left out"""
+    rows = (
+        await db.execute(PROFESSOR_PROFILES_SQL, {"professor_ids": list(professor_ids)})
+    ).fetchall()
+    if not rows:
+        return {}
+
+    course_lookup = await get_course_lookup(db)
+    return {row.id: build_professor_profile(row, course_lookup) for row in rows}
+
+
 @app.get(
     "/professor/{professor_id}",
     responses={
@@ -4631,7 +4451,9 @@ async def find_professor(
 @limiter.limit("60/minute")
 @cached(ttl=TTL_WEEK)  # 1 week cache
 async def get_professor_profile(
-    request: Request, professor_id: str, db: Session = Depends(get_db_session)
+    request: Request,
+    professor_id: str,
+    db: AsyncSession = Depends(get_async_db_session),
 ) -> Dict[str, Any]:
     """
     Professor profile with comprehensive details
@@ -4644,258 +4466,19 @@ async def get_professor_profile(
 
     """
     try:
-        # Get professor basic info
-        professor_query = text("""
-            SELECT 
-                p.id,
-                p.first_name || ' ' || p.last_name as name,
-                p.first_name,
-                p.last_name
-            FROM professors p
-            WHERE p.id = :professor_id
-        """)
+        profiles = await fetch_professor_profiles(db, [professor_id])
+        professor_profile = profiles.get(professor_id)
 
-        professor_result = db.execute(
-            professor_query, {"professor_id": professor_id}
-        ).fetchone()
-
-        if not professor_result:
+        if professor_profile is None:
             raise HTTPException(status_code=404, detail="Professor not found")
 
-        # Get professor statistics and courses
-        stats_query = text("""
-            WITH professor_stats AS (
-                SELECT 
-                    ps.course_code,
-                    ps.total_reviews,
-                    ps.confidence,
-                    c.name,
-                    p.avg_rating,
-                    p.avg_difficulty
-                FROM professor_summaries_new ps
-                LEFT JOIN courses c ON c.subject_id || c.course_number = ps.course_code
-                JOIN professors p ON ps.professor_id = p.id
-                WHERE ps.professor_id = :professor_id
-                  AND ps.course_code IS NOT NULL
-            )
-            SELECT 
-                COUNT(course_code) as total_courses,
-                SUM(total_reviews) as total_reviews,
-                AVG(avg_rating) as overall_rating,
-                ARRAY_AGG(DISTINCT SUBSTRING(course_code FROM '^[A-Z]+')) as departments
-            FROM professor_stats
-        """)
-
-        stats_result = db.execute(
-            stats_query, {"professor_id": professor_id}
-        ).fetchone()
-
-        # Get would_take_again percentage from reviews
-        would_take_again_query = text("""
-            SELECT 
-                ROUND(
-                    AVG(CASE WHEN would_take_again = 1 THEN 100.0 ELSE 0.0 END)::numeric, 
-                    1
-                ) as would_take_again_percent
-            FROM reviews 
-            WHERE professor_id = :professor_id 
-              AND would_take_again IS NOT NULL
-        """)
-
-        would_take_again_result = db.execute(
-            would_take_again_query, {"professor_id": professor_id}
-        ).fetchone()
-
-        # Get courses taught by professor and overall tag frequencies
-        courses_query = text("""
-            SELECT 
-                ps.course_code as course_id,
-                COALESCE(c.name, 'Course Title') as course_name,
-                ps.total_reviews as reviews_count,
-                COALESCE(p.avg_rating, NULL) as avg_rating
-            FROM professor_summaries_new ps
-            LEFT JOIN courses c ON c.subject_id || c.course_number = ps.course_code
-            LEFT JOIN professors p ON ps.professor_id = p.id
-            WHERE ps.professor_id = :professor_id
-            ORDER BY ps.total_reviews DESC
-        """)
-
-        courses_result = db.execute(courses_query, {"professor_id": professor_id})
-        courses = []
-
-        for course in courses_result:
-            courses.append(
-                {
-                    "course_id": course.course_id,
-                    "course_name": course.course_name,
-                    "reviews_count": int(course.reviews_count)
-                    if course.reviews_count
-                    else 0,
-                    "avg_rating": float(course.avg_rating)
-                    if course.avg_rating
-                    else 3.0,
-                }
-            )
-
-        # Get overall professor summary (course_code IS NULL in new schema)
-        overall_summary_query = text("""
-            SELECT 
-                ps.overall_sentiment,
-                ps.strengths,
-                ps.complaints,
-                ps.consistency,
-                ps.confidence,
-                ps.total_reviews
-            FROM professor_summaries_new ps
-            WHERE ps.professor_id = :professor_id
-              AND ps.course_code IS NULL
-            LIMIT 1
-        """)
-
-        overall_summary_result = db.execute(
-            overall_summary_query, {"professor_id": professor_id}
-        ).fetchone()
-
-        overall_summary = None
-        strengths = []
-        complaints = []
-        if overall_summary_result:
-            overall_summary = overall_summary_result.overall_sentiment
-            strengths = (
-                list(overall_summary_result.strengths)
-                if overall_summary_result.strengths
-                else []
-            )
-            complaints = (
-                list(overall_summary_result.complaints)
-                if overall_summary_result.complaints
-                else []
-            )
+        return professor_profile
 
-        # Get recent reviews (last 5)
-        recent_reviews_query = text("""
-            SELECT 
-                r.id,
-                r.review_text,
-                r.clarity_rating,
-                r.difficulty_rating,
-                r.helpful_rating,
-                r.would_take_again,
-                r.grade,
-                r.review_date,
-                r.course_code,
-                r.rating_tags,
-                COALESCE(c.name, 'Course') as course_name
-            FROM reviews r
-            LEFT JOIN courses c ON c.subject_id || c.course_number = r.course_code
-            WHERE r.professor_id = :professor_id
-              AND r.review_text IS NOT NULL
-              AND r.review_text != ''
-            ORDER BY r.review_date DESC
-            LIMIT 5
-        """)
-
-        recent_reviews_result = db.execute(
-            recent_reviews_query, {"professor_id": professor_id}
-        )
-        recent_reviews = []
-
-        for review in recent_reviews_result:
-            # Calculate overall rating from individual ratings
-            overall_rating = (
-                round(
-                    (
-                        (review.clarity_rating or 0)
-                        + (6 - (review.difficulty_rating or 3))
-                        + (review.helpful_rating or 0)
-                    )
-                    / 3,
-                    1,
-                )
-                if any(
-                    [
-                        review.clarity_rating,
-                        review.difficulty_rating,
-                        review.helpful_rating,
-                    ]
-                )
-                else 0
-            )
-
-            # Parse rating tags
-            tags = []
-            if review.rating_tags:
-                try:
-                    tags = (
-                        json.loads(review.rating_tags)
-                        if isinstance(review.rating_tags, str)
-                        else review.rating_tags
-                    )
-                except Exception as e:
-                    tags = []
-                    logger.debug(f"Failed to parse rating_tags: {e}")
-
-            recent_reviews.append(
-                {
-                    "id": review.id,
-                    "course_code": review.course_code,
-                    "course_name": review.course_name,
-                    "review_text": review.review_text,
-                    "overall_rating": overall_rating,
-                    "would_take_again": review.would_take_again == 1
-                    if review.would_take_again is not None
-                    else None,
-                    "grade": review.grade,
-                    "review_date": review.review_date.isoformat()
-                    if review.review_date
-                    else None,
-                    "tags": tags,
-                }
-            )
-
-        # Build professor profile
-        professor_profile = {
-            "id": professor_result.id,
-            "name": professor_result.name,
-            "overall_rating": float(stats_result.overall_rating)
-            if stats_result and stats_result.overall_rating
-            else 3.0,
-            "total_reviews": int(stats_result.total_reviews)
-            if stats_result and stats_result.total_reviews
-            else 0,
-            "would_take_again_percent": float(
-                would_take_again_result.would_take_again_percent
-            )
-            if would_take_again_result
-            and would_take_again_result.would_take_again_percent
-            else 0.0,
-            "courses": courses,
-            "departments": list(stats_result.departments)
-            if stats_result and stats_result.departments and stats_result.departments[0]
-            else [],
-            "recent_reviews": recent_reviews,
-            "overallSummary": {
-                "sentiment": overall_summary,
-                "strengths": strengths,
-                "complaints": complaints,
-                "consistency": overall_summary_result.consistency
-                if overall_summary_result and overall_summary_result.consistency
-                else None,
-                "confidence": float(overall_summary_result.confidence)
-                if overall_summary_result and overall_summary_result.confidence
-                else None,
-            }
-            if overall_summary_result
-            else None,
-        }
-
-        return professor_profile
-
-    except HTTPException:
-        raise
-    except Exception as e:
-        logger.error(f"Error in get_professor_profile: {str(e)}")
-        raise HTTPException(status_code=500, detail=f"Database error: {str(e)}")
+    except HTTPException:
+        raise
+    except Exception as e:
+        logger.error(f"Error in get_professor_profile: {str(e)}")
+        raise HTTPException(status_code=500, detail=f"Database error: {str(e)}")
 
 
 @app.get(
@@ -5060,6 +4643,7 @@ async def get_professor_profile(
     },
     summary="/professor/{professor_id}/reviews",
     description="Returns all reviews for a professor with detailed ratings, review text, grades, and filtering options. Supports course filtering, sorting, and pagination.",
+    response_model=None,
 )
 @limiter.limit("60/minute")
 @cached(ttl=TTL_WEEK)  # 1 week cache
@@ -5067,13 +4651,22 @@ async def get_professor_reviews(
     request: Request,
     professor_id: str,
     course_filter: Optional[str] = None,
-    limit: int = 50,
-    skip: int = 0,
-    sort_by: str = "date",
-    min_rating: Optional[float] = None,
-    max_rating: Optional[float] = None,
-    db: Session = Depends(get_db_session),
-) -> List[Dict[str, Any]]:
+    limit: int = Query(
+        50,
+        ge=1,
+        le=MAX_REVIEWS_PAGE_SIZE,
+        description="Number of reviews to return",
+    ),
+    skip: int = Query(0, ge=0, le=10000, description="Number of reviews to skip"),
+    sort_by: Literal["date", "rating", "course"] = "date",
+    min_rating: Optional[float] = Query(
+        None, ge=1.0, le=5.0, description="Minimum overall rating"
+    ),
+    max_rating: Optional[float] = Query(
+        None, ge=1.0, le=5.0, description="Maximum overall rating"
+    ),
+    db: AsyncSession = Depends(get_async_db_session),
+) -> List[ProfessorReview]:
     """
     All reviews for professor across all courses
 
@@ -5085,8 +4678,8 @@ async def get_professor_reviews(
 
     **Query Parameters:**
     - `course_filter`: Filter by specific course code (optional)
-    - `limit`: Number of reviews to return (default: 50)
-    - `skip`: Number of reviews to skip for pagination (default: 0)
+    - `limit`: Number of reviews to return (default: 50, max: 200)
+    - `skip`: Number of reviews to skip for pagination (default: 0, max: 10000)
     - `sort_by`: Sort order - "date", "rating", or "course" (default: "date")
     - `min_rating`: Minimum rating filter (1.0-5.0)
     - `max_rating`: Maximum rating filter (1.0-5.0)
@@ -5098,12 +4691,11 @@ async def get_professor_reviews(
     """
     try:
         # Verify professor exists
-        professor_check = db.execute(
-            text("SELECT id FROM professors WHERE id = :professor_id"),
-            {"professor_id": professor_id},
-        ).fetchone()
+        professor_exists = (
+            await db.execute(PROFESSOR_EXISTS_SQL, {"professor_id": professor_id})
+        ).scalar()
 
-        if not professor_check:
+        if not professor_exists:
             raise HTTPException(status_code=404, detail="Professor not found")
 
         # Build WHERE conditions
@@ -5119,80 +4711,26 @@ async def get_professor_reviews(
             params["course_filter"] = course_filter.upper()
 
         if min_rating:
-            where_conditions.append(
-                "((r.clarity_rating + (6 - r.difficulty_rating) + r.helpful_rating) / 3.0) >= :min_rating"
-            )
+            where_conditions.append("r.overall_rating_cached >= :min_rating")
             params["min_rating"] = min_rating
 
         if max_rating:
-            where_conditions.append(
-                "((r.clarity_rating + (6 - r.difficulty_rating) + r.helpful_rating) / 3.0) <= :max_rating"
-            )
+            where_conditions.append("r.overall_rating_cached <= :max_rating")
             params["max_rating"] = max_rating
 
-        where_clause = " AND ".join(where_conditions)
-
-        # Determine sort order
-        sort_order = "r.review_date DESC"
-        if sort_by == "rating":
-            sort_order = "((r.clarity_rating + (6 - r.difficulty_rating) + r.helpful_rating) / 3.0) DESC NULLS LAST"
-        elif sort_by == "course":
-            sort_order = "r.course_code ASC, r.review_date DESC"
+        reviews_query = build_professor_reviews_query(tuple(where_conditions), sort_by)
 
-        # Get reviews with course information
-        reviews_query = text(f"""
-            SELECT 
-                r.id,
-                r.review_text,
-                r.clarity_rating,
-                r.difficulty_rating,
-                r.helpful_rating,
-                r.would_take_again,
-                r.attendance_mandatory,
-                r.is_online_class,
-                r.is_for_credit,
-                r.grade,
-                r.review_date,
-                r.textbook_use,
-                r.thumbs_up_total,
-                r.thumbs_down_total,
-                r.rating_tags,
-                r.teacher_note,
-                r.course_code,
-                COALESCE(c.name, 'Course') as course_name,
-                c.subject_long_name as department_name
-            FROM reviews r
-            LEFT JOIN courses c ON c.subject_id || c.course_number = r.course_code
-            WHERE {where_clause}
-              AND r.review_text IS NOT NULL
-              AND r.review_text != ''
-            ORDER BY {sort_order}
-            LIMIT :limit OFFSET :skip
-        """)
-
-        result = db.execute(reviews_query, params)
-        reviews = []
+        result = await db.execute(reviews_query, params)
+        course_lookup = await get_course_lookup(db)
+        reviews: List[ProfessorReview] = []
 
         for review in result:
-            # Calculate overall rating from individual ratings
+            course_name, department_name = course_lookup.get(
+                review.course_code, (None, None)
+            )
+
             overall_rating = (
-                round(
-                    (
-                        (review.clarity_rating or 0)
-                        + (6 - (review.difficulty_rating or 3))
-                        + (review.helpful_rating or 0)
-                    )
-                    / 3,
-                    1,
-                )
-                if any(
-                    [
-                        review.clarity_rating,
-                        review.difficulty_rating,
-                        review.helpful_rating,
-                    ]
-                )
-                else 0
+                float(review.overall_rating) if review.overall_rating is not None else 0
             )
 
             # Convert would_take_again to boolean
@@ -5202,45 +4740,35 @@ async def get_professor_reviews(
                 else None
             )
 
-            # Parse rating tags
-            tags = []
-            if review.rating_tags:
-                try:
-                    tags = (
-                        json.loads(review.rating_tags)
-                        if isinstance(review.rating_tags, str)
-                        else review.rating_tags
-                    )
-                except Exception as e:
-                    tags = []
-                    logger.debug(f"Failed to parse rating_tags: {e}")
-
-            review_data = {
-                "id": review.id,
-                "course_code": review.course_code,
-                "course_name": review.course_name,
-                "department_name": review.department_name,
-                "review_text": review.review_text,
-                "overall_rating": overall_rating,
-                "clarity_rating": review.clarity_rating,
-                "difficulty_rating": review.difficulty_rating,
-                "helpful_rating": review.helpful_rating,
-                "would_take_again": would_take_again,
-                "attendance_mandatory": review.attendance_mandatory,
-                "is_online_class": review.is_online_class,
-                "is_for_credit": review.is_for_credit,
-                "grade": review.grade,
-                "review_date": review.review_date.isoformat()
-                if review.review_date
-                else None,
-                "textbook_use": review.textbook_use,
-                "thumbs_up": review.thumbs_up_total or 0,
-                "thumbs_down": review.thumbs_down_total or 0,
-                "tags": tags,
-                "teacher_note": review.teacher_note,
-            }
+            # rating_tags is a text[] column, so the driver returns a list
+            tags = review.rating_tags or []
 
-            reviews.append(review_data)
+            reviews.append(
+                ProfessorReview(
+                    id=review.id,
+                    course_code=review.course_code,
+                    course_name=course_name or "Course",
+                    department_name=department_name,
+                    review_text=review.review_text,
+                    overall_rating=overall_rating,
+                    clarity_rating=review.clarity_rating,
+                    difficulty_rating=review.difficulty_rating,
+                    helpful_rating=review.helpful_rating,
+                    would_take_again=would_take_again,
+                    attendance_mandatory=review.attendance_mandatory,
+                    is_online_class=review.is_online_class,
+                    is_for_credit=review.is_for_credit,
+                    grade=review.grade,
+                    review_date=review.review_date.isoformat()
+                    if review.review_date
+                    else None,
+                    textbook_use=review.textbook_use,
+                    thumbs_up=review.thumbs_up_total or 0,
+                    thumbs_down=review.thumbs_down_total or 0,
+                    tags=tags,
+                    teacher_note=review.teacher_note,
+                )
+            )
 
         return reviews
 
@@ -5251,6 +4779,60 @@ async def get_professor_reviews(
         raise HTTPException(status_code=500, detail=f"Database error: {str(e)}")
 
 
+def encode_search_cursor(
+    total_reviews: int, last_name: str, first_name: str, professor_id: str
+) -> str:
+    """Encode the sort key of the last search result as an opaque cursor"""
+    payload = json.dumps([total_reviews, last_name, first_name, professor_id])
+    return base64.urlsafe_b64encode(payload.encode()).decode()
+
+
+def decode_search_cursor(cursor: str) -> Tuple[int, str, str, str]:
+    """Decode a cursor produced by encode_search_cursor"""
+    try:
+        total_reviews, last_name, first_name, professor_id = json.loads(
+            base64.urlsafe_b64decode(cursor.encode())
+        )
+        return int(total_reviews), str(last_name), str(first_name), str(professor_id)
+    except Exception:
+        raise HTTPException(status_code=400, detail="Invalid cursor")
+
+
+def format_search_professor(r: Any) -> Dict[str, Any]:
+    """Shape one professor search row for the response"""
+    # Counters and arrays are already COALESCEd in SQL, so only the nullable
+    # rating and the NUMERIC percentage need converting
+    return {
+        "id": r["id"],
+        "name": r["name"],
+        "overall_rating": r["overall_rating"] or 3.0,
+        "total_reviews": r["total_reviews"],
+        "would_take_again_percent": float(r["would_take_again_percent"]),
+        "departments": r["departments"],
+        "courses_taught": r["courses_taught"],
+        "total_courses": r["total_courses"],
+        **({"course_titles": r["course_titles"]} if r["course_titles"] else {}),
+    }
+
+
+def stream_professor_search(
+    search_query: TextClause, params: Dict[str, Any]
+) -> Iterator[bytes]:
+    """Yield search results as NDJSON lines from a server-side cursor"""
+    # Runs after the endpoint has returned, so it owns its own session
+    session = get_session()
+    try:
+        result = session.execute(
+            search_query,
+            params,
+            execution_options={"stream_results": True, "max_row_buffer": 200},
+        )
+        for r in result.mappings():
+            yield orjson.dumps(format_search_professor(r)) + b"\n"
+    finally:
+        session.close()
+
+
 @app.get(
     "/professors/search",
     responses={
@@ -5284,6 +4866,7 @@ async def get_professor_reviews(
                             },
                         ],
                         "total_found": 2,
+                        "next_cursor": None,
                         "search_criteria": {
                             "name": "johnson",
                             "department": None,
@@ -5345,6 +4928,11 @@ async def get_professor_reviews(
                                 "type": "integer",
                                 "description": "Total professors matching criteria",
                             },
+                            "next_cursor": {
+                                "type": "string",
+                                "nullable": True,
+                                "description": "Cursor for the next page, null on the last page",
+                            },
                             "search_criteria": {
                                 "type": "object",
                                 "description": "Applied search filters",
@@ -5357,6 +4945,7 @@ async def get_professor_reviews(
     },
     summary="/professors/search",
     description="Advanced professor search with multiple criteria including name, department, rating, and courses taught. Returns detailed professor profiles.",
+    response_model=None,
 )
 @limiter.limit("60/minute")
 @cached(ttl=TTL_WEEK)  # 1 week cache
@@ -5368,8 +4957,9 @@ async def search_professors(
     courses_taught: Optional[str] = None,
     limit: int = 30,
     skip: int = 0,
-    db: Session = Depends(get_db_session),
-) -> Dict[str, Any]:
+    cursor: Optional[str] = None,
+    db: AsyncSession = Depends(get_async_db_session),
+) -> Union[Dict[str, Any], StreamingResponse]:
     """
     Advanced professor search with multiple criteria
 
@@ -5380,9 +4970,15 @@ async def search_professors(
     - `name`: Search by professor name (partial match)
     - `department`: Filter by department code (e.g., "CSCE", "MATH")
     - `min_rating`: Minimum rating filter (1.0-5.0)
-    - `courses_taught`: Filter by specific course code
+    - `courses_taught`: Filter by course code; comma-separate several codes
+      to match professors teaching any of them
     - `limit`: Number of results to return (default: 30)
     - `skip`: Number of results to skip for pagination (default: 0)
+    - `cursor`: `next_cursor` from the previous page; unlike `skip`, pages
+      don't shift when professors are added (when given, `skip` is ignored)
+
+    Send `Accept: application/x-ndjson` to stream one professor per line
+    instead of the JSON envelope; useful for large `limit` values.
 
     **Search Examples:**
     - `/professors/search?name=johnson` - Search for professors named Johnson
@@ -5396,108 +4992,81 @@ async def search_professors(
         params: Dict[str, Any] = {"limit": limit, "skip": skip}
 
         if name:
-            where_conditions.append(
-                "(p.first_name ILIKE :name OR p.last_name ILIKE :name OR (p.first_name || ' ' || p.last_name) ILIKE :name)"
-            )
+            # Full-name match subsumes first/last name matches and can use
+            # the idx_prof_fullname_trgm trigram index
+            where_conditions.append("(p.first_name || ' ' || p.last_name) ILIKE :name")
             params["name"] = f"%{name}%"
 
         if department:
             where_conditions.append(
-                "EXISTS (SELECT 1 FROM professor_summaries_new ps WHERE ps.professor_id = p.id AND SUBSTRING(ps.course_code FROM '^[A-Z]+') = :department)"
+                "EXISTS (SELECT 1 FROM professor_summaries_new ps WHERE ps.professor_id = p.id AND ps.dept = :department)"
             )
             params["department"] = department.upper()
 
-        if courses_taught:
+        course_codes = [
+            code.strip().upper() for code in (courses_taught or "").split(",")
+        ]
+        course_codes = [code for code in course_codes if code]
+        if course_codes:
+            # Filters on the raw summary rows (idx_ps_prof_course) so
+            # non-matching professors are dropped before any aggregation
             where_conditions.append(
-                "EXISTS (SELECT 1 FROM professor_summaries_new ps WHERE ps.professor_id = p.id AND ps.course_code = :courses_taught)"
+                "EXISTS (SELECT 1 FROM professor_summaries_new ps WHERE ps.professor_id = p.id AND ps.course_code = ANY(:courses_taught))"
             )
-            params["courses_taught"] = courses_taught.upper()
+            params["courses_taught"] = course_codes
 
         if min_rating:
-            where_conditions.append("pst.overall_rating >= :min_rating")
+            where_conditions.append(
+                "pst.summary_rows > 0 AND p.avg_rating >= :min_rating"
+            )
             params["min_rating"] = min_rating
 
-        where_clause = ""
-        if where_conditions:
-            where_clause = "WHERE " + " AND ".join(where_conditions)
-
-        # Advanced search query
-        search_query = text(f"""
-            WITH professor_stats AS (
-                SELECT 
-                    ps.professor_id,
-                    COUNT(DISTINCT ps.course_code) as total_courses,
-                    SUM(ps.total_reviews) as total_reviews,
-                    p.avg_rating as overall_rating,
-                    ARRAY_AGG(DISTINCT SUBSTRING(ps.course_code FROM '^[A-Z]+')) as departments,
-                    ARRAY_AGG(DISTINCT ps.course_code) as courses_taught,
-                    STRING_AGG(DISTINCT c.name, ', ') as course_titles
-                FROM professor_summaries_new ps
-                LEFT JOIN courses c ON c.subject_id || c.course_number = ps.course_code
-                JOIN professors p ON ps.professor_id = p.id
-                GROUP BY ps.professor_id, p.avg_rating
-            ),
-            would_take_again_stats AS (
-                SELECT 
-                    professor_id,
-                    ROUND(
-                        AVG(CASE WHEN would_take_again = 1 THEN 100.0 ELSE 0.0 END)::numeric, 
-                        1
-                    ) as would_take_again_percent
-                FROM reviews 
-                WHERE would_take_again IS NOT NULL
-                GROUP BY professor_id
+        if cursor:
+            # Keyset pagination: resume strictly after the last row of the
+            # previous page in (total_reviews DESC, last_name, first_name, id)
+            # order. total_reviews is aggregated per query, so every match is
+            # still counted and sorted; the cursor keeps pages stable while
+            # professors are added, it doesn't make deep pages cheaper
+            c_total_reviews, c_last_name, c_first_name, c_id = decode_search_cursor(
+                cursor
             )
-            SELECT 
-                p.id,
-                p.first_name || ' ' || p.last_name as name,
-                p.first_name,
-                p.last_name,
-                COALESCE(pst.overall_rating, NULL) as overall_rating,
-                COALESCE(pst.total_reviews, 0) as total_reviews,
-                COALESCE(wta.would_take_again_percent, 0.0) as would_take_again_percent,
-                COALESCE(pst.departments, ARRAY[]::text[]) as departments,
-                COALESCE(pst.courses_taught, ARRAY[]::text[]) as courses_taught,
-                COALESCE(pst.course_titles, '') as course_titles,
-                COALESCE(pst.total_courses, 0) as total_courses
-            FROM professors p
-            LEFT JOIN professor_stats pst ON p.id = pst.professor_id
-            LEFT JOIN would_take_again_stats wta ON p.id = wta.professor_id
-            {where_clause}
-            ORDER BY pst.total_reviews DESC NULLS LAST, p.last_name, p.first_name
-            LIMIT :limit OFFSET :skip
-        """)
+            where_conditions.append(
+                "(-COALESCE(pst.total_reviews, 0), p.last_name, p.first_name, p.id)"
+                " > (:c_neg_total_reviews, :c_last_name, :c_first_name, :c_id)"
+            )
+            params.update(
+                {
+                    "c_neg_total_reviews": -c_total_reviews,
+                    "c_last_name": c_last_name,
+                    "c_first_name": c_first_name,
+                    "c_id": c_id,
+                }
+            )
+            params["skip"] = 0
 
-        result = db.execute(search_query, params)
-        professors = []
+        search_query = build_professor_search_query(tuple(where_conditions))
 
-        for row in result:
-            professor_data = {
-                "id": row.id,
-                "name": row.name,
-                "overall_rating": float(row.overall_rating)
-                if row.overall_rating
-                else 3.0,
-                "total_reviews": int(row.total_reviews) if row.total_reviews else 0,
-                "would_take_again_percent": float(row.would_take_again_percent)
-                if row.would_take_again_percent
-                else 0.0,
-                "departments": list(row.departments) if row.departments else [],
-                "courses_taught": list(row.courses_taught)
-                if row.courses_taught
-                else [],
-                "total_courses": int(row.total_courses) if row.total_courses else 0,
-            }
+        if "application/x-ndjson" in request.headers.get("accept", ""):
+            return StreamingResponse(
+                stream_professor_search(search_query, params),
+                media_type="application/x-ndjson",
+            )
 
-            # Add course titles if available
-            if row.course_titles:
-                professor_data["course_titles"] = row.course_titles
+        rows = (await db.execute(search_query, params)).mappings().all()
+        professors = [format_search_professor(r) for r in rows]
 
-            professors.append(professor_data)
+        # A short page means there is nothing left to fetch
+        next_cursor = None
+        if rows and len(rows) == limit:
+            last = rows[-1]
+            next_cursor = encode_search_cursor(
+                last["total_reviews"], last["last_name"], last["first_name"], last["id"]
+            )
 
         return {
             "professors": professors,
             "total_found": len(professors),
+            "next_cursor": next_cursor,
             "search_criteria": {
                 "name": name,
                 "department": department,
@@ -5506,11 +5075,19 @@ async def search_professors(
             },
         }
 
+    except HTTPException:
+        raise
     except Exception as e:
         logger.error(f"Error in search_professors: {str(e)}")
         raise HTTPException(status_code=500, detail=f"Database error: {str(e)}")
 
 
+def compare_profile_cache_key(professor_id: str) -> str:
+    """Redis key for one professor's entry in /professors/compare"""
+    # Under api:/professor/{id} so invalidate_professor_cache clears it
+    return f"api:/professor/{professor_id}:compare"
+
+
 @app.get(
     "/professors/compare",
     responses={
@@ -5752,18 +5329,20 @@ async def search_professors(
         },
     },
     summary="/professors/compare",
-    description="Compare up to 10 professors side-by-side with ratings, courses taught, reviews, and tag frequencies. Query format: ?ids=prof1,prof2,prof3",
+    description="Compare up to 10 professors side-by-side with ratings, courses taught, reviews, and tag frequencies. Query format: ?ids=prof1&ids=prof2 or ?ids=prof1,prof2,prof3",
 )
 @limiter.limit("30/minute")
 @cached(ttl=TTL_WEEK)  # 1 week cache
 async def compare_professors(
     request: Request,
-    ids: str = Query(
+    ids: List[str] = Query(
         ...,
-        description="Comma-separated list of professor IDs (max 10)",
-        examples=["prof123,prof456,prof789"],
+        min_length=1,
+        max_length=10,
+        description="Professor IDs (max 10), repeated or comma-separated",
+        examples=[["prof123", "prof456", "prof789"]],
     ),
-    db: Session = Depends(get_db_session),
+    db: AsyncSession = Depends(get_async_db_session),
 ) -> List[Dict[str, Any]]:
     """
     Compare multiple professors by their IDs
@@ -5784,13 +5363,15 @@ async def compare_professors(
 
     **Example Usage:**
     - `/professors/compare?ids=prof123,prof456`
+    - `/professors/compare?ids=prof123&ids=prof456`
     - `/professors/compare?ids=smith_j1,johnson_m2,davis_l3`
     """
     try:
-        import re
-
-        # Parse comma-separated professor IDs
-        professor_ids = [pid.strip() for pid in ids.split(",") if pid.strip()]
+        # Repeated ids are validated by FastAPI (422 when missing or more
+        # than 10); the comma-separated form is split here and checked below
+        professor_ids = [
+            pid.strip() for value in ids for pid in value.split(",") if pid.strip()
+        ]
 
         if not professor_ids:
             raise HTTPException(status_code=400, detail="No professor IDs provided")
@@ -5800,225 +5381,28 @@ async def compare_professors(
                 status_code=400, detail="Too many professor IDs. Maximum 10 allowed."
             )
 
-        # BATCH 1: Get all professor basic info
-        professors_query = text("""
-            SELECT 
-                p.id,
-                p.first_name || ' ' || p.last_name as name,
-                p.avg_rating
-            FROM professors p
-            WHERE p.id = ANY(:professor_ids)
-        """)
-        professors_result = db.execute(
-            professors_query, {"professor_ids": professor_ids}
-        )
-        prof_rows = {row.id: row for row in professors_result}
-
-        if not prof_rows:
-            raise HTTPException(
-                status_code=404, detail="No valid professors found for the provided IDs"
-            )
-
-        # Use only the valid professor IDs
-        valid_ids = list(prof_rows.keys())
-
-        # BATCH 2: Get would_take_again for all professors
-        wta_query = text("""
-            SELECT 
-                professor_id,
-                ROUND(
-                    AVG(CASE WHEN would_take_again = 1 THEN 100.0 ELSE 0.0 END)::numeric, 
-                    1
-                ) as would_take_again_percent
-            FROM reviews 
-            WHERE professor_id = ANY(:professor_ids)
-              AND would_take_again IS NOT NULL
-            GROUP BY professor_id
-        """)
-        wta_result = db.execute(wta_query, {"professor_ids": valid_ids})
-        wta_by_prof = {
-            row.professor_id: float(row.would_take_again_percent)
-            if row.would_take_again_percent
-            else 0.0
-            for row in wta_result
+        # Profiles are cached per professor so overlapping comparisons reuse
+        # each other's work; only the ids missing from the cache hit the DB
+        cache_keys = {pid: compare_profile_cache_key(pid) for pid in professor_ids}
+        cached_profiles = await get_cached_many(list(cache_keys.values()))
+        profiles_by_id = {
+            pid: cached_profiles[key]
+            for pid, key in cache_keys.items()
+            if key in cached_profiles
         }
 
-        # BATCH 3: Get all courses and stats for all professors
-        courses_query = text("""
-            SELECT 
-                ps.professor_id,
-                ps.course_code as course_id,
-                COALESCE(c.name, 'Course Title') as course_name,
-                ps.total_reviews as reviews_count,
-                p.avg_rating
-            FROM professor_summaries_new ps
-            LEFT JOIN courses c ON c.subject_id || c.course_number = ps.course_code
-            LEFT JOIN professors p ON ps.professor_id = p.id
-            WHERE ps.professor_id = ANY(:professor_ids)
-              AND ps.course_code IS NOT NULL
-            ORDER BY ps.professor_id, ps.total_reviews DESC
-        """)
-        courses_result = db.execute(courses_query, {"professor_ids": valid_ids})
-
-        courses_by_prof: Dict[str, List[Dict[str, Any]]] = {}
-        depts_by_prof: Dict[str, set[str]] = {}
-        total_reviews_by_prof = {}
-        for row in courses_result:
-            if row.professor_id not in courses_by_prof:
-                courses_by_prof[row.professor_id] = []
-                depts_by_prof[row.professor_id] = set()
-                total_reviews_by_prof[row.professor_id] = 0
-            courses_by_prof[row.professor_id].append(
-                {
-                    "course_id": row.course_id,
-                    "course_name": row.course_name,
-                    "reviews_count": int(row.reviews_count) if row.reviews_count else 0,
-                    "avg_rating": float(row.avg_rating) if row.avg_rating else 3.0,
-                }
-            )
-            total_reviews_by_prof[row.professor_id] += (
-                int(row.reviews_count) if row.reviews_count else 0
-            )
-            dept_match = re.match(r"^([A-Z]+)", row.course_id or "")
-            if dept_match:
-                depts_by_prof[row.professor_id].add(dept_match.group(1))
-
-        # BATCH 4: Get overall summaries for all professors
-        summary_query = text("""
-            SELECT 
-                ps.professor_id,
-                ps.overall_sentiment,
-                ps.strengths,
-                ps.complaints,
-                ps.consistency,
-                ps.confidence
-            FROM professor_summaries_new ps
-            WHERE ps.professor_id = ANY(:professor_ids)
-              AND ps.course_code IS NULL
-        """)
-        summary_result = db.execute(summary_query, {"professor_ids": valid_ids})
-        summary_by_prof = {row.professor_id: row for row in summary_result}
-
-        # BATCH 5: Get recent reviews for all professors (top 5 each)
-        reviews_query = text("""
-            WITH ranked_reviews AS (
-                SELECT 
-                    r.professor_id,
-                    r.id,
-                    r.review_text,
-                    r.clarity_rating,
-                    r.difficulty_rating,
-                    r.helpful_rating,
-                    r.would_take_again,
-                    r.grade,
-                    r.review_date,
-                    r.course_code,
-                    r.rating_tags,
-                    COALESCE(c.name, 'Course') as course_name,
-                    ROW_NUMBER() OVER (PARTITION BY r.professor_id ORDER BY r.review_date DESC) as rn
-                FROM reviews r
-                LEFT JOIN courses c ON c.subject_id || c.course_number = r.course_code
-                WHERE r.professor_id = ANY(:professor_ids)
-                  AND r.review_text IS NOT NULL
-                  AND r.review_text != ''
-            )
-            SELECT * FROM ranked_reviews WHERE rn <= 5
-            ORDER BY professor_id, rn
-        """)
-        reviews_result = db.execute(reviews_query, {"professor_ids": valid_ids})
-
-        reviews_by_prof: Dict[str, List[Dict[str, Any]]] = {}
-        for review in reviews_result:
-            if review.professor_id not in reviews_by_prof:
-                reviews_by_prof[review.professor_id] = []
-
-            overall_rating = (
-                round(
-                    (
-                        (review.clarity_rating or 0)
-                        + (6 - (review.difficulty_rating or 3))
-                        + (review.helpful_rating or 0)
-                    )
-                    / 3,
-                    1,
-                )
-                if any(
-                    [
-                        review.clarity_rating,
-                        review.difficulty_rating,
-                        review.helpful_rating,
-                    ]
-                )
-                else 0
-            )
-
-            tags = []
-            if review.rating_tags:
-                try:
-                    tags = (
-                        json.loads(review.rating_tags)
-                        if isinstance(review.rating_tags, str)
-                        else review.rating_tags
-                    )
-                except Exception:
-                    tags = []
-
-            reviews_by_prof[review.professor_id].append(
-                {
-                    "id": review.id,
-                    "course_code": review.course_code,
-                    "course_name": review.course_name,
-                    "review_text": review.review_text,
-                    "overall_rating": overall_rating,
-                    "would_take_again": review.would_take_again == 1
-                    if review.would_take_again is not None
-                    else None,
-                    "grade": review.grade,
-                    "review_date": review.review_date.isoformat()
-                    if review.review_date
-                    else None,
-                    "tags": tags,
-                }
+        missing_ids = [pid for pid in cache_keys if pid not in profiles_by_id]
+        if missing_ids:
+            fetched = await fetch_professor_profiles(db, missing_ids)
+            await set_cached_many(
+                {cache_keys[pid]: profile for pid, profile in fetched.items()},
+                ttl=TTL_WEEK,
             )
+            profiles_by_id.update(fetched)
 
-        # Build response from pre-fetched data
-        professor_profiles = []
-        for prof_id in professor_ids:  # Maintain original order
-            if prof_id not in prof_rows:
-                continue
-
-            prof = prof_rows[prof_id]
-            summary = summary_by_prof.get(prof_id)
-
-            professor_profiles.append(
-                {
-                    "id": prof_id,
-                    "name": prof.name,
-                    "overall_rating": float(prof.avg_rating)
-                    if prof.avg_rating
-                    else 3.0,
-                    "total_reviews": total_reviews_by_prof.get(prof_id, 0),
-                    "would_take_again_percent": wta_by_prof.get(prof_id, 0.0),
-                    "courses": courses_by_prof.get(prof_id, []),
-                    "departments": list(depts_by_prof.get(prof_id, [])),
-                    "recent_reviews": reviews_by_prof.get(prof_id, []),
-                    "overallSummary": {
-                        "sentiment": summary.overall_sentiment if summary else None,
-                        "strengths": list(summary.strengths)
-                        if summary and summary.strengths
-                        else [],
-                        "complaints": list(summary.complaints)
-                        if summary and summary.complaints
-                        else [],
-                        "consistency": summary.consistency if summary else None,
-                        "confidence": float(summary.confidence)
-                        if summary and summary.confidence
-                        else None,
-                    }
-                    if summary
-                    else None,
-                }
-            )
+        professor_profiles = [
+            profiles_by_id[pid] for pid in professor_ids if pid in profiles_by_id
+        ]
 
         if not professor_profiles:
             raise HTTPException(
@@ -6078,7 +5462,7 @@ async def cache_status() -> Dict[str, Any]:
         }
     },
     summary="/cache/clear",
-    description="Clear all cached API responses. Use with caution.",
+    description="Clear all cached API responses. Use with caution. In-process copies are only cleared in the worker that serves this request.",
     tags=["Admin"],
 )
 async def cache_clear() -> Dict[str, Any]:
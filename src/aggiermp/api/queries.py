@@ -0,0 +1,376 @@
+"""
+SQL statements for the professor and section endpoints
+
+Statements are built once at import time (or once per filter shape via
+lru_cache) so every request reuses the same TextClause, and asyncpg's
+per-connection prepared statement cache sees identical SQL.
+"""
+
+from functools import lru_cache
+from typing import Tuple
+
+from sqlalchemy import TextClause, text
+
+
+PROFESSOR_EXISTS_SQL = text("SELECT 1 FROM professors WHERE id = :professor_id LIMIT 1")
+
+_REVIEW_SORT_ORDERS = {
+    "date": "r.review_date DESC",
+    "rating": "r.overall_rating_cached DESC NULLS LAST",
+    "course": "r.course_code ASC, r.review_date DESC",
+}
+
+
+@lru_cache(maxsize=64)
+def build_professor_reviews_query(
+    where_conditions: Tuple[str, ...], sort_by: str
+) -> TextClause:
+    """Build (once per filter/sort shape) the professor reviews statement"""
+    where_clause = " AND ".join(where_conditions)
+    sort_order = _REVIEW_SORT_ORDERS[sort_by]
+
+    return text(f"""
+        SELECT 
+            r.id,
+            r.review_text,
+            r.clarity_rating,
+            r.difficulty_rating,
+            r.helpful_rating,
+            r.would_take_again,
+            r.attendance_mandatory,
+            r.is_online_class,
+            r.is_for_credit,
+            r.grade,
+            r.review_date,
+            r.textbook_use,
+            r.thumbs_up_total,
+            r.thumbs_down_total,
+            r.rating_tags,
+            r.teacher_note,
+            r.course_code,
+            CASE
+                WHEN COALESCE(r.clarity_rating, 0) <> 0
+                  OR COALESCE(r.difficulty_rating, 0) <> 0
+                  OR COALESCE(r.helpful_rating, 0) <> 0
+                THEN ROUND(
+                    ((COALESCE(r.clarity_rating, 0)
+                      + (6 - COALESCE(r.difficulty_rating, 3))
+                      + COALESCE(r.helpful_rating, 0)) / 3.0)::numeric,
+                    1
+                )
+                ELSE 0
+            END as overall_rating
+        FROM reviews r
+        WHERE {where_clause}
+          AND r.review_text IS NOT NULL
+          AND r.review_text != ''
+        ORDER BY {sort_order}
+        LIMIT :limit OFFSET :skip
+    """)
+
+
+@lru_cache(maxsize=64)
+def build_professor_search_query(where_conditions: Tuple[str, ...]) -> TextClause:
+    """Build (once per filter combination) the professor search statement"""
+    where_clause = ""
+    if where_conditions:
+        where_clause = "WHERE " + " AND ".join(where_conditions)
+
+    # The filters, sort and LIMIT only need the professor row and its summary
+    # counters, so they run in the inner `page` query first; departments,
+    # titles and would-take-again are then computed for just the page's rows
+    return text(f"""
+        SELECT 
+            page.id,
+            page.name,
+            page.first_name,
+            page.last_name,
+            page.overall_rating,
+            page.total_reviews,
+            COALESCE(wta.would_take_again_percent, 0.0) as would_take_again_percent,
+            COALESCE(pdept.departments, ARRAY[]::text[]) as departments,
+            page.courses_taught,
+            COALESCE(ptitles.course_titles, '') as course_titles,
+            page.total_courses
+        FROM (
+            SELECT 
+                p.id,
+                p.first_name || ' ' || p.last_name as name,
+                p.first_name,
+                p.last_name,
+                CASE WHEN pst.summary_rows > 0 THEN p.avg_rating END as overall_rating,
+                COALESCE(pst.total_reviews, 0) as total_reviews,
+                COALESCE(pst.courses_taught, ARRAY[]::text[]) as courses_taught,
+                COALESCE(pst.total_courses, 0) as total_courses
+            FROM professors p
+            -- Summaries are unique per (professor, course), so the counters
+            -- and course list need no DISTINCT
+            LEFT JOIN LATERAL (
+                SELECT 
+                    COUNT(*) as summary_rows,
+                    COUNT(ps.course_code) as total_courses,
+                    SUM(ps.total_reviews) as total_reviews,
+                    ARRAY_AGG(ps.course_code ORDER BY ps.course_code) as courses_taught
+                FROM professor_summaries_new ps
+                WHERE ps.professor_id = p.id
+            ) pst ON true
+            {where_clause}
+            ORDER BY COALESCE(pst.total_reviews, 0) DESC, p.last_name, p.first_name, p.id
+            LIMIT :limit OFFSET :skip
+        ) page
+        -- Departments and titles de-duplicate in a subquery first so the
+        -- DISTINCT can hash; each aggregate sorts its own (small) input so
+        -- the lists keep a stable order
+        LEFT JOIN LATERAL (
+            SELECT ARRAY_AGG(d.dept ORDER BY d.dept) as departments
+            FROM (
+                SELECT DISTINCT ps.dept
+                FROM professor_summaries_new ps
+                WHERE ps.professor_id = page.id
+            ) d
+        ) pdept ON true
+        LEFT JOIN LATERAL (
+            SELECT STRING_AGG(t.name, ', ' ORDER BY t.name) as course_titles
+            FROM (
+                SELECT DISTINCT c.name
+                FROM professor_summaries_new ps
+                JOIN courses c ON c.course_code = ps.course_code
+                WHERE ps.professor_id = page.id
+            ) t
+        ) ptitles ON true
+        LEFT JOIN LATERAL (
+            SELECT 
+                ROUND(
+                    AVG(CASE WHEN would_take_again = 1 THEN 100.0 ELSE 0.0 END)::numeric, 
+                    1
+                ) as would_take_again_percent
+            FROM reviews 
+            WHERE professor_id = page.id
+              AND would_take_again IS NOT NULL
+        ) wta ON true
+        ORDER BY page.total_reviews DESC, page.last_name, page.first_name, page.id
+    """)
+
+
+# Professor profiles for /professor/{id} and /professors/compare (up to 10
+# ids) in one round-trip; per-professor lists come back as JSON arrays and
+# the aggregate stats are read from mv_professor_profile. Course names are
+# filled in from the in-process course lookup rather than joined here.
+PROFESSOR_PROFILES_SQL = text("""
+    WITH prof AS (
+        SELECT 
+            p.id,
+            p.first_name || ' ' || p.last_name as name,
+            p.avg_rating
+        FROM professors p
+        WHERE p.id = ANY(:professor_ids)
+    ),
+    courses_taught AS (
+        SELECT 
+            ps.professor_id,
+            json_agg(
+                json_build_object(
+                    'course_id', ps.course_code,
+                    'reviews_count', ps.total_reviews
+                )
+                ORDER BY ps.total_reviews DESC
+            ) as courses
+        FROM professor_summaries_new ps
+        WHERE ps.professor_id = ANY(:professor_ids)
+          AND ps.course_code IS NOT NULL
+        GROUP BY ps.professor_id
+    ),
+    summary AS (
+        SELECT DISTINCT ON (ps.professor_id)
+            ps.professor_id,
+            ps.overall_sentiment,
+            ps.strengths,
+            ps.complaints,
+            ps.consistency,
+            ps.confidence
+        FROM professor_summaries_new ps
+        WHERE ps.professor_id = ANY(:professor_ids)
+          AND ps.course_code IS NULL
+        ORDER BY ps.professor_id
+    ),
+    recent AS (
+        SELECT 
+            rr.professor_id,
+            json_agg(
+                json_build_object(
+                    'id', rr.id,
+                    'course_code', rr.course_code,
+                    'review_text', rr.review_text,
+                    'overall_rating', rr.overall_rating,
+                    'would_take_again', rr.would_take_again = 1,
+                    'grade', rr.grade,
+                    'review_date', rr.review_date,
+                    'tags', COALESCE(rr.rating_tags, ARRAY[]::varchar[])
+                )
+                ORDER BY rr.rn
+            ) as recent_reviews
+        FROM (
+            SELECT 
+                r.professor_id,
+                r.id,
+                r.review_text,
+                r.would_take_again,
+                r.grade,
+                r.review_date,
+                r.course_code,
+                r.rating_tags,
+                CASE
+                    WHEN COALESCE(r.clarity_rating, 0) <> 0
+                      OR COALESCE(r.difficulty_rating, 0) <> 0
+                      OR COALESCE(r.helpful_rating, 0) <> 0
+                    THEN ROUND(
+                        ((COALESCE(r.clarity_rating, 0)
+                          + (6 - COALESCE(r.difficulty_rating, 3))
+                          + COALESCE(r.helpful_rating, 0)) / 3.0)::numeric,
+                        1
+                    )
+                    ELSE 0
+                END as overall_rating,
+                ROW_NUMBER() OVER (PARTITION BY r.professor_id ORDER BY r.review_date DESC) as rn
+            FROM reviews r
+            WHERE r.professor_id = ANY(:professor_ids)
+              AND r.review_text IS NOT NULL
+              AND r.review_text != ''
+        ) rr
+        WHERE rr.rn <= 5
+        GROUP BY rr.professor_id
+    ),
+    tag_counts AS (
+        -- The overall (course_code IS NULL) row already counts every review,
+        -- so per-course rows are only summed for professors without one
+        SELECT 
+            t.professor_id,
+            jsonb_object_agg(t.tag, t.freq) as tag_frequencies
+        FROM (
+            SELECT 
+                ps.professor_id,
+                e.key as tag,
+                SUM(e.value::int) as freq
+            FROM professor_summaries_new ps
+            CROSS JOIN LATERAL jsonb_each_text(ps.tag_frequencies) e
+            WHERE ps.professor_id = ANY(:professor_ids)
+              AND jsonb_typeof(ps.tag_frequencies) = 'object'
+              AND (
+                  ps.course_code IS NULL
+                  OR NOT EXISTS (
+                      SELECT 1
+                      FROM professor_summaries_new o
+                      WHERE o.professor_id = ps.professor_id
+                        AND o.course_code IS NULL
+                        AND jsonb_typeof(o.tag_frequencies) = 'object'
+                  )
+              )
+            GROUP BY ps.professor_id, e.key
+        ) t
+        GROUP BY t.professor_id
+    )
+    SELECT 
+        prof.id,
+        prof.name,
+        prof.avg_rating,
+        mv.would_take_again_percent,
+        courses_taught.courses,
+        mv.total_reviews,
+        COALESCE(array_remove(mv.departments, NULL), ARRAY[]::text[]) as departments,
+        recent.recent_reviews,
+        tag_counts.tag_frequencies,
+        summary.professor_id IS NOT NULL as has_summary,
+        summary.overall_sentiment,
+        summary.strengths,
+        summary.complaints,
+        summary.consistency,
+        summary.confidence
+    FROM prof
+    LEFT JOIN mv_professor_profile mv ON mv.professor_id = prof.id
+    LEFT JOIN courses_taught ON courses_taught.professor_id = prof.id
+    LEFT JOIN summary ON summary.professor_id = prof.id
+    LEFT JOIN recent ON recent.professor_id = prof.id
+    LEFT JOIN tag_counts ON tag_counts.professor_id = prof.id
+""")
+
+
+def _section_children_columns(section_id: str) -> str:
+    """
+    Select-list columns aggregating a section's instructors and meetings into
+    JSON arrays (NULL when there are none). json (not jsonb) keeps the object
+    keys in the order the API has always returned them.
+    """
+    return f"""
+        (
+            SELECT json_agg(
+                json_build_object(
+                    'name', si.instructor_name,
+                    'isPrimary', si.is_primary,
+                    'hasCv', si.has_cv,
+                    'cvUrl', si.cv_url
+                )
+                ORDER BY si.is_primary DESC
+            )
+            FROM section_instructors si
+            WHERE si.section_id = {section_id}
+        ) as instructors,
+        (
+            SELECT json_agg(
+                json_build_object(
+                    'daysOfWeek', sm.days_of_week,
+                    'beginTime', sm.begin_time,
+                    'endTime', sm.end_time,
+                    'startDate', sm.start_date,
+                    'endDate', sm.end_date,
+                    'building', sm.building_code,
+                    'room', sm.room_code,
+                    'meetingType', sm.meeting_type
+                )
+                ORDER BY sm.meeting_index
+            )
+            FROM section_meetings sm
+            WHERE sm.section_id = {section_id}
+        ) as meetings"""
+
+
+# Instructors and meetings for a batch of sections, aggregated per section so
+# the paginated section endpoints need one round-trip for both. Rows come back
+# in the order of :section_ids.
+SECTION_CHILDREN_SQL = text(f"""
+    SELECT 
+        ids.section_id,{_section_children_columns("ids.section_id")}
+    FROM unnest(CAST(:section_ids AS text[])) WITH ORDINALITY AS ids(section_id, ord)
+    ORDER BY ids.ord
+""")
+
+
+# A course's sections in a term with their instructors and meetings, all in
+# one statement
+SECTIONS_BY_COURSE_SQL = text(f"""
+    SELECT 
+        s.id,
+        s.term_code,
+        s.crn,
+        s.dept,
+        s.dept_desc,
+        s.course_number,
+        s.section_number,
+        s.course_title,
+        s.credit_hours,
+        s.hours_low,
+        s.hours_high,
+        s.campus,
+        s.part_of_term,
+        s.session_type,
+        s.schedule_type,
+        s.instruction_type,
+        s.is_open,
+        s.has_syllabus,
+        s.syllabus_url,
+        s.attributes_text,{_section_children_columns("s.id")}
+    FROM sections s
+    WHERE s.term_code = :term_code
+      AND s.dept = :dept
+      AND s.course_number = :course_number
+    ORDER BY s.section_number
+""")
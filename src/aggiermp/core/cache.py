@@ -4,17 +4,23 @@ Redis caching utilities for the API.
 Provides:
 - Redis connection management
 - @cached decorator for endpoint caching
+- @local_cached decorator for in-process caching of small, hot responses
+- Per-key get/set helpers for caching parts of a response
 - Cache invalidation helpers
 """
 
+import dataclasses
+import fnmatch
 import hashlib
-import json
 import os
+import time
 from functools import wraps
-from typing import Any, Callable, Optional
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple
 
+import orjson
 import redis.asyncio as redis  # type: ignore[import-not-found]
 from fastapi import Request
+from fastapi.responses import JSONResponse, Response
 from pydantic import BaseModel
 
 from ..core.config import settings
@@ -31,6 +37,10 @@ TTL_MONTH = 2592000  # 1 month - for monthly data (e.g., course reviews)
 # Global Redis client
 _redis_client: Optional[redis.Redis] = None
 
+# Every @local_cached store in this process, so invalidation can reach them
+# (cache key -> (expires_at, body, etag))
+_local_stores: List[Dict[str, Tuple[float, bytes, str]]] = []
+
 
 async def get_redis() -> Optional[redis.Redis]:
     """Get or create Redis connection."""
@@ -76,10 +86,12 @@ def _generate_cache_key(request: Request) -> str:
 
 def _serialize_for_cache(obj: Any) -> Any:
     """
-    Recursively convert Pydantic models to dicts for JSON serialization.
+    Recursively convert Pydantic models and dataclasses to dicts for JSON serialization.
     """
     if isinstance(obj, BaseModel):
         return obj.model_dump()
+    elif dataclasses.is_dataclass(obj) and not isinstance(obj, type):
+        return dataclasses.asdict(obj)
     elif isinstance(obj, list):
         return [_serialize_for_cache(item) for item in obj]
     elif isinstance(obj, dict):
@@ -87,6 +99,17 @@ def _serialize_for_cache(obj: Any) -> Any:
     return obj
 
 
+def _dumps(value: Any) -> bytes:
+    """
+    Encode a value for the cache with orjson, which writes dates and datetimes
+    as ISO 8601 strings (matching .isoformat()) in C. Other unsupported types
+    fall back to str().
+    """
+    return orjson.dumps(
+        _serialize_for_cache(value), default=str, option=orjson.OPT_NON_STR_KEYS
+    )
+
+
 def cached(ttl: int = TTL_STANDARD) -> Callable:
     """
     Decorator to cache endpoint responses in Redis.
@@ -120,6 +143,11 @@ def cached(ttl: int = TTL_STANDARD) -> Callable:
                 # Can't cache without request
                 return await func(*args, **kwargs)
 
+            if "application/x-ndjson" in request.headers.get("accept", ""):
+                # Streamed responses can't be stored, and must not be served
+                # the JSON body cached for the same URL
+                return await func(*args, **kwargs)
+
             redis_client = await get_redis()
             if not redis_client:
                 # Redis not available, skip caching
@@ -133,7 +161,7 @@ def cached(ttl: int = TTL_STANDARD) -> Callable:
                 cached_data = await redis_client.get(cache_key)
                 if cached_data:
                     # Cache hit
-                    data = json.loads(cached_data)
+                    data = orjson.loads(cached_data)
                     # Add cache header via request state
                     request.state.cache_hit = True
                     request.state.cache_ttl = await redis_client.ttl(cache_key)
@@ -141,13 +169,20 @@ def cached(ttl: int = TTL_STANDARD) -> Callable:
 
                 # Cache miss - execute function
                 result = await func(*args, **kwargs)
-
-                # Store in cache - convert Pydantic models to dicts first
+                if isinstance(result, Response) and not isinstance(
+                    result, JSONResponse
+                ):
+                    # Streamed or raw bodies can't be stored
+                    return result
+
+                # Store in cache - convert Pydantic models to dicts first;
+                # JSON responses built by the endpoint are stored as-is
                 try:
-                    serializable = _serialize_for_cache(result)
-                    await redis_client.setex(
-                        cache_key, ttl, json.dumps(serializable, default=str)
-                    )
+                    if isinstance(result, JSONResponse):
+                        payload = bytes(result.body)
+                    else:
+                        payload = _dumps(result)
+                    await redis_client.setex(cache_key, ttl, payload)
                 except (TypeError, ValueError):
                     # Result not JSON serializable, skip caching
                     pass
@@ -165,16 +200,165 @@ def cached(ttl: int = TTL_STANDARD) -> Callable:
     return decorator
 
 
+def _etag_matches(request: Request, etag: str) -> bool:
+    """Check whether the request's If-None-Match covers this ETag."""
+    if_none_match = request.headers.get("if-none-match")
+    if not if_none_match:
+        return False
+    if if_none_match.strip() == "*":
+        return True
+    # Weak comparison, as required for If-None-Match
+    opaque = etag.removeprefix("W/")
+    return any(
+        tag.strip().removeprefix("W/") == opaque for tag in if_none_match.split(",")
+    )
+
+
+def local_cached(
+    ttl: int = TTL_SHORT, maxsize: int = 64, max_age: Optional[int] = None
+) -> Callable:
+    """
+    Decorator to keep encoded endpoint responses in process memory.
+
+    Place it above @cached on small, frequently hit endpoints: repeat
+    requests within ``ttl`` are answered from this worker's memory without
+    a Redis round-trip or re-serializing the body. Responses carry an ETag
+    of the body, and a request whose If-None-Match matches it gets an empty
+    304 instead.
+
+    invalidate_cache() and the helpers built on it also drop matching
+    entries here, but only in the worker that handles the call; other
+    workers, and changes made outside the API such as pipeline view
+    refreshes, are only picked up once ``ttl`` runs out.
+
+    Usage:
+        @app.get("/terms")
+        @local_cached(ttl=TTL_SHORT, max_age=60)
+        @cached(ttl=TTL_LONG)
+        async def get_terms(request: Request, ...):
+            ...
+
+    Args:
+        ttl: Time to live in seconds
+        maxsize: Maximum number of entries kept per worker
+        max_age: Cache-Control max-age to send to clients, if any
+
+    Returns:
+        Decorated function with in-process caching
+    """
+
+    def decorator(func: Callable) -> Callable:
+        store: Dict[str, Tuple[float, bytes, str]] = {}
+        _local_stores.append(store)
+
+        def respond(request: Request, body: bytes, etag: str) -> Response:
+            headers = {"ETag": etag}
+            if max_age is not None:
+                headers["Cache-Control"] = f"public, max-age={max_age}"
+            if _etag_matches(request, etag):
+                return Response(status_code=304, headers=headers)
+            return Response(
+                content=body, media_type="application/json", headers=headers
+            )
+
+        @wraps(func)
+        async def wrapper(*args: Any, **kwargs: Any) -> Any:
+            request: Optional[Request] = kwargs.get("request")
+            if request is None:
+                request = next((a for a in args if isinstance(a, Request)), None)
+            if request is None:
+                return await func(*args, **kwargs)
+
+            cache_key = _generate_cache_key(request)
+            now = time.monotonic()
+            entry = store.get(cache_key)
+            if entry and entry[0] > now:
+                return respond(request, entry[1], entry[2])
+
+            result = await func(*args, **kwargs)
+            if isinstance(result, Response):
+                if not isinstance(result, JSONResponse):
+                    return result
+                body = bytes(result.body)
+            else:
+                body = _dumps(result)
+
+            if len(store) >= maxsize:
+                # Drop expired entries, then the oldest if still full
+                for key in [k for k, entry in store.items() if entry[0] <= now]:
+                    del store[key]
+                if len(store) >= maxsize:
+                    del store[next(iter(store))]
+            # Weak, since GZipMiddleware may re-encode the body
+            etag = f'W/"{hashlib.blake2b(body, digest_size=8).hexdigest()}"'
+            store[cache_key] = (now + ttl, body, etag)
+
+            return respond(request, body, etag)
+
+        return wrapper
+
+    return decorator
+
+
+async def get_cached_many(keys: List[str]) -> Dict[str, Any]:
+    """
+    Fetch several cached values in one round-trip.
+
+    Args:
+        keys: Redis keys to look up
+
+    Returns:
+        Mapping of key to decoded value for the keys that were cached
+    """
+    redis_client = await get_redis()
+    if not redis_client or not keys:
+        return {}
+
+    try:
+        values = await redis_client.mget(keys)
+        return {key: orjson.loads(value) for key, value in zip(keys, values) if value}
+    except Exception as e:
+        print(f"Cache error: {e}")
+        return {}
+
+
+async def set_cached_many(items: Dict[str, Any], ttl: int = TTL_STANDARD) -> None:
+    """
+    Store several values in one round-trip, each with the same TTL.
+
+    Args:
+        items: Mapping of Redis key to JSON-serializable value
+        ttl: Time to live in seconds
+    """
+    redis_client = await get_redis()
+    if not redis_client or not items:
+        return
+
+    try:
+        pipe = redis_client.pipeline(transaction=False)
+        for key, value in items.items():
+            pipe.setex(key, ttl, _dumps(value))
+        await pipe.execute()
+    except Exception as e:
+        print(f"Cache error: {e}")
+
+
 async def invalidate_cache(pattern: str) -> int:
     """
     Invalidate cache entries matching a pattern.
 
+    Matching @local_cached entries in this worker are dropped as well.
+
     Args:
         pattern: Redis key pattern (e.g., "api:/courses*")
 
     Returns:
-        Number of keys deleted
+        Number of Redis keys deleted
     """
+    for store in _local_stores:
+        for key in [k for k in store if fnmatch.fnmatchcase(k, pattern)]:
+            del store[key]
+
     redis_client = await get_redis()
     if not redis_client:
         return 0
@@ -193,6 +377,26 @@ async def invalidate_cache(pattern: str) -> int:
         return 0
 
 
+async def invalidate_professor_cache(professor_ids: Iterable[str]) -> int:
+    """
+    Invalidate cached responses that depend on the given professors.
+
+    Clears each professor's profile, reviews and per-professor comparison
+    entries (``/professor/{id}``, ``/professor/{id}/reviews`` and
+    ``/professor/{id}:compare``) plus all ``/professors/compare`` entries,
+    whose keys are hashed from the id list.
+
+    Returns:
+        Number of keys deleted
+    """
+    deleted = 0
+    for professor_id in professor_ids:
+        deleted += await invalidate_cache(f"api:/professor/{professor_id}*")
+    if deleted:
+        deleted += await invalidate_cache("api:/professors/compare*")
+    return deleted
+
+
 async def clear_all_cache() -> int:
     """Clear all API cache entries."""
     return await invalidate_cache("api:*")
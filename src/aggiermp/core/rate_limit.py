@@ -0,0 +1,127 @@
+"""
+In-process rate limiting for the API.
+
+Provides:
+- TokenBucketLimiter with a @limiter.limit("30/minute") decorator
+
+Each client IP gets one token bucket per endpoint. A bucket holds up to the
+limit's request count, refills continuously over its period, and each request
+spends one token, so checking a request is a dict lookup and a few float
+operations with no Redis round-trip. Buckets live in the worker's memory, so
+limits apply per worker process.
+"""
+
+import math
+import time
+from functools import wraps
+from typing import Any, Callable, Dict, Optional, Tuple
+
+from fastapi import HTTPException, Request
+
+# Seconds per period name accepted in limit strings
+_PERIODS = {
+    "second": 1,
+    "minute": 60,
+    "hour": 3600,
+    "day": 86400,
+}
+
+# Idle buckets checked for eviction per request
+_SWEEP_PER_CALL = 2
+
+
+def _parse_rate(rate: str) -> Tuple[int, str]:
+    """Parse a limit like "30/minute" into (requests, period name)."""
+    count, _, period = rate.partition("/")
+    period = period.strip().lower().rstrip("s")
+    if period not in _PERIODS:
+        raise ValueError(f"Unsupported rate limit period: {rate}")
+    return int(count), period
+
+
+def get_remote_address(request: Request) -> str:
+    """Key requests by client IP address."""
+    if request.client and request.client.host:
+        return request.client.host
+    return "127.0.0.1"
+
+
+class TokenBucketLimiter:
+    """
+    Per-endpoint token buckets keyed by client.
+
+    Usage:
+        limiter = TokenBucketLimiter()
+
+        @app.get("/terms")
+        @limiter.limit("60/minute")
+        async def get_terms(request: Request, ...):
+            ...
+    """
+
+    def __init__(self, key_func: Callable[[Request], str] = get_remote_address):
+        self.key_func = key_func
+
+    def limit(self, rate: str) -> Callable:
+        """
+        Decorator to limit an endpoint to ``rate`` requests per client.
+
+        Args:
+            rate: Limit such as "30/minute"
+
+        Returns:
+            Decorated function that raises 429 once a client's bucket is empty
+        """
+        capacity, period_name = _parse_rate(rate)
+        period = _PERIODS[period_name]
+        refill_per_second = capacity / period
+        retry_after = str(math.ceil(1 / refill_per_second))
+        detail = f"Rate limit exceeded: {capacity} per 1 {period_name}"
+
+        def decorator(func: Callable) -> Callable:
+            # key -> (tokens, last_refill); kept in least recently used order
+            buckets: Dict[str, Tuple[float, float]] = {}
+
+            @wraps(func)
+            async def wrapper(*args: Any, **kwargs: Any) -> Any:
+                request: Optional[Request] = kwargs.get("request")
+                if request is None:
+                    request = next((a for a in args if isinstance(a, Request)), None)
+                if request is None:
+                    return await func(*args, **kwargs)
+
+                key = self.key_func(request)
+                now = time.monotonic()
+
+                bucket = buckets.pop(key, None)
+                if bucket is None:
+                    tokens = float(capacity)
+                else:
+                    tokens, last = bucket
+                    tokens = min(capacity, tokens + (now - last) * refill_per_second)
+
+                allowed = tokens >= 1
+                if allowed:
+                    tokens -= 1
+                buckets[key] = (tokens, now)
+
+                # A bucket idle for a whole period has refilled completely,
+                # which is the same as having no bucket, so drop it
+                for _ in range(_SWEEP_PER_CALL):
+                    oldest = next(iter(buckets))
+                    if now - buckets[oldest][1] < period:
+                        break
+                    del buckets[oldest]
+
+                if not allowed:
+                    raise HTTPException(
+                        status_code=429,
+                        detail=detail,
+                        headers={"Retry-After": retry_after},
+                    )
+
+                return await func(*args, **kwargs)
+
+            return wrapper
+
+        return decorator
@@ -14,10 +14,16 @@ from sqlalchemy import (
     ForeignKey,
     update,
     Text,
+    Index,
+    Computed,
+    DDL,
+    event,
 )
 from sqlalchemy.orm import sessionmaker, DeclarativeBase, Session as SQLAlchemySession
-from sqlalchemy.dialects.postgresql import insert, JSON
-from typing import List, Any, Dict
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+from sqlalchemy.dialects.postgresql import insert, JSON, JSONB
+from sqlalchemy.pool import NullPool
+from typing import List, Any, Dict, Tuple
 import logging
 
 from ..models.schema import Review, University, Professor
@@ -34,6 +40,14 @@ class Base(DeclarativeBase):
     pass
 
 
+# Extensions required by indexes declared on the models below
+event.listen(
+    Base.metadata,
+    "before_create",
+    DDL("CREATE EXTENSION IF NOT EXISTS pg_trgm"),
+)
+
+
 class UniversityDB(Base):
     __tablename__ = "universities"
 
@@ -49,6 +63,14 @@ class UniversityDB(Base):
 
 class ProfessorDB(Base):
     __tablename__ = "professors"
+    __table_args__ = (
+        # Trigram index so full-name ILIKE '%...%' searches avoid a seq scan
+        Index(
+            "idx_prof_fullname_trgm",
+            text("(first_name || ' ' || last_name) gin_trgm_ops"),
+            postgresql_using="gin",
+        ),
+    )
 
     id = Column(String, primary_key=True)
     university_id = Column(String, ForeignKey("universities.id"), nullable=False)
@@ -69,6 +91,54 @@ class ProfessorDB(Base):
 
 class ReviewDB(Base):
     __tablename__ = "reviews"
+    __table_args__ = (
+        # Recent-reviews lookups per professor; partial on non-empty text
+        # and covering the listed columns so they are index-only scans.
+        Index(
+            "idx_reviews_prof_date_has_text",
+            "professor_id",
+            text("review_date DESC"),
+            postgresql_include=[
+                "id",
+                "review_text",
+                "clarity_rating",
+                "difficulty_rating",
+                "helpful_rating",
+                "would_take_again",
+                "grade",
+                "course_code",
+                "rating_tags",
+            ],
+            postgresql_where=text("review_text IS NOT NULL AND review_text <> ''"),
+        ),
+        # sort_by=course on the professor reviews endpoint
+        Index(
+            "idx_reviews_prof_course_date",
+            "professor_id",
+            "course_code",
+            text("review_date DESC"),
+        ),
+        # min_rating/max_rating range and sort_by=rating within a professor
+        Index(
+            "idx_reviews_prof_overall_rating",
+            "professor_id",
+            text("overall_rating_cached DESC NULLS LAST"),
+        ),
+        # would_take_again_percent aggregation per professor (index-only)
+        Index(
+            "idx_reviews_prof_wta",
+            "professor_id",
+            postgresql_include=["would_take_again"],
+            postgresql_where=text("would_take_again IS NOT NULL"),
+        ),
+        # Per-course professor rating rollups in the course listing
+        Index(
+            "idx_reviews_dept_course",
+            "dept_code",
+            "course_num",
+            postgresql_where=text("dept_code IS NOT NULL AND course_num IS NOT NULL"),
+        ),
+    )
 
     id = Column(String, primary_key=True)
     legacy_id = Column(Integer, nullable=True)
@@ -88,6 +158,24 @@ class ReviewDB(Base):
     thumbs_up_total = Column(Integer, nullable=True)
     thumbs_down_total = Column(Integer, nullable=True)
     rating_tags: Column[List[str]] = Column(ARRAY(String), nullable=True)
+    # Stored composite rating used by the min/max rating filters and sort
+    overall_rating_cached = Column(
+        Float,
+        Computed(
+            "(clarity_rating + (6 - difficulty_rating) + helpful_rating) / 3.0",
+            persisted=True,
+        ),
+    )
+    # Department prefix and course number of course_code (e.g. "CSCE", "121")
+    # for per-department and per-course rollups
+    dept_code = Column(
+        String,
+        Computed("substring(course_code from '^[A-Z]+')", persisted=True),
+        index=True,
+    )
+    course_num = Column(
+        String, Computed("substring(course_code from '[0-9]+')", persisted=True)
+    )
     admin_reviewed_at = Column(DateTime, nullable=True)
     flag_status = Column(String, nullable=True)
     created_by_user = Column(Boolean, nullable=False)
@@ -131,6 +219,12 @@ class CourseDB(Base):
 
     # New columns added to match actual DB schema
     code = Column(String, nullable=False)
+    # Compact join key matching reviews/professor_summaries course codes
+    course_code = Column(
+        String,
+        Computed("subject_id || course_number", persisted=True),
+        index=True,
+    )
     name = Column(String, nullable=False)
     credits = Column(Integer, nullable=True)
     lecture_hours = Column(Integer, nullable=True)
@@ -179,6 +273,18 @@ class GpaDataDB(Base):
 
 class SectionAttributeDB(Base):
     __tablename__ = "section_attributes"
+    __table_args__ = (
+        # Covers the per-course attribute lookups (equality on all four
+        # columns) so they can be served as index-only scans.
+        Index(
+            "section_attributes_lookup",
+            "dept",
+            "course_number",
+            "year",
+            "semester",
+            postgresql_include=["attribute_id", "attribute_title"],
+        ),
+    )
     id = Column(String, primary_key=True)  # e.g. 'CSCE_121_500_Fall2025_KCOM'
     dept = Column(String, nullable=False)
     course_number = Column(String, nullable=False)
@@ -216,6 +322,19 @@ class SectionDB(Base):
     """Database model for course sections from Howdy API"""
 
     __tablename__ = "sections"
+    __table_args__ = (
+        # Per-term section counts (GROUP BY dept, course_number for the
+        # current term) can be answered as index-only scans.
+        Index("idx_sections_term_dept_course", "term_code", "dept", "course_number"),
+        # College Station terms end in 1; the predicate matches the
+        # MAX(term_code) ... LIKE '%1' lookups word for word, so the planner
+        # answers them by reading the last entry of this small index
+        Index(
+            "idx_sections_cs_term_code",
+            "term_code",
+            postgresql_where=text("term_code LIKE '%1'"),
+        ),
+    )
 
     id = Column(String, primary_key=True)  # e.g., "202611_56508" (term_code + CRN)
     term_code = Column(String, nullable=False, index=True)  # e.g., "202611"
@@ -281,6 +400,16 @@ class SectionInstructorDB(Base):
     """Database model for section-to-instructor mapping"""
 
     __tablename__ = "section_instructors"
+    __table_args__ = (
+        # Covers the per-section instructor lookups in the section endpoints,
+        # already in their ORDER BY, so they are index-only scans with no sort
+        Index(
+            "idx_si_section_primary_cover",
+            "section_id",
+            text("is_primary DESC"),
+            postgresql_include=["instructor_name", "has_cv", "cv_url"],
+        ),
+    )
 
     id = Column(
         String, primary_key=True
@@ -306,6 +435,25 @@ class SectionMeetingDB(Base):
     """Database model for section meeting times and locations"""
 
     __tablename__ = "section_meetings"
+    __table_args__ = (
+        # Covers the per-section meeting lookups in the section endpoints,
+        # already in meeting_index order
+        Index(
+            "idx_sm_section_index_cover",
+            "section_id",
+            "meeting_index",
+            postgresql_include=[
+                "days_of_week",
+                "begin_time",
+                "end_time",
+                "start_date",
+                "end_date",
+                "building_code",
+                "room_code",
+                "meeting_type",
+            ],
+        ),
+    )
 
     id = Column(
         String, primary_key=True
@@ -421,6 +569,24 @@ class ProfessorSummaryNewDB(Base):
     """Database model for new hierarchical professor summaries (separate rows per course)"""
 
     __tablename__ = "professor_summaries_new"
+    __table_args__ = (
+        Index("idx_ps_prof_dept", "professor_id", "dept"),
+        # total_reviews is included so the per-professor course lists and
+        # review totals can be answered from the index alone
+        Index(
+            "idx_ps_prof_course",
+            "professor_id",
+            "course_code",
+            postgresql_include=["total_reviews"],
+        ),
+        # Containment lookups on tag counts (tag_frequencies @> '{"Tough grader": 3}')
+        Index(
+            "idx_ps_tag_frequencies",
+            "tag_frequencies",
+            postgresql_using="gin",
+            postgresql_ops={"tag_frequencies": "jsonb_path_ops"},
+        ),
+    )
 
     id = Column(
         String, primary_key=True
@@ -431,6 +597,10 @@ class ProfessorSummaryNewDB(Base):
     course_code = Column(
         String, nullable=True, index=True
     )  # NULL for overall summary, course code for course-specific
+    # Department prefix of course_code (e.g. "CSCE"), indexed for dept filters
+    dept = Column(
+        String, Computed("substring(course_code from '^[A-Z]+')", persisted=True)
+    )
 
     # Overall summary fields (populated when course_code is NULL)
     overall_sentiment = Column(String, nullable=True)
@@ -457,7 +627,7 @@ class ProfessorSummaryNewDB(Base):
     avg_rating = Column(Float, nullable=True)
     avg_difficulty = Column(Float, nullable=True)
     common_tags: Column[List[str]] = Column(ARRAY(String), nullable=True)
-    tag_frequencies = Column(JSON, nullable=True)
+    tag_frequencies = Column(JSONB, nullable=True)
 
     created_at = Column(DateTime, nullable=False, default=datetime.now)
     updated_at = Column(DateTime, nullable=False, default=datetime.now)
@@ -488,10 +658,360 @@ class UserSubscriptionDB(Base):
         return f"<UserSubscription(user_id='{self.user_id}')>"
 
 
+# Pre-aggregated per-professor statistics served by the profile endpoint.
+# Refreshed by the review/summary pipeline via refresh_professor_profile_view().
+PROFESSOR_PROFILE_VIEW_DDL = (
+    """
+    CREATE MATERIALIZED VIEW IF NOT EXISTS mv_professor_profile AS
+    SELECT
+        p.id AS professor_id,
+        COALESCE(ps.total_courses, 0) AS total_courses,
+        ps.total_reviews,
+        ps.departments,
+        wta.would_take_again_percent
+    FROM professors p
+    LEFT JOIN (
+        SELECT
+            professor_id,
+            COUNT(course_code) AS total_courses,
+            SUM(total_reviews) AS total_reviews,
+            ARRAY_AGG(DISTINCT dept) AS departments
+        FROM professor_summaries_new
+        WHERE course_code IS NOT NULL
+        GROUP BY professor_id
+    ) ps ON ps.professor_id = p.id
+    LEFT JOIN (
+        SELECT
+            professor_id,
+            ROUND(
+                AVG(CASE WHEN would_take_again = 1 THEN 100.0 ELSE 0.0 END)::numeric,
+                1
+            ) AS would_take_again_percent
+        FROM reviews
+        WHERE would_take_again IS NOT NULL
+        GROUP BY professor_id
+    ) wta ON wta.professor_id = p.id
+    """,
+    # Unique index is required for REFRESH ... CONCURRENTLY
+    """
+    CREATE UNIQUE INDEX IF NOT EXISTS mv_professor_profile_professor_id
+    ON mv_professor_profile (professor_id)
+    """,
+)
+
+
+# Per-department statistics served by /departments and /departments_info.
+# Refreshed by the GPA, section and review pipelines via
+# refresh_department_stats_views().
+DEPARTMENT_STATS_VIEW_DDL = (
+    """
+    CREATE MATERIALIZED VIEW IF NOT EXISTS mv_dept_gpa_stats AS
+    SELECT
+        dept,
+        COUNT(DISTINCT course_number) AS course_count,
+        COUNT(DISTINCT professor) AS professor_count,
+        ROUND(
+            SUM(gpa::numeric * total_students) / NULLIF(SUM(total_students), 0),
+            2
+        ) AS weighted_avg_gpa
+    FROM gpa_data
+    WHERE year = '2025' AND semester = 'SPRING'
+      AND gpa IS NOT NULL AND total_students > 0
+    GROUP BY dept
+    """,
+    """
+    CREATE UNIQUE INDEX IF NOT EXISTS mv_dept_gpa_stats_dept
+    ON mv_dept_gpa_stats (dept)
+    """,
+    """
+    CREATE MATERIALIZED VIEW IF NOT EXISTS mv_dept_review_ratings AS
+    SELECT
+        r.dept_code,
+        ROUND(AVG(p.avg_rating::numeric), 1) AS avg_professor_rating
+    FROM reviews r
+    JOIN professors p ON r.professor_id = p.id
+    WHERE p.avg_rating IS NOT NULL
+      AND r.dept_code IS NOT NULL
+    GROUP BY r.dept_code
+    """,
+    """
+    CREATE UNIQUE INDEX IF NOT EXISTS mv_dept_review_ratings_dept_code
+    ON mv_dept_review_ratings (dept_code)
+    """,
+    # Three most-offered courses per department in the latest fall term
+    """
+    CREATE MATERIALIZED VIEW IF NOT EXISTS mv_dept_top_courses AS
+    WITH current_term AS (
+        SELECT MAX(term_code) AS term_code
+        FROM sections
+        WHERE term_code LIKE '%1'
+    ),
+    ranked_courses AS (
+        SELECT
+            s.dept,
+            s.dept || ' ' || s.course_number AS course_code,
+            ROW_NUMBER() OVER (
+                PARTITION BY s.dept ORDER BY COUNT(*) DESC, s.course_number
+            ) AS rn
+        FROM sections s
+        JOIN current_term ct ON s.term_code = ct.term_code
+        GROUP BY s.dept, s.course_number
+    )
+    SELECT dept, course_code, rn
+    FROM ranked_courses
+    WHERE rn <= 3
+    """,
+    """
+    CREATE UNIQUE INDEX IF NOT EXISTS mv_dept_top_courses_dept_rn
+    ON mv_dept_top_courses (dept, rn)
+    """,
+)
+
+DEPARTMENT_STATS_VIEWS = (
+    "mv_dept_gpa_stats",
+    "mv_dept_review_ratings",
+    "mv_dept_top_courses",
+)
+
+
+# Per-course GPA, enrollment, section and rating aggregates served by
+# /courses and /course/{course_id}. Refreshed by the GPA, section, review and
+# course pipelines via refresh_course_aggregates_view().
+COURSE_AGGREGATES_VIEW_DDL = (
+    """
+    CREATE MATERIALIZED VIEW IF NOT EXISTS mv_course_aggregates AS
+    WITH recent_semesters AS MATERIALIZED (
+        -- Most recent 4 semester-year combinations available in gpa_data
+        SELECT year, semester
+        FROM gpa_data
+        WHERE gpa IS NOT NULL AND total_students > 0
+        GROUP BY year, semester
+        ORDER BY (year::int) DESC,
+                 CASE semester WHEN 'FALL' THEN 1 WHEN 'SPRING' THEN 2 WHEN 'SUMMER' THEN 3 ELSE 4 END
+        LIMIT 4
+    ),
+    last_4_semesters_gpa AS (
+        SELECT
+            gd.dept,
+            gd.course_number,
+            ROUND(
+                SUM(gd.gpa::numeric * gd.total_students) / NULLIF(SUM(gd.total_students), 0),
+                2
+            ) AS weighted_avg_gpa
+        FROM gpa_data gd
+        JOIN recent_semesters rs ON gd.year = rs.year AND gd.semester = rs.semester
+        WHERE gd.gpa IS NOT NULL AND gd.total_students > 0
+        GROUP BY gd.dept, gd.course_number
+    ),
+    current_term AS MATERIALIZED (
+        -- Most recent College Station term (term_code ending in 1)
+        SELECT MAX(term_code) AS term_code
+        FROM sections
+        WHERE term_code LIKE '%1'
+    ),
+    section_data AS (
+        SELECT
+            s.dept,
+            s.course_number,
+            COUNT(*) AS section_count
+        FROM sections s
+        JOIN current_term ct ON s.term_code = ct.term_code
+        GROUP BY s.dept, s.course_number
+    ),
+    enrollment_data AS (
+        SELECT
+            dept,
+            course_number,
+            SUM(total_students) AS total_enrollment
+        FROM gpa_data
+        WHERE year = (SELECT MAX(year) FROM gpa_data WHERE total_students > 0)
+          AND total_students > 0
+        GROUP BY dept, course_number
+    ),
+    course_reviews AS (
+        SELECT
+            r.dept_code,
+            r.course_num,
+            ROUND(AVG(p.avg_rating::numeric), 1) AS avg_professor_rating
+        FROM reviews r
+        JOIN professors p ON r.professor_id = p.id
+        WHERE p.avg_rating IS NOT NULL
+          AND r.dept_code IS NOT NULL
+          AND r.course_num IS NOT NULL
+        GROUP BY r.dept_code, r.course_num
+    )
+    SELECT
+        c.dept,
+        c.course_number,
+        l4s.weighted_avg_gpa,
+        ed.total_enrollment,
+        sd.section_count,
+        cr.avg_professor_rating
+    FROM (
+        SELECT DISTINCT subject_id AS dept, course_number FROM courses
+    ) c
+    LEFT JOIN last_4_semesters_gpa l4s ON c.dept = l4s.dept AND c.course_number = l4s.course_number
+    LEFT JOIN section_data sd ON c.dept = sd.dept AND c.course_number = sd.course_number
+    LEFT JOIN enrollment_data ed ON c.dept = ed.dept AND c.course_number = ed.course_number
+    LEFT JOIN course_reviews cr ON c.dept = cr.dept_code AND c.course_number = cr.course_num
+    """,
+    """
+    CREATE UNIQUE INDEX IF NOT EXISTS mv_course_aggregates_dept_course
+    ON mv_course_aggregates (dept, course_number)
+    """,
+)
+
+
+def create_materialized_views(conn: Any) -> None:
+    """Create materialized views backing the read-heavy API endpoints"""
+    statements = (
+        PROFESSOR_PROFILE_VIEW_DDL
+        + DEPARTMENT_STATS_VIEW_DDL
+        + COURSE_AGGREGATES_VIEW_DDL
+    )
+    for statement in statements:
+        conn.execute(text(statement))
+
+
+def refresh_professor_profile_view(session: SQLAlchemySession) -> None:
+    """Refresh mv_professor_profile without blocking concurrent readers"""
+    session.execute(text("REFRESH MATERIALIZED VIEW CONCURRENTLY mv_professor_profile"))
+    session.commit()
+
+
+def refresh_department_stats_views(session: SQLAlchemySession) -> None:
+    """Refresh the per-department stats views without blocking concurrent readers"""
+    for view in DEPARTMENT_STATS_VIEWS:
+        session.execute(text(f"REFRESH MATERIALIZED VIEW CONCURRENTLY {view}"))
+    session.commit()
+
+
+def refresh_course_aggregates_view(session: SQLAlchemySession) -> None:
+    """Refresh mv_course_aggregates without blocking concurrent readers"""
+    session.execute(text("REFRESH MATERIALIZED VIEW CONCURRENTLY mv_course_aggregates"))
+    session.commit()
+
+
+# Columns declared on the models after their tables were first created, as
+# (table, column, data type, DDL). create_all() never alters an existing
+# table, so each DDL runs while information_schema reports another type for
+# the column, or no column at all.
+COLUMN_MIGRATIONS: Tuple[Tuple[str, str, str, str], ...] = (
+    (
+        "reviews",
+        "overall_rating_cached",
+        "double precision",
+        """
+        ALTER TABLE reviews ADD COLUMN IF NOT EXISTS overall_rating_cached
+        DOUBLE PRECISION GENERATED ALWAYS AS
+        ((clarity_rating + (6 - difficulty_rating) + helpful_rating) / 3.0) STORED
+        """,
+    ),
+    (
+        "courses",
+        "course_code",
+        "character varying",
+        """
+        ALTER TABLE courses ADD COLUMN IF NOT EXISTS course_code
+        VARCHAR GENERATED ALWAYS AS (subject_id || course_number) STORED
+        """,
+    ),
+    (
+        "professor_summaries_new",
+        "dept",
+        "character varying",
+        """
+        ALTER TABLE professor_summaries_new ADD COLUMN IF NOT EXISTS dept
+        VARCHAR GENERATED ALWAYS AS (substring(course_code from '^[A-Z]+')) STORED
+        """,
+    ),
+    (
+        "professor_summaries_new",
+        "tag_frequencies",
+        "jsonb",
+        """
+        ALTER TABLE professor_summaries_new
+        ALTER COLUMN tag_frequencies TYPE jsonb USING tag_frequencies::jsonb
+        """,
+    ),
+    (
+        "reviews",
+        "dept_code",
+        "character varying",
+        """
+        ALTER TABLE reviews ADD COLUMN IF NOT EXISTS dept_code
+        VARCHAR GENERATED ALWAYS AS (substring(course_code from '^[A-Z]+')) STORED
+        """,
+    ),
+    (
+        "reviews",
+        "course_num",
+        "character varying",
+        """
+        ALTER TABLE reviews ADD COLUMN IF NOT EXISTS course_num
+        VARCHAR GENERATED ALWAYS AS (substring(course_code from '[0-9]+')) STORED
+        """,
+    ),
+)
+
+_COLUMN_TYPE_SQL = text("""
+    SELECT data_type
+    FROM information_schema.columns
+    WHERE table_name = :table_name
+      AND column_name = :column_name
+""")
+
 
 # Global engine instance for connection pooling
 _engine = None
 _session_factory = None
+_async_engine = None
+_async_session_factory = None
+
+# Per-connection prepared statement cache for the asyncpg engine
+ASYNC_PREPARED_STATEMENT_CACHE_SIZE = 256
+
+# Connection pool sizing, per engine. Every gunicorn worker process
+# (gunicorn.conf.py: workers = 4) has two engines: the async one behind the
+# endpoints, and the sync one that runs the startup migration and serves the
+# streamed responses, the users and discover routers, /health and /db-status.
+# Both pools are warm in every worker, so the worst case is
+#     workers x 2 engines x (DB_POOL_SIZE + DB_MAX_OVERFLOW)
+#     = 4 x 2 x (10 + 20) = 240 connections with the defaults,
+# with up to 4 x 2 x 10 = 80 held persistently. Keep the worst case under
+# Postgres max_connections, less what the ETL pipelines use, when raising
+# either value or the worker count.
+DB_POOL_SIZE = int(os.getenv("DB_POOL_SIZE", "10"))
+DB_MAX_OVERFLOW = int(os.getenv("DB_MAX_OVERFLOW", "20"))
+# Behind PgBouncer in transaction-pooling mode, set DB_USE_NULLPOOL=1 so each
+# session opens a fresh PgBouncer connection and PgBouncer does the pooling.
+DB_USE_NULLPOOL = os.getenv("DB_USE_NULLPOOL", "").lower() in ("1", "true", "yes")
+
+
+def _pool_kwargs() -> Dict[str, Any]:
+    """Pool arguments shared by the sync and async engines"""
+    if DB_USE_NULLPOOL:
+        return {"poolclass": NullPool}
+    return {
+        "pool_size": DB_POOL_SIZE,  # Number of persistent connections to maintain
+        "max_overflow": DB_MAX_OVERFLOW,  # Additional connections when pool is full
+        "pool_timeout": 10,  # Seconds to wait for connection from pool
+        "pool_recycle": 1800,  # Recycle connections after 30 minutes
+        "pool_pre_ping": True,  # Validate connections before use
+        "pool_use_lifo": True,  # Reuse the warmest connection; idle extras age out
+    }
+
+
+def _build_database_url(scheme: str = "postgresql") -> str:
+    """Build the database URL from the POSTGRES_* environment variables"""
+    return "{0}://{1}:{2}@{3}:{4}/{5}".format(
+        scheme,
+        os.getenv("POSTGRES_USER"),
+        os.getenv("POSTGRES_PASSWORD"),
+        os.getenv("POSTGRES_HOST"),
+        os.getenv("POSTGRES_PORT"),
+        os.getenv("POSTGRES_DATABASE"),
+    )
 
 
 def create_db_engine() -> Any:
@@ -501,13 +1021,7 @@ def create_db_engine() -> Any:
     if _engine is not None:
         return _engine
 
-    url = "postgresql://{0}:{1}@{2}:{3}/{4}".format(
-        os.getenv("POSTGRES_USER"),
-        os.getenv("POSTGRES_PASSWORD"),
-        os.getenv("POSTGRES_HOST"),
-        os.getenv("POSTGRES_PORT"),
-        os.getenv("POSTGRES_DATABASE"),
-    )
+    url = _build_database_url()
 
     # Log connection for debugging
     logger.info("Creating database engine with connection pooling")
@@ -516,11 +1030,7 @@ def create_db_engine() -> Any:
     _engine = create_engine(
         url,
         # Connection pool settings for better performance
-        pool_size=10,  # Number of persistent connections to maintain
-        max_overflow=20,  # Additional connections when pool is full
-        pool_timeout=30,  # Seconds to wait for connection from pool
-        pool_recycle=3600,  # Recycle connections after 1 hour
-        pool_pre_ping=True,  # Validate connections before use
+        **_pool_kwargs(),
         # Performance optimizations
         echo=False,  # Set to True for SQL query logging (debug only)
         future=True,  # Use SQLAlchemy 2.0 style
@@ -534,7 +1044,10 @@ def create_db_engine() -> Any:
     # Create tables if they don't exist
     Base.metadata.create_all(_engine)
 
-    logger.info("Database engine created with pool_size=10, max_overflow=20")
+    logger.info(
+        f"Database engine created with pool_size={DB_POOL_SIZE}, "
+        f"max_overflow={DB_MAX_OVERFLOW}, nullpool={DB_USE_NULLPOOL}"
+    )
     return _engine
 
 
@@ -562,6 +1075,106 @@ def get_session() -> Any:
     return SessionFactory()
 
 
+def migrate_database() -> None:
+    """Bring an existing database up to the models and create the views
+
+    Safe to run on every start: columns are only altered while they differ
+    from the models, and indexes and views are only created when missing.
+    Failures are raised so the caller stops instead of running against a
+    schema the code doesn't match.
+    """
+    engine = create_db_engine()
+    try:
+        with engine.begin() as conn:
+            # One process migrates at a time; the rest find it done
+            conn.execute(
+                text("SELECT pg_advisory_xact_lock(hashtext('aggiermp_migrate'))")
+            )
+            # Use a short lock timeout so we fail fast instead of hanging forever
+            conn.execute(text("SET LOCAL lock_timeout = '5s'"))
+            for table_name, column_name, data_type, ddl in COLUMN_MIGRATIONS:
+                current = conn.execute(
+                    _COLUMN_TYPE_SQL,
+                    {"table_name": table_name, "column_name": column_name},
+                ).scalar()
+                if current != data_type:
+                    logger.info(f"Migrating {table_name}.{column_name}...")
+                    conn.execute(text(ddl))
+            # create_all() only indexes the tables it creates
+            for table in Base.metadata.sorted_tables:
+                for index in table.indexes:
+                    index.create(conn, checkfirst=True)
+            create_materialized_views(conn)
+        logger.info("Database migration complete")
+    except Exception as e:
+        logger.error(f"Database migration failed: {str(e)}")
+        raise
+
+
+def create_async_db_engine() -> Any:
+    """Create asyncpg-backed engine for endpoints that await their queries"""
+    global _async_engine
+
+    if _async_engine is not None:
+        return _async_engine
+
+    # Schema is managed by migrate_database() on the sync engine.
+    # asyncpg already speaks the binary protocol and prepares statements per
+    # connection; size its statement cache to hold every hot statement shape.
+    # PgBouncer's transaction mode can't keep per-connection prepared
+    # statements, so the cache is off when pooling is left to it.
+    statement_cache_size = 0 if DB_USE_NULLPOOL else ASYNC_PREPARED_STATEMENT_CACHE_SIZE
+    _async_engine = create_async_engine(
+        _build_database_url("postgresql+asyncpg")
+        + f"?prepared_statement_cache_size={statement_cache_size}",
+        **_pool_kwargs(),
+        echo=False,
+        connect_args={
+            "server_settings": {"application_name": "aggiermp_api"},
+            "timeout": 10,
+            "statement_cache_size": statement_cache_size,
+        },
+    )
+
+    logger.info(
+        f"Async database engine created with pool_size={DB_POOL_SIZE}, "
+        f"max_overflow={DB_MAX_OVERFLOW}, nullpool={DB_USE_NULLPOOL}"
+    )
+    return _async_engine
+
+
+def get_async_session_factory() -> async_sessionmaker[AsyncSession]:
+    """Get async session factory with connection pooling"""
+    global _async_session_factory
+
+    if _async_session_factory is not None:
+        return _async_session_factory
+
+    _async_session_factory = async_sessionmaker(
+        bind=create_async_db_engine(),
+        autoflush=False,
+        expire_on_commit=False,
+    )
+
+    return _async_session_factory
+
+
+def get_async_session() -> AsyncSession:
+    """Get async database session from connection pool"""
+    AsyncSessionFactory = get_async_session_factory()
+    return AsyncSessionFactory()
+
+
+async def dispose_async_engine() -> None:
+    """Close all pooled async connections"""
+    global _async_engine, _async_session_factory
+
+    if _async_engine is not None:
+        await _async_engine.dispose()
+        _async_engine = None
+        _async_session_factory = None
+
+
 # Performance monitoring decorator
 def monitor_db_performance(func: Any) -> Any:
     """Decorator to monitor database query performance"""
@@ -570,17 +1183,17 @@ def monitor_db_performance(func: Any) -> Any:
 
     @functools.wraps(func)
     def wrapper(*args: Any, **kwargs: Any) -> Any:
-        start_time = time.time()
+        start_time = time.perf_counter()
         try:
             result = func(*args, **kwargs)
-            execution_time = time.time() - start_time
+            execution_time = time.perf_counter() - start_time
             if execution_time > 1.0:  # Log slow queries (>1 second)
                 logger.warning(f"Slow query in {func.__name__}: {execution_time:.2f}s")
             else:
                 logger.debug(f"Query {func.__name__}: {execution_time:.3f}s")
             return result
         except Exception as e:
-            execution_time = time.time() - start_time
+            execution_time = time.perf_counter() - start_time
             logger.error(
                 f"Query error in {func.__name__} after {execution_time:.3f}s: {str(e)}"
             )
@@ -589,9 +1202,24 @@ def monitor_db_performance(func: Any) -> Any:
     return wrapper
 
 
+def _pool_status(pool: Any) -> Dict[str, Any]:
+    """Connection counts for a pool (handle different pool types)"""
+    try:
+        return {
+            "pool_size": pool.size(),
+            "checked_in": pool.checkedin(),
+            "checked_out": pool.checkedout(),
+            "overflow": pool.overflow(),
+            "pool_type": str(type(pool).__name__),
+        }
+    except AttributeError:
+        # Fallback for different pool implementations
+        return {"pool_type": str(type(pool).__name__), "status": "active"}
+
+
 # Database health check function
 def check_database_health() -> Dict[str, Any]:
-    """Check database connection health and pool status"""
+    """Check database connection health and the sync and async pool status"""
     try:
         engine = create_db_engine()
 
@@ -600,22 +1228,18 @@ def check_database_health() -> Dict[str, Any]:
             result = conn.execute(text("SELECT 1"))
             result.fetchone()
 
-        # Get pool status (handle different pool types)
-        pool = engine.pool
-        try:
-            pool_status = {
-                "pool_size": pool.size(),
-                "checked_in": pool.checkedin(),
-                "checked_out": pool.checkedout(),
-                "overflow": pool.overflow(),
-                "pool_type": str(type(pool).__name__),
-            }
-        except AttributeError:
-            # Fallback for different pool implementations
-            pool_status = {"pool_type": str(type(pool).__name__), "status": "active"}
+        pool_status = _pool_status(engine.pool)
+        async_pool_status = _pool_status(create_async_db_engine().pool)
 
-        logger.info(f"Database health check passed. Pool status: {pool_status}")
-        return {"status": "healthy", "pool_status": pool_status}
+        logger.info(
+            f"Database health check passed. Pool status: {pool_status}, "
+            f"async pool status: {async_pool_status}"
+        )
+        return {
+            "status": "healthy",
+            "pool_status": pool_status,
+            "async_pool_status": async_pool_status,
+        }
 
     except Exception as e:
         logger.error(f"Database health check failed: {str(e)}")
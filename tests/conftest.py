@@ -147,3 +147,21 @@ def seed_data(db_session: Session) -> None:
 def client() -> Generator[TestClient, None, None]:
     with TestClient(app) as c:
         yield c
+
+
+class FakeClock:
+    """Stands in for the time module with a manually advanced monotonic()."""
+
+    def __init__(self) -> None:
+        self.now = 1000.0
+
+    def monotonic(self) -> float:
+        return self.now
+
+
+@pytest.fixture
+def clock(request: pytest.FixtureRequest, monkeypatch: pytest.MonkeyPatch) -> FakeClock:
+    """Swap in a FakeClock for `time` in the module given as the indirect param."""
+    fake = FakeClock()
+    monkeypatch.setattr(request.param, "time", fake)
+    return fake
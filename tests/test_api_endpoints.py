@@ -1,4 +1,10 @@
+import json
+from typing import Any, Dict, List
+
+import pytest
 from fastapi.testclient import TestClient
+from sqlalchemy import text
+from sqlalchemy.orm import Session
 
 
 def test_root_endpoint(client: TestClient) -> None:
@@ -25,6 +31,7 @@ def test_database_status(client: TestClient) -> None:
     data = response.json()
     assert "pool_status" in data
     assert "checked_in" in data["pool_status"]
+    assert "async_pool_status" in data
 
 
 def test_get_terms(client: TestClient) -> None:
@@ -115,3 +122,90 @@ def test_dept_discovery_endpoint(client: TestClient) -> None:
         assert "easinessScore" in course
         assert "professor" in course
         assert "firstName" in course["professor"]
+
+
+# Professors sharing a last name for the search pagination tests; the two
+# "Bea"s only differ by id, so the cursor has to break that tie too
+PAGETEST_PROFESSORS = [
+    ("PT1", "Ada"),
+    ("PT2", "Bea"),
+    ("PT3", "Bea"),
+    ("PT4", "Cy"),
+    ("PT5", "Di"),
+]
+
+
+@pytest.fixture(scope="module")
+def pagetest_professors(db_session: Session) -> List[str]:
+    """Seed the Pagetest professors and return their ids."""
+    db_session.execute(
+        text("""
+        INSERT INTO professors (id, first_name, last_name, avg_rating, num_ratings, university_id, created_at, updated_at)
+        VALUES (:id, :first_name, 'Pagetest', NULL, 0, '1', NOW(), NOW())
+        ON CONFLICT (id) DO NOTHING
+    """),
+        [{"id": pid, "first_name": first} for pid, first in PAGETEST_PROFESSORS],
+    )
+    db_session.commit()
+    return [pid for pid, _ in PAGETEST_PROFESSORS]
+
+
+def test_search_cursor_pages_match_skip_pages(
+    client: TestClient, pagetest_professors: List[str]
+) -> None:
+    """Walking next_cursor visits every match once, in skip-paging order."""
+    params: Dict[str, Any] = {"name": "Pagetest", "limit": 2}
+
+    cursor_ids: List[str] = []
+    cursor = None
+    for _ in range(len(pagetest_professors) + 1):
+        page_params = {**params, "cursor": cursor} if cursor else params
+        response = client.get("/professors/search", params=page_params)
+        assert response.status_code == 200
+        data = response.json()
+        cursor_ids.extend(p["id"] for p in data["professors"])
+        cursor = data["next_cursor"]
+        if cursor is None:
+            break
+    assert cursor is None
+
+    skip_ids: List[str] = []
+    for skip in range(0, len(pagetest_professors), 2):
+        response = client.get("/professors/search", params={**params, "skip": skip})
+        assert response.status_code == 200
+        skip_ids.extend(p["id"] for p in response.json()["professors"])
+
+    assert len(cursor_ids) == len(set(cursor_ids))
+    assert sorted(cursor_ids) == sorted(pagetest_professors)
+    assert cursor_ids == skip_ids
+
+
+def test_search_rejects_malformed_cursor(client: TestClient) -> None:
+    """A cursor that doesn't decode is a 400, not a 500."""
+    response = client.get("/professors/search", params={"cursor": "not-a-cursor"})
+    assert response.status_code == 400
+
+
+def test_search_streams_ndjson_on_request(
+    client: TestClient, pagetest_professors: List[str]
+) -> None:
+    """Accept: application/x-ndjson gets one professor per line, never the envelope."""
+    params: Dict[str, Any] = {"name": "Pagetest", "limit": 10}
+
+    # Served first so a cached JSON envelope would be there to leak
+    envelope = client.get("/professors/search", params=params)
+    assert envelope.status_code == 200
+
+    response = client.get(
+        "/professors/search",
+        params=params,
+        headers={"Accept": "application/x-ndjson"},
+    )
+    assert response.status_code == 200
+    assert response.headers["content-type"].startswith("application/x-ndjson")
+
+    rows = [json.loads(line) for line in response.text.splitlines()]
+    assert rows and all("professors" not in row for row in rows)
+    assert [row["id"] for row in rows] == [
+        p["id"] for p in envelope.json()["professors"]
+    ]
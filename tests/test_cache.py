@@ -0,0 +1,117 @@
+from __future__ import annotations
+
+import asyncio
+from typing import TYPE_CHECKING, Any, Dict, Tuple
+
+import pytest
+from fastapi import FastAPI, Request
+from fastapi.testclient import TestClient
+
+from aggiermp.core import cache
+from aggiermp.core.cache import local_cached
+
+if TYPE_CHECKING:
+    # Only for annotations; pytest loads conftest itself
+    from tests.conftest import FakeClock
+
+
+# Gives a test the shared `clock` fixture, patched into cache.time
+fake_clock = pytest.mark.parametrize("clock", [cache], ids=["cache"], indirect=True)
+
+
+def make_client(ttl: int = 60, maxsize: int = 64) -> Tuple[TestClient, Dict[str, int]]:
+    """Build an app with one locally cached endpoint; also return its call count."""
+    app = FastAPI()
+    calls = {"count": 0}
+
+    @app.get("/items/{item_id}")
+    @local_cached(ttl=ttl, maxsize=maxsize, max_age=30)
+    async def get_item(request: Request, item_id: str) -> Dict[str, Any]:
+        calls["count"] += 1
+        return {"id": item_id}
+
+    return TestClient(app), calls
+
+
+@fake_clock
+def test_repeat_requests_are_served_from_memory(clock: FakeClock) -> None:
+    """A second request within ttl returns the same body without a call."""
+    client, calls = make_client()
+
+    first = client.get("/items/a")
+    second = client.get("/items/a")
+
+    assert first.status_code == second.status_code == 200
+    assert first.json() == second.json() == {"id": "a"}
+    assert first.headers["Cache-Control"] == "public, max-age=30"
+    assert calls["count"] == 1
+
+
+@fake_clock
+def test_if_none_match_returns_304(clock: FakeClock) -> None:
+    """A matching If-None-Match gets an empty 304 carrying the same ETag."""
+    client, calls = make_client()
+
+    etag = client.get("/items/a").headers["ETag"]
+    assert etag.startswith('W/"')
+
+    response = client.get("/items/a", headers={"If-None-Match": etag})
+    assert response.status_code == 304
+    assert response.headers["ETag"] == etag
+    assert response.content == b""
+
+    stale = client.get("/items/a", headers={"If-None-Match": 'W/"stale"'})
+    assert stale.status_code == 200
+    assert stale.json() == {"id": "a"}
+    assert calls["count"] == 1
+
+
+@fake_clock
+def test_entries_expire_after_ttl(clock: FakeClock) -> None:
+    """Entries are recomputed once ttl seconds have passed."""
+    client, calls = make_client(ttl=60)
+
+    client.get("/items/a")
+    clock.now += 59
+    client.get("/items/a")
+    assert calls["count"] == 1
+
+    clock.now += 1
+    client.get("/items/a")
+    assert calls["count"] == 2
+
+
+@fake_clock
+def test_maxsize_evicts_oldest_entry(clock: FakeClock) -> None:
+    """A full store drops its oldest entry to make room."""
+    client, calls = make_client(maxsize=2)
+
+    for item_id in ("a", "b", "c"):
+        client.get(f"/items/{item_id}")
+    assert calls["count"] == 3
+
+    # "a" was evicted for "c"; "b" and "c" are still cached
+    client.get("/items/b")
+    client.get("/items/c")
+    assert calls["count"] == 3
+
+    client.get("/items/a")
+    assert calls["count"] == 4
+
+
+@fake_clock
+def test_invalidate_cache_drops_matching_local_entries(clock: FakeClock) -> None:
+    """Invalidation reaches this worker's memory, not just Redis."""
+    client, calls = make_client()
+
+    client.get("/items/a")
+    client.get("/items/b")
+    asyncio.run(cache.invalidate_cache("api:/items/a:*"))
+
+    client.get("/items/a")
+    client.get("/items/b")
+    assert calls["count"] == 3
+
+    asyncio.run(cache.clear_all_cache())
+    client.get("/items/b")
+    assert calls["count"] == 4
@@ -0,0 +1,126 @@
+from __future__ import annotations
+
+import inspect
+from typing import TYPE_CHECKING, Any, Callable, Dict, Tuple
+
+import pytest
+from fastapi import FastAPI, Request
+from fastapi.testclient import TestClient
+
+from aggiermp.core import rate_limit
+from aggiermp.core.rate_limit import TokenBucketLimiter, get_remote_address
+
+if TYPE_CHECKING:
+    # Only for annotations; pytest loads conftest itself
+    from tests.conftest import FakeClock
+
+
+# Gives a test the shared `clock` fixture, patched into rate_limit.time
+fake_clock = pytest.mark.parametrize(
+    "clock", [rate_limit], ids=["rate_limit"], indirect=True
+)
+
+
+def make_client(
+    rate: str, key_func: Callable[[Request], str] = get_remote_address
+) -> Tuple[TestClient, Dict[str, Any]]:
+    """Build an app with one limited endpoint; also return its bucket store."""
+    app = FastAPI()
+    limiter = TokenBucketLimiter(key_func=key_func)
+
+    @app.get("/limited")
+    @limiter.limit(rate)
+    async def limited(request: Request) -> Dict[str, bool]:
+        return {"ok": True}
+
+    buckets = inspect.getclosurevars(limited).nonlocals["buckets"]
+    return TestClient(app), buckets
+
+
+def client_header(request: Request) -> str:
+    """Key requests by an X-Client header so tests can act as several clients."""
+    return request.headers["x-client"]
+
+
+@fake_clock
+def test_allows_up_to_capacity_then_rejects(clock: FakeClock) -> None:
+    """A full bucket serves `capacity` requests, then returns 429."""
+    client, _ = make_client("3/minute")
+
+    for _ in range(3):
+        assert client.get("/limited").status_code == 200
+
+    response = client.get("/limited")
+    assert response.status_code == 429
+    assert response.json()["detail"] == "Rate limit exceeded: 3 per 1 minute"
+
+
+@fake_clock
+def test_bucket_refills_over_time(clock: FakeClock) -> None:
+    """Tokens come back at capacity/period, one request per refilled token."""
+    client, _ = make_client("2/minute")  # one token every 30 seconds
+
+    assert client.get("/limited").status_code == 200
+    assert client.get("/limited").status_code == 200
+    assert client.get("/limited").status_code == 429
+
+    clock.now += 29
+    assert client.get("/limited").status_code == 429
+
+    clock.now += 2
+    assert client.get("/limited").status_code == 200
+    assert client.get("/limited").status_code == 429
+
+
+@fake_clock
+def test_clients_have_separate_buckets(clock: FakeClock) -> None:
+    """One client's empty bucket doesn't limit another client."""
+    client, _ = make_client("1/minute", key_func=client_header)
+
+    assert client.get("/limited", headers={"X-Client": "a"}).status_code == 200
+    assert client.get("/limited", headers={"X-Client": "a"}).status_code == 429
+    assert client.get("/limited", headers={"X-Client": "b"}).status_code == 200
+
+
+@fake_clock
+@pytest.mark.parametrize(
+    ("rate", "retry_after"),
+    [("2/minute", "30"), ("10/hour", "360"), ("5/second", "1")],
+)
+def test_rejection_sets_retry_after(
+    clock: FakeClock, rate: str, retry_after: str
+) -> None:
+    """429 responses say how long until the next token."""
+    client, _ = make_client(rate)
+    capacity = int(rate.split("/")[0])
+
+    for _ in range(capacity):
+        client.get("/limited")
+
+    response = client.get("/limited")
+    assert response.status_code == 429
+    assert response.headers["Retry-After"] == retry_after
+
+
+@fake_clock
+def test_idle_buckets_are_evicted(clock: FakeClock) -> None:
+    """Buckets idle for a whole period are dropped; recent ones are kept."""
+    client, buckets = make_client("5/minute", key_func=client_header)
+
+    client.get("/limited", headers={"X-Client": "a"})
+    client.get("/limited", headers={"X-Client": "b"})
+    assert list(buckets) == ["a", "b"]
+
+    clock.now += 59
+    client.get("/limited", headers={"X-Client": "c"})
+    assert list(buckets) == ["a", "b", "c"]
+
+    clock.now += 1
+    client.get("/limited", headers={"X-Client": "d"})
+    assert list(buckets) == ["c", "d"]
+
+
+def test_unsupported_period_is_rejected() -> None:
+    """Limit strings with an unknown period fail at decoration time."""
+    with pytest.raises(ValueError):
+        TokenBucketLimiter().limit("10/fortnight")